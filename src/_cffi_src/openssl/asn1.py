@@ -35,6 +35,7 @@ typedef ... ASN1_ENUMERATED;
 typedef ... ASN1_NULL;
 
 static const int V_ASN1_GENERALIZEDTIME;
+static const int V_ASN1_NEG;
 
 static const int MBSTRING_UTF8;
 """
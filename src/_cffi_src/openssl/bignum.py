@@ -78,6 +78,10 @@ int BN_generate_prime_ex(BIGNUM *, int, int, const BIGNUM *,
                          const BIGNUM *, BN_GENCB *);
 int BN_is_prime_ex(const BIGNUM *, int, BN_CTX *, BN_GENCB *);
 const int BN_prime_checks_for_size(int);
+
+BN_GENCB *BN_GENCB_new(void);
+void BN_GENCB_free(BN_GENCB *);
+void BN_GENCB_set(BN_GENCB *, int (*)(int, int, BN_GENCB *), void *);
 """
 
 CUSTOMIZATIONS = """
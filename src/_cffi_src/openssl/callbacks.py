@@ -15,10 +15,16 @@ typedef struct {
     int error;
     int maxsize;
 } CRYPTOGRAPHY_PASSWORD_DATA;
+
+typedef struct {
+    int *cancelled;
+    long candidates;
+} CRYPTOGRAPHY_BN_GENCB_DATA;
 """
 
 FUNCTIONS = """
 int Cryptography_pem_password_cb(char *, int, int, void *);
+int Cryptography_bn_gencb(int, int, BN_GENCB *);
 """
 
 CUSTOMIZATIONS = """
@@ -48,4 +54,21 @@ int Cryptography_pem_password_cb(char *buf, int size,
         return 0;
     }
 }
+
+typedef struct {
+    int *cancelled;
+    long candidates;
+} CRYPTOGRAPHY_BN_GENCB_DATA;
+
+int Cryptography_bn_gencb(int stage, int count, BN_GENCB *cb) {
+    /* Called by OpenSSL during prime and parameter generation. Stage 0
+       means a new candidate prime was generated. Returning 0 makes the
+       generation fail, which is how a running search is stopped. */
+    CRYPTOGRAPHY_BN_GENCB_DATA *st =
+        (CRYPTOGRAPHY_BN_GENCB_DATA *)BN_GENCB_get_arg(cb);
+    if (stage == 0) {
+        st->candidates += 1;
+    }
+    return *st->cancelled == 0;
+}
 """
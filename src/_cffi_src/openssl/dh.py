@@ -8,6 +8,8 @@ INCLUDES = """
 """
 
 TYPES = """
+static const long Cryptography_HAS_DH_NEW_BY_NID;
+
 typedef ... DH;
 
 const long DH_NOT_SUITABLE_GENERATOR;
@@ -19,6 +21,7 @@ void DH_free(DH *);
 int DH_size(const DH *);
 int DH_generate_key(DH *);
 DH *DHparams_dup(DH *);
+DH *DH_new_by_nid(int);
 
 /* added in 1.1.0 when the DH struct was opaqued */
 void DH_get0_pqg(const DH *, const BIGNUM **, const BIGNUM **,
@@ -36,6 +39,13 @@ int Cryptography_i2d_DHxparams_bio(BIO *bp, DH *x);
 """
 
 CUSTOMIZATIONS = """
+#if CRYPTOGRAPHY_IS_LIBRESSL || CRYPTOGRAPHY_OPENSSL_LESS_THAN_111
+static const long Cryptography_HAS_DH_NEW_BY_NID = 0;
+DH *(*DH_new_by_nid)(int) = NULL;
+#else
+static const long Cryptography_HAS_DH_NEW_BY_NID = 1;
+#endif
+
 #if CRYPTOGRAPHY_IS_LIBRESSL
 #ifndef DH_CHECK_Q_NOT_PRIME
 #define DH_CHECK_Q_NOT_PRIME            0x10
@@ -19,6 +19,11 @@ static const int NID_X448;
 static const int NID_ED25519;
 static const int NID_ED448;
 static const int NID_poly1305;
+static const int NID_ffdhe2048;
+static const int NID_ffdhe3072;
+static const int NID_ffdhe4096;
+static const int NID_ffdhe6144;
+static const int NID_ffdhe8192;
 
 static const int NID_subject_alt_name;
 static const int NID_crl_reason;
@@ -48,4 +53,11 @@ static const int NID_poly1305 = 0;
 #else
 static const long Cryptography_HAS_POLY1305 = 1;
 #endif
+#ifndef NID_ffdhe2048
+static const int NID_ffdhe2048 = 0;
+static const int NID_ffdhe3072 = 0;
+static const int NID_ffdhe4096 = 0;
+static const int NID_ffdhe6144 = 0;
+static const int NID_ffdhe8192 = 0;
+#endif
 """
@@ -226,6 +226,12 @@ void sk_X509_EXTENSION_pop_free(X509_EXTENSIONS *, sk_X509_EXTENSION_freefunc);
 
 int sk_X509_REVOKED_num(Cryptography_STACK_OF_X509_REVOKED *);
 X509_REVOKED *sk_X509_REVOKED_value(Cryptography_STACK_OF_X509_REVOKED *, int);
+Cryptography_STACK_OF_X509_REVOKED *sk_X509_REVOKED_dup(
+    Cryptography_STACK_OF_X509_REVOKED *
+);
+void sk_X509_REVOKED_free(Cryptography_STACK_OF_X509_REVOKED *);
+void sk_X509_REVOKED_sort(Cryptography_STACK_OF_X509_REVOKED *);
+int sk_X509_REVOKED_find(Cryptography_STACK_OF_X509_REVOKED *, X509_REVOKED *);
 
 Cryptography_STACK_OF_X509_CRL *sk_X509_CRL_new_null(void);
 void sk_X509_CRL_free(Cryptography_STACK_OF_X509_CRL *);
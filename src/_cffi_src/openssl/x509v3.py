@@ -50,6 +50,9 @@ static const int GEN_EDIPARTY;
 static const int GEN_IPADD;
 static const int GEN_RID;
 
+static const int X509_PURPOSE_SSL_CLIENT;
+static const int X509_PURPOSE_SSL_SERVER;
+
 typedef struct {
     ASN1_OBJECT *type_id;
     ASN1_TYPE *value;
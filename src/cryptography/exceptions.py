@@ -55,3 +55,7 @@ class InternalError(Exception):
 
 class InvalidKey(Exception):
     pass
+
+
+class Cancelled(Exception):
+    pass
@@ -6,7 +6,15 @@ import typing
 
 
 class ObjectIdentifier(object):
-    def __init__(self, dotted_string: str) -> None:
+    _dotted_string: str
+
+    def __new__(cls, dotted_string: str) -> "ObjectIdentifier":
+        if cls is ObjectIdentifier:
+            oid = _INTERNED_OIDS.get(dotted_string)
+            if oid is not None:
+                return oid
+
+        self = super(ObjectIdentifier, cls).__new__(cls)
         self._dotted_string = dotted_string
 
         nodes = self._dotted_string.split(".")
@@ -48,7 +56,20 @@ class ObjectIdentifier(object):
                 % (self._dotted_string)
             )
 
+        return self
+
+    def __init__(self, dotted_string: str) -> None:
+        # Everything is set up in __new__. This is kept so that subclasses
+        # can still call super().__init__(dotted_string).
+        pass
+
+    def __reduce__(self) -> typing.Tuple[typing.Any, ...]:
+        return (type(self), (self._dotted_string,))
+
     def __eq__(self, other: typing.Any) -> bool:
+        if self is other:
+            return True
+
         if not isinstance(other, ObjectIdentifier):
             return NotImplemented
 
@@ -75,3 +96,13 @@ class ObjectIdentifier(object):
     @property
     def dotted_string(self) -> str:
         return self._dotted_string
+
+
+# Only the well-known OIDs registered with _intern_oids() are interned, so
+# parsing untrusted data can't grow the table.
+_INTERNED_OIDS: typing.Dict[str, ObjectIdentifier] = {}
+
+
+def _intern_oids(oids: typing.Iterable[ObjectIdentifier]) -> None:
+    for oid in oids:
+        _INTERNED_OIDS.setdefault(oid.dotted_string, oid)
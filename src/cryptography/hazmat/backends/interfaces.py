@@ -107,7 +107,15 @@ class PBKDF2HMACBackend(metaclass=abc.ABCMeta):
 
 class RSABackend(metaclass=abc.ABCMeta):
     @abc.abstractmethod
-    def generate_rsa_private_key(self, public_exponent, key_size):
+    def generate_rsa_private_key(
+        self,
+        public_exponent,
+        key_size,
+        *,
+        workers=1,
+        progress=None,
+        cancel=None,
+    ):
         """
         Generate an RSAPrivateKey instance with public_exponent and a modulus
         of key_size bits.
@@ -127,7 +135,9 @@ class RSABackend(metaclass=abc.ABCMeta):
         """
 
     @abc.abstractmethod
-    def load_rsa_private_numbers(self, numbers):
+    def load_rsa_private_numbers(
+        self, numbers, unsafe_skip_rsa_key_validation=False
+    ):
         """
         Returns an RSAPrivateKey provider.
         """
@@ -141,7 +151,9 @@ class RSABackend(metaclass=abc.ABCMeta):
 
 class DSABackend(metaclass=abc.ABCMeta):
     @abc.abstractmethod
-    def generate_dsa_parameters(self, key_size):
+    def generate_dsa_parameters(
+        self, key_size, *, workers=1, progress=None, cancel=None
+    ):
         """
         Generate a DSAParameters instance with a modulus of key_size bits.
         """
@@ -239,7 +251,9 @@ class EllipticCurveBackend(metaclass=abc.ABCMeta):
 
 class PEMSerializationBackend(metaclass=abc.ABCMeta):
     @abc.abstractmethod
-    def load_pem_private_key(self, data, password):
+    def load_pem_private_key(
+        self, data, password, unsafe_skip_rsa_key_validation=False
+    ):
         """
         Loads a private key from PEM encoded data, using the provided password
         if the data is encrypted.
@@ -260,7 +274,9 @@ class PEMSerializationBackend(metaclass=abc.ABCMeta):
 
 class DERSerializationBackend(metaclass=abc.ABCMeta):
     @abc.abstractmethod
-    def load_der_private_key(self, data, password):
+    def load_der_private_key(
+        self, data, password, unsafe_skip_rsa_key_validation=False
+    ):
         """
         Loads a private key from DER encoded data. Uses the provided password
         if the data is encrypted.
@@ -341,22 +357,12 @@ class X509Backend(metaclass=abc.ABCMeta):
         Compute the DER encoded bytes of an X509 Name object.
         """
 
-    @abc.abstractmethod
-    def load_pem_x509_crl(self, data: bytes) -> "CertificateRevocationList":
-        """
-        Load an X.509 CRL from PEM encoded data.
-        """
-
-    @abc.abstractmethod
-    def load_der_x509_crl(self, data: bytes) -> "CertificateRevocationList":
-        """
-        Load an X.509 CRL from DER encoded data.
-        """
-
 
 class DHBackend(metaclass=abc.ABCMeta):
     @abc.abstractmethod
-    def generate_dh_parameters(self, generator, key_size):
+    def generate_dh_parameters(
+        self, generator, key_size, *, workers=1, progress=None, cancel=None
+    ):
         """
         Generate a DHParameters instance with a modulus of key_size bits.
         Using the given generator. Often 2 or 5.
@@ -5,13 +5,21 @@
 
 import collections
 import contextlib
+import datetime
+import io
 import itertools
+import tempfile
+import threading
 import typing
 import warnings
 from contextlib import contextmanager
 
 from cryptography import utils, x509
-from cryptography.exceptions import UnsupportedAlgorithm, _Reasons
+from cryptography.exceptions import (
+    Cancelled,
+    UnsupportedAlgorithm,
+    _Reasons,
+)
 from cryptography.hazmat.backends.interfaces import Backend as BackendInterface
 from cryptography.hazmat.backends.openssl import aead
 from cryptography.hazmat.backends.openssl.ciphers import _CipherContext
@@ -19,6 +27,8 @@ from cryptography.hazmat.backends.openssl.cmac import _CMACContext
 from cryptography.hazmat.backends.openssl.decode_asn1 import (
     _CRL_ENTRY_REASON_ENUM_TO_CODE,
     _X509ExtensionParser,
+    _asn1_string_to_bytes,
+    _split_der,
 )
 from cryptography.hazmat.backends.openssl.dh import (
     _DHParameters,
@@ -50,9 +60,15 @@ from cryptography.hazmat.backends.openssl.encode_asn1 import (
     _EXTENSION_ENCODE_HANDLERS,
     _OCSP_BASICRESP_EXTENSION_ENCODE_HANDLERS,
     _OCSP_REQUEST_EXTENSION_ENCODE_HANDLERS,
+    _der_header,
+    _der_object_identifier,
+    _der_revoked_certificate,
+    _der_time,
+    _der_tlv,
     _encode_asn1_int_gc,
     _encode_asn1_str_gc,
     _encode_name_gc,
+    _encode_revoked_certificate_der,
     _txt2obj_gc,
 )
 from cryptography.hazmat.backends.openssl.hashes import _HashContext
@@ -75,9 +91,9 @@ from cryptography.hazmat.backends.openssl.x448 import (
     _X448PublicKey,
 )
 from cryptography.hazmat.backends.openssl.x509 import (
-    _CertificateRevocationList,
     _CertificateSigningRequest,
     _RevokedCertificate,
+    _X509Store,
 )
 from cryptography.hazmat.bindings._rust import (
     asn1,
@@ -100,7 +116,11 @@ from cryptography.hazmat.primitives.asymmetric.padding import (
     PKCS1v15,
     PSS,
 )
-from cryptography.hazmat.primitives.asymmetric.types import PRIVATE_KEY_TYPES
+from cryptography.hazmat.primitives.asymmetric.types import (
+    PRIVATE_KEY_TYPES,
+    PUBLIC_KEY_TYPES,
+)
+from cryptography.hazmat.primitives.asymmetric.utils import Prehashed
 from cryptography.hazmat.primitives.ciphers.algorithms import (
     AES,
     ARC4,
@@ -127,10 +147,41 @@ from cryptography.hazmat.primitives.kdf import scrypt
 from cryptography.hazmat.primitives.serialization import pkcs7, ssh
 from cryptography.x509 import ocsp
 from cryptography.x509.name import Name
+from cryptography.x509.oid import SignatureAlgorithmOID
 
 
 _MemoryBIO = collections.namedtuple("_MemoryBIO", ["bio", "char_ptr"])
 
+# How often, in seconds, a parameter generation running on worker threads
+# checks for cancellation and reports progress.
+_GENCB_POLL_INTERVAL = 0.1
+
+# Streamed CRL entries are kept in memory up to this size, and on disk after.
+_CRL_SPOOL_SIZE = 16 * 1024 * 1024
+_CRL_CHUNK_SIZE = 64 * 1024
+
+# The signature algorithms of CRLs written incrementally, by hash name.
+_CRL_RSA_SIGNATURE_OIDS = {
+    "md5": SignatureAlgorithmOID.RSA_WITH_MD5,
+    "sha1": SignatureAlgorithmOID.RSA_WITH_SHA1,
+    "sha224": SignatureAlgorithmOID.RSA_WITH_SHA224,
+    "sha256": SignatureAlgorithmOID.RSA_WITH_SHA256,
+    "sha384": SignatureAlgorithmOID.RSA_WITH_SHA384,
+    "sha512": SignatureAlgorithmOID.RSA_WITH_SHA512,
+}
+_CRL_ECDSA_SIGNATURE_OIDS = {
+    "sha1": SignatureAlgorithmOID.ECDSA_WITH_SHA1,
+    "sha224": SignatureAlgorithmOID.ECDSA_WITH_SHA224,
+    "sha256": SignatureAlgorithmOID.ECDSA_WITH_SHA256,
+    "sha384": SignatureAlgorithmOID.ECDSA_WITH_SHA384,
+    "sha512": SignatureAlgorithmOID.ECDSA_WITH_SHA512,
+}
+_CRL_DSA_SIGNATURE_OIDS = {
+    "sha1": SignatureAlgorithmOID.DSA_WITH_SHA1,
+    "sha224": SignatureAlgorithmOID.DSA_WITH_SHA224,
+    "sha256": SignatureAlgorithmOID.DSA_WITH_SHA256,
+}
+
 
 # Not actually supported, just used as a marker for some serialization tests.
 class _RC2(object):
@@ -195,6 +246,9 @@ class Backend(BackendInterface):
             )
         else:
             self.activate_osrandom_engine()
+        # (p, g, q) of the RFC 7919 groups loaded so far. These are known
+        # to be safe, so DH_check is skipped for keys that use them.
+        self._dh_named_group_numbers = set()
         self._dh_types = [self._lib.EVP_PKEY_DH]
         if self._lib.Cryptography_HAS_EVP_PKEY_DHX:
             self._dh_types.append(self._lib.EVP_PKEY_DHX)
@@ -394,12 +448,6 @@ class Backend(BackendInterface):
             get_ext=self._lib.X509_REVOKED_get_ext,
             rust_callback=rust_x509.parse_crl_entry_ext,
         )
-        self._crl_extension_parser = _X509ExtensionParser(
-            self,
-            ext_count=self._lib.X509_CRL_get_ext_count,
-            get_ext=self._lib.X509_CRL_get_ext,
-            rust_callback=rust_x509.parse_crl_extension,
-        )
         self._ocsp_basicresp_ext_parser = _X509ExtensionParser(
             self,
             ext_count=self._lib.OCSP_BASICRESP_get_ext_count,
@@ -491,23 +539,128 @@ class Backend(BackendInterface):
         self.openssl_assert(bn_ptr != self._ffi.NULL)
         return bn_ptr
 
-    def generate_rsa_private_key(self, public_exponent, key_size):
+    def generate_rsa_private_key(
+        self,
+        public_exponent,
+        key_size,
+        *,
+        workers=1,
+        progress=None,
+        cancel=None,
+    ):
         rsa._verify_rsa_parameters(public_exponent, key_size)
 
-        rsa_cdata = self._lib.RSA_new()
-        self.openssl_assert(rsa_cdata != self._ffi.NULL)
-        rsa_cdata = self._ffi.gc(rsa_cdata, self._lib.RSA_free)
-
         bn = self._int_to_bn(public_exponent)
         bn = self._ffi.gc(bn, self._lib.BN_free)
 
-        res = self._lib.RSA_generate_key_ex(
-            rsa_cdata, key_size, bn, self._ffi.NULL
+        def generate(gencb):
+            rsa_cdata = self._lib.RSA_new()
+            self.openssl_assert(rsa_cdata != self._ffi.NULL)
+            rsa_cdata = self._ffi.gc(rsa_cdata, self._lib.RSA_free)
+            res = self._lib.RSA_generate_key_ex(rsa_cdata, key_size, bn, gencb)
+            return rsa_cdata if res == 1 else None
+
+        rsa_cdata = self._generate_with_gencb(
+            generate, workers, progress, cancel
         )
-        self.openssl_assert(res == 1)
         evp_pkey = self._rsa_cdata_to_evp_pkey(rsa_cdata)
 
-        return _RSAPrivateKey(self, rsa_cdata, evp_pkey)
+        # A key we just generated does not need to be checked again.
+        return _RSAPrivateKey(
+            self, rsa_cdata, evp_pkey, unsafe_skip_rsa_key_validation=True
+        )
+
+    def _generate_with_gencb(self, generate, workers, progress, cancel):
+        """
+        Runs ``generate`` and returns its result. ``generate`` is passed a
+        ``BN_GENCB *`` and returns a cdata, or None if generation failed.
+
+        With more than one worker, that many independent searches race on
+        their own threads and the first result wins. cffi releases the GIL
+        for the duration of each OpenSSL call, so the searches run in
+        parallel. Every search checks a shared flag from its BN_GENCB
+        callback, which lets the losers, and the whole generation on
+        cancellation, stop early.
+        """
+        if not isinstance(workers, int) or workers < 1:
+            raise ValueError("workers must be a positive integer.")
+
+        if workers == 1 and progress is None and cancel is None:
+            result = generate(self._ffi.NULL)
+            self.openssl_assert(result is not None)
+            return result
+
+        cancelled = self._ffi.new("int *")
+        lock = threading.Lock()
+        finished = threading.Event()
+        results = []
+        errors = []
+        remaining = [workers]
+
+        def run(data):
+            gencb = self._lib.BN_GENCB_new()
+            try:
+                self.openssl_assert(gencb != self._ffi.NULL)
+                self._lib.BN_GENCB_set(
+                    gencb,
+                    self._ffi.addressof(
+                        self._lib._original_lib, "Cryptography_bn_gencb"
+                    ),
+                    data,
+                )
+                result = generate(gencb)
+                if result is None:
+                    # Losing searches fail once the flag is set. Anything
+                    # else is an error. OpenSSL's error queue is per thread,
+                    # so it has to be checked or cleared here.
+                    self.openssl_assert(cancelled[0] != 0)
+                    self._consume_errors()
+                else:
+                    results.append(result)
+            except Exception as e:
+                errors.append(e)
+            finally:
+                self._lib.BN_GENCB_free(gencb)
+                with lock:
+                    remaining[0] -= 1
+                    if results or errors or not remaining[0]:
+                        cancelled[0] = 1
+                        finished.set()
+
+        if cancel is not None and cancel.is_set():
+            raise Cancelled("Generation was cancelled.")
+
+        datas = []
+        threads = []
+        try:
+            for _ in range(workers):
+                data = self._ffi.new("CRYPTOGRAPHY_BN_GENCB_DATA *")
+                data.cancelled = cancelled
+                datas.append(data)
+                thread = threading.Thread(target=run, args=(data,))
+                thread.start()
+                threads.append(thread)
+
+            # progress is called before cancel is checked, so a callback
+            # that sets cancel stops the generation straight away.
+            while True:
+                if progress is not None:
+                    progress(sum(data.candidates for data in datas))
+
+                if cancel is not None and cancel.is_set():
+                    raise Cancelled("Generation was cancelled.")
+
+                if finished.wait(_GENCB_POLL_INTERVAL):
+                    break
+        finally:
+            cancelled[0] = 1
+            for thread in threads:
+                thread.join()
+
+        if results:
+            return results[0]
+
+        raise errors[0]
 
     def generate_rsa_parameters_supported(self, public_exponent, key_size):
         return (
@@ -516,7 +669,9 @@ class Backend(BackendInterface):
             and key_size >= 512
         )
 
-    def load_rsa_private_numbers(self, numbers):
+    def load_rsa_private_numbers(
+        self, numbers, unsafe_skip_rsa_key_validation=False
+    ):
         rsa._check_private_key_components(
             numbers.p,
             numbers.q,
@@ -546,7 +701,12 @@ class Backend(BackendInterface):
         self.openssl_assert(res == 1)
         evp_pkey = self._rsa_cdata_to_evp_pkey(rsa_cdata)
 
-        return _RSAPrivateKey(self, rsa_cdata, evp_pkey)
+        return _RSAPrivateKey(
+            self,
+            rsa_cdata,
+            evp_pkey,
+            unsafe_skip_rsa_key_validation=unsafe_skip_rsa_key_validation,
+        )
 
     def load_rsa_public_numbers(self, numbers):
         rsa._check_public_key_components(numbers.e, numbers.n)
@@ -608,7 +768,9 @@ class Backend(BackendInterface):
         bio_data = self._ffi.buffer(buf[0], buf_len)[:]
         return bio_data
 
-    def _evp_pkey_to_private_key(self, evp_pkey):
+    def _evp_pkey_to_private_key(
+        self, evp_pkey, unsafe_skip_rsa_key_validation=False
+    ):
         """
         Return the appropriate type of PrivateKey given an evp_pkey cdata
         pointer.
@@ -620,7 +782,12 @@ class Backend(BackendInterface):
             rsa_cdata = self._lib.EVP_PKEY_get1_RSA(evp_pkey)
             self.openssl_assert(rsa_cdata != self._ffi.NULL)
             rsa_cdata = self._ffi.gc(rsa_cdata, self._lib.RSA_free)
-            return _RSAPrivateKey(self, rsa_cdata, evp_pkey)
+            return _RSAPrivateKey(
+                self,
+                rsa_cdata,
+                evp_pkey,
+                unsafe_skip_rsa_key_validation=unsafe_skip_rsa_key_validation,
+            )
         elif key_type == self._lib.EVP_PKEY_DSA:
             dsa_cdata = self._lib.EVP_PKEY_get1_DSA(evp_pkey)
             self.openssl_assert(dsa_cdata != self._ffi.NULL)
@@ -726,28 +893,30 @@ class Backend(BackendInterface):
         else:
             return False
 
-    def generate_dsa_parameters(self, key_size):
+    def generate_dsa_parameters(
+        self, key_size, *, workers=1, progress=None, cancel=None
+    ):
         if key_size not in (1024, 2048, 3072, 4096):
             raise ValueError(
                 "Key size must be 1024, 2048, 3072, or 4096 bits."
             )
 
-        ctx = self._lib.DSA_new()
-        self.openssl_assert(ctx != self._ffi.NULL)
-        ctx = self._ffi.gc(ctx, self._lib.DSA_free)
-
-        res = self._lib.DSA_generate_parameters_ex(
-            ctx,
-            key_size,
-            self._ffi.NULL,
-            0,
-            self._ffi.NULL,
-            self._ffi.NULL,
-            self._ffi.NULL,
-        )
-
-        self.openssl_assert(res == 1)
+        def generate(gencb):
+            ctx = self._lib.DSA_new()
+            self.openssl_assert(ctx != self._ffi.NULL)
+            ctx = self._ffi.gc(ctx, self._lib.DSA_free)
+            res = self._lib.DSA_generate_parameters_ex(
+                ctx,
+                key_size,
+                self._ffi.NULL,
+                0,
+                self._ffi.NULL,
+                self._ffi.NULL,
+                gencb,
+            )
+            return ctx if res == 1 else None
 
+        ctx = self._generate_with_gencb(generate, workers, progress, cancel)
         return _DSAParameters(self, ctx)
 
     def generate_dsa_private_key(self, parameters):
@@ -1051,7 +1220,7 @@ class Backend(BackendInterface):
         builder: x509.CertificateRevocationListBuilder,
         private_key: PRIVATE_KEY_TYPES,
         algorithm: typing.Optional[hashes.HashAlgorithm],
-    ) -> _CertificateRevocationList:
+    ) -> x509.CertificateRevocationList:
         if not isinstance(builder, x509.CertificateRevocationListBuilder):
             raise TypeError("Builder type mismatch.")
         self._x509_check_signature_params(private_key, algorithm)
@@ -1093,11 +1262,19 @@ class Backend(BackendInterface):
 
         # add revoked certificates
         for revoked_cert in builder._revoked_certificates:
+            if not isinstance(revoked_cert, _RevokedCertificate):
+                # Entries taken from a loaded CRL are views of its DER, so
+                # they are rebuilt from their fields.
+                revoked_cert = self.create_x509_revoked_certificate(
+                    x509.RevokedCertificateBuilder(
+                        revoked_cert.serial_number,
+                        revoked_cert.revocation_date,
+                        list(revoked_cert.extensions),
+                    )
+                )
             # Duplicating because the X509_CRL takes ownership and will free
             # this memory when X509_CRL_free is called.
-            revoked = self._lib.X509_REVOKED_dup(
-                revoked_cert._x509_revoked  # type: ignore[attr-defined]
-            )
+            revoked = self._lib.X509_REVOKED_dup(revoked_cert._x509_revoked)
             self.openssl_assert(revoked != self._ffi.NULL)
             res = self._lib.X509_CRL_add0_revoked(x509_crl, revoked)
             self.openssl_assert(res == 1)
@@ -1109,7 +1286,233 @@ class Backend(BackendInterface):
             errors = self._consume_errors_with_text()
             raise ValueError("Signing failed", errors)
 
-        return _CertificateRevocationList(self, x509_crl)
+        bio = self._create_mem_bio_gc()
+        res = self._lib.i2d_X509_CRL_bio(bio, x509_crl)
+        self.openssl_assert(res == 1)
+        return rust_x509.load_der_x509_crl(self._read_mem_bio(bio))
+
+    def create_x509_crl_file(
+        self,
+        builder: x509.CertificateRevocationListBuilder,
+        private_key: PRIVATE_KEY_TYPES,
+        algorithm: typing.Optional[hashes.HashAlgorithm],
+        revoked_certificates: typing.Iterable[
+            typing.Tuple[
+                int, datetime.datetime, typing.Optional[x509.ReasonFlags]
+            ]
+        ],
+        fileobj: typing.BinaryIO,
+    ) -> None:
+        self._check_x509_crl_write_params(private_key, algorithm)
+        self._write_x509_crl(
+            builder, private_key, algorithm, b"", revoked_certificates, fileobj
+        )
+
+    def create_x509_crl_incremental(
+        self,
+        builder: x509.CertificateRevocationListBuilder,
+        private_key: PRIVATE_KEY_TYPES,
+        algorithm: typing.Optional[hashes.HashAlgorithm],
+        base_crl: x509.CertificateRevocationList,
+    ) -> x509.CertificateRevocationList:
+        self._check_x509_crl_write_params(private_key, algorithm)
+        for revoked_cert in builder._revoked_certificates:
+            serial_number = revoked_cert.serial_number
+            if (
+                base_crl.get_revoked_certificate_by_serial_number(
+                    serial_number
+                )
+                is not None
+            ):
+                raise ValueError(
+                    "Serial number {} is already revoked by the base "
+                    "CRL".format(serial_number)
+                )
+
+        # The entries are sliced from the original encoding of the base CRL
+        # rather than from tbs_certlist_bytes, which is re-encoded.
+        ((_, _, crl),) = _split_der(
+            base_crl.public_bytes(serialization.Encoding.DER)
+        )
+        (_, _, tbs), _, _ = _split_der(crl)
+        tbs_elements = _split_der(tbs)
+        tags = [tag for tag, _, _ in tbs_elements]
+        # Skip the optional version, signature, issuer, thisUpdate and the
+        # optional nextUpdate to reach the optional revokedCertificates.
+        index = 4 if tags[0] == 0x02 else 3
+        if index < len(tags) and tags[index] in (0x17, 0x18):
+            index += 1
+        base_revoked = b""
+        if index < len(tags) and tags[index] == 0x30:
+            base_revoked = tbs_elements[index][2]
+
+        bio = io.BytesIO()
+        self._write_x509_crl(
+            builder, private_key, algorithm, base_revoked, (), bio
+        )
+        return rust_x509.load_der_x509_crl(bio.getvalue())
+
+    def _check_x509_crl_write_params(self, private_key, algorithm):
+        self._x509_check_signature_params(private_key, algorithm)
+        if isinstance(
+            private_key, (ed25519.Ed25519PrivateKey, ed448.Ed448PrivateKey)
+        ):
+            # EdDSA signs the message itself rather than a digest, so the
+            # whole TBSCertList would have to be held in memory.
+            raise TypeError(
+                "Ed25519 and Ed448 keys can't sign a CRL that is written "
+                "incrementally. Use sign() instead."
+            )
+
+    def _x509_crl_signature_algorithm(self, private_key, algorithm) -> bytes:
+        if isinstance(private_key, rsa.RSAPrivateKey):
+            # The parameters of RSA signature algorithms are NULL.
+            oids, parameters = _CRL_RSA_SIGNATURE_OIDS, b"\x05\x00"
+        elif isinstance(private_key, ec.EllipticCurvePrivateKey):
+            oids, parameters = _CRL_ECDSA_SIGNATURE_OIDS, b""
+        else:
+            assert isinstance(private_key, dsa.DSAPrivateKey)
+            oids, parameters = _CRL_DSA_SIGNATURE_OIDS, b""
+
+        oid = oids.get(algorithm.name)
+        if oid is None:
+            raise UnsupportedAlgorithm(
+                "{} is not supported for signing a CRL that is written "
+                "incrementally.".format(algorithm.name),
+                _Reasons.UNSUPPORTED_HASH,
+            )
+        return _der_tlv(0x30, _der_object_identifier(oid) + parameters)
+
+    def _x509_extensions_der(self, extensions, handlers) -> bytes:
+        # Each Extension is assembled around the value OpenSSL encodes.
+        encoded = []
+        for extension in extensions:
+            x509_extension = self._create_x509_extension(handlers, extension)
+            self.openssl_assert(x509_extension != self._ffi.NULL)
+            x509_extension = self._ffi.gc(
+                x509_extension, self._lib.X509_EXTENSION_free
+            )
+            value = _asn1_string_to_bytes(
+                self, self._lib.X509_EXTENSION_get_data(x509_extension)
+            )
+            contents = _der_object_identifier(extension.oid)
+            if extension.critical:
+                contents += b"\x01\x01\xff"
+            contents += _der_tlv(0x04, value)
+            encoded.append(_der_tlv(0x30, contents))
+        return b"".join(encoded)
+
+    def _write_x509_crl(
+        self,
+        builder: x509.CertificateRevocationListBuilder,
+        private_key: PRIVATE_KEY_TYPES,
+        algorithm: typing.Optional[hashes.HashAlgorithm],
+        base_revoked: bytes,
+        revoked_certificates: typing.Iterable[
+            typing.Tuple[
+                int, datetime.datetime, typing.Optional[x509.ReasonFlags]
+            ]
+        ],
+        fileobj: typing.BinaryIO,
+    ) -> None:
+        # The TBSCertList is encoded here rather than taken from a CRL signed
+        # by OpenSSL, so the private key is only used once. The encoded
+        # entries in base_revoked are copied ahead of those added to the
+        # builder and the streamed entries.
+        signature_algorithm = self._x509_crl_signature_algorithm(
+            private_key, algorithm
+        )
+        # version (v2), signature, issuer, thisUpdate and nextUpdate.
+        head = (
+            _der_tlv(0x02, b"\x01")
+            + signature_algorithm
+            + self.x509_name_bytes(builder._issuer_name)
+            + _der_time(builder._last_update)
+            + _der_time(builder._next_update)
+        )
+        crl_extensions = b""
+        if builder._extensions:
+            crl_extensions = _der_tlv(
+                0xA0,
+                _der_tlv(
+                    0x30,
+                    self._x509_extensions_der(
+                        builder._extensions,
+                        self._crl_extension_encode_handlers,
+                    ),
+                ),
+            )
+
+        with tempfile.SpooledTemporaryFile(_CRL_SPOOL_SIZE) as revoked:
+            revoked.write(base_revoked)
+            for revoked_cert in builder._revoked_certificates:
+                revoked.write(
+                    _der_revoked_certificate(
+                        revoked_cert.serial_number,
+                        revoked_cert.revocation_date,
+                        self._x509_extensions_der(
+                            revoked_cert.extensions,
+                            self._crl_entry_extension_encode_handlers,
+                        ),
+                    )
+                )
+            for serial_number, revocation_date, reason in revoked_certificates:
+                revoked.write(
+                    _encode_revoked_certificate_der(
+                        serial_number, revocation_date, reason
+                    )
+                )
+            revoked_length = revoked.tell()
+
+            tbs_length = len(head) + len(crl_extensions)
+            if revoked_length:
+                revoked_header = _der_header(0x30, revoked_length)
+                tbs_length += len(revoked_header) + revoked_length
+            tbs_header = _der_header(0x30, tbs_length)
+
+            def tbs_chunks():
+                yield tbs_header
+                yield head
+                if revoked_length:
+                    yield revoked_header
+                    revoked.seek(0)
+                    for chunk in iter(
+                        lambda: revoked.read(_CRL_CHUNK_SIZE), b""
+                    ):
+                        yield chunk
+                yield crl_extensions
+
+            assert algorithm is not None
+            h = hashes.Hash(algorithm, self)
+            for chunk in tbs_chunks():
+                h.update(chunk)
+            digest = h.finalize()
+            if isinstance(private_key, rsa.RSAPrivateKey):
+                signature = private_key.sign(
+                    digest, PKCS1v15(), Prehashed(algorithm)
+                )
+            elif isinstance(private_key, ec.EllipticCurvePrivateKey):
+                signature = private_key.sign(
+                    digest, ec.ECDSA(Prehashed(algorithm))
+                )
+            else:
+                assert isinstance(private_key, dsa.DSAPrivateKey)
+                signature = private_key.sign(digest, Prehashed(algorithm))
+
+            signature_value = _der_tlv(0x03, b"\x00" + signature)
+            fileobj.write(
+                _der_header(
+                    0x30,
+                    len(tbs_header)
+                    + tbs_length
+                    + len(signature_algorithm)
+                    + len(signature_value),
+                )
+            )
+            for chunk in tbs_chunks():
+                fileobj.write(chunk)
+            fileobj.write(signature_algorithm)
+            fileobj.write(signature_value)
 
     def _create_x509_extensions(
         self, extensions, handlers, x509_obj, add_func, gc
@@ -1199,12 +1602,14 @@ class Backend(BackendInterface):
         )
         return _RevokedCertificate(self, None, x509_revoked)
 
-    def load_pem_private_key(self, data, password):
+    def load_pem_private_key(
+        self, data, password, unsafe_skip_rsa_key_validation=False
+    ):
         return self._load_key(
             self._lib.PEM_read_bio_PrivateKey,
-            self._evp_pkey_to_private_key,
             data,
             password,
+            unsafe_skip_rsa_key_validation,
         )
 
     def load_pem_public_key(self, data):
@@ -1244,7 +1649,9 @@ class Backend(BackendInterface):
         else:
             self._handle_key_loading_error()
 
-    def load_der_private_key(self, data, password):
+    def load_der_private_key(
+        self, data, password, unsafe_skip_rsa_key_validation=False
+    ):
         # OpenSSL has a function called d2i_AutoPrivateKey that in theory
         # handles this automatically, however it doesn't handle encrypted
         # private keys. Instead we try to load the key two different ways.
@@ -1252,15 +1659,17 @@ class Backend(BackendInterface):
         bio_data = self._bytes_to_bio(data)
         key = self._evp_pkey_from_der_traditional_key(bio_data, password)
         if key:
-            return self._evp_pkey_to_private_key(key)
+            return self._evp_pkey_to_private_key(
+                key, unsafe_skip_rsa_key_validation
+            )
         else:
             # Finally we try to load it with the method that handles encrypted
             # PKCS8 properly.
             return self._load_key(
                 self._lib.d2i_PKCS8PrivateKey_bio,
-                self._evp_pkey_to_private_key,
                 data,
                 password,
+                unsafe_skip_rsa_key_validation,
             )
 
     def _evp_pkey_from_der_traditional_key(self, bio_data, password):
@@ -1339,31 +1748,45 @@ class Backend(BackendInterface):
         self.openssl_assert(res == 1)
         return rust_x509.load_der_x509_certificate(self._read_mem_bio(bio))
 
-    def load_pem_x509_crl(self, data: bytes) -> _CertificateRevocationList:
+    def _crl2ossl(self, crl: x509.CertificateRevocationList) -> typing.Any:
+        data = crl.public_bytes(serialization.Encoding.DER)
         mem_bio = self._bytes_to_bio(data)
-        x509_crl = self._lib.PEM_read_bio_X509_CRL(
-            mem_bio.bio, self._ffi.NULL, self._ffi.NULL, self._ffi.NULL
-        )
-        if x509_crl == self._ffi.NULL:
-            self._consume_errors()
-            raise ValueError(
-                "Unable to load CRL. See https://cryptography.io/en/la"
-                "test/faq.html#why-can-t-i-import-my-pem-file for more"
-                " details."
-            )
-
+        x509_crl = self._lib.d2i_X509_CRL_bio(mem_bio.bio, self._ffi.NULL)
+        self.openssl_assert(x509_crl != self._ffi.NULL)
         x509_crl = self._ffi.gc(x509_crl, self._lib.X509_CRL_free)
-        return _CertificateRevocationList(self, x509_crl)
+        return x509_crl
 
-    def load_der_x509_crl(self, data: bytes) -> _CertificateRevocationList:
-        mem_bio = self._bytes_to_bio(data)
-        x509_crl = self._lib.d2i_X509_CRL_bio(mem_bio.bio, self._ffi.NULL)
-        if x509_crl == self._ffi.NULL:
+    def _crl_is_signature_valid(
+        self,
+        crl: x509.CertificateRevocationList,
+        public_key: PUBLIC_KEY_TYPES,
+    ) -> bool:
+        if not isinstance(
+            public_key,
+            (
+                _DSAPublicKey,
+                _RSAPublicKey,
+                _EllipticCurvePublicKey,
+            ),
+        ):
+            raise TypeError(
+                "Expecting one of DSAPublicKey, RSAPublicKey,"
+                " or EllipticCurvePublicKey."
+            )
+        res = self._lib.X509_CRL_verify(
+            self._crl2ossl(crl), public_key._evp_pkey
+        )
+
+        if res != 1:
             self._consume_errors()
-            raise ValueError("Unable to load CRL")
+            return False
 
-        x509_crl = self._ffi.gc(x509_crl, self._lib.X509_CRL_free)
-        return _CertificateRevocationList(self, x509_crl)
+        return True
+
+    def create_x509_store(
+        self, certs: typing.Iterable[x509.Certificate]
+    ) -> _X509Store:
+        return _X509Store(self, certs)
 
     def load_pem_x509_csr(self, data: bytes) -> _CertificateSigningRequest:
         mem_bio = self._bytes_to_bio(data)
@@ -1391,7 +1814,9 @@ class Backend(BackendInterface):
         x509_req = self._ffi.gc(x509_req, self._lib.X509_REQ_free)
         return _CertificateSigningRequest(self, x509_req)
 
-    def _load_key(self, openssl_read_func, convert_func, data, password):
+    def _load_key(
+        self, openssl_read_func, data, password, unsafe_skip_rsa_key_validation
+    ):
         mem_bio = self._bytes_to_bio(data)
 
         userdata = self._ffi.new("CRYPTOGRAPHY_PASSWORD_DATA *")
@@ -1442,7 +1867,9 @@ class Backend(BackendInterface):
             password is not None and userdata.called == 1
         ) or password is None
 
-        return convert_func(evp_pkey)
+        return self._evp_pkey_to_private_key(
+            evp_pkey, unsafe_skip_rsa_key_validation
+        )
 
     def _handle_key_loading_error(self):
         errors = self._consume_errors()
@@ -2057,7 +2484,9 @@ class Backend(BackendInterface):
         self.openssl_assert(res == 1)
         return self._read_mem_bio(bio)
 
-    def generate_dh_parameters(self, generator, key_size):
+    def generate_dh_parameters(
+        self, generator, key_size, *, workers=1, progress=None, cancel=None
+    ):
         if key_size < dh._MIN_MODULUS_SIZE:
             raise ValueError(
                 "DH key_size must be at least {} bits".format(
@@ -2068,15 +2497,18 @@ class Backend(BackendInterface):
         if generator not in (2, 5):
             raise ValueError("DH generator must be 2 or 5")
 
-        dh_param_cdata = self._lib.DH_new()
-        self.openssl_assert(dh_param_cdata != self._ffi.NULL)
-        dh_param_cdata = self._ffi.gc(dh_param_cdata, self._lib.DH_free)
+        def generate(gencb):
+            dh_param_cdata = self._lib.DH_new()
+            self.openssl_assert(dh_param_cdata != self._ffi.NULL)
+            dh_param_cdata = self._ffi.gc(dh_param_cdata, self._lib.DH_free)
+            res = self._lib.DH_generate_parameters_ex(
+                dh_param_cdata, key_size, generator, gencb
+            )
+            return dh_param_cdata if res == 1 else None
 
-        res = self._lib.DH_generate_parameters_ex(
-            dh_param_cdata, key_size, generator, self._ffi.NULL
+        dh_param_cdata = self._generate_with_gencb(
+            generate, workers, progress, cancel
         )
-        self.openssl_assert(res == 1)
-
         return _DHParameters(self, dh_param_cdata)
 
     def _dh_cdata_to_evp_pkey(self, dh_cdata):
@@ -2124,6 +2556,18 @@ class Backend(BackendInterface):
         res = self._lib.DH_set0_key(dh_cdata, pub_key, priv_key)
         self.openssl_assert(res == 1)
 
+        if (
+            parameter_numbers.p,
+            parameter_numbers.g,
+            parameter_numbers.q,
+        ) not in self._dh_named_group_numbers:
+            self._dh_check_private_numbers(dh_cdata, parameter_numbers)
+
+        evp_pkey = self._dh_cdata_to_evp_pkey(dh_cdata)
+
+        return _DHPrivateKey(self, dh_cdata, evp_pkey)
+
+    def _dh_check_private_numbers(self, dh_cdata, parameter_numbers):
         codes = self._ffi.new("int[]", 1)
         res = self._lib.Cryptography_DH_check(dh_cdata, codes)
         self.openssl_assert(res == 1)
@@ -2142,10 +2586,6 @@ class Backend(BackendInterface):
         ):
             raise ValueError("DH private numbers did not pass safety checks.")
 
-        evp_pkey = self._dh_cdata_to_evp_pkey(dh_cdata)
-
-        return _DHPrivateKey(self, dh_cdata, evp_pkey)
-
     def load_dh_public_numbers(self, numbers):
         dh_cdata = self._lib.DH_new()
         self.openssl_assert(dh_cdata != self._ffi.NULL)
@@ -2191,6 +2631,27 @@ class Backend(BackendInterface):
 
         return _DHParameters(self, dh_cdata)
 
+    def load_dh_named_group(self, name):
+        # The NID_ffdhe* constants are NID_undef when OpenSSL lacks them.
+        nid = getattr(self._lib, "NID_" + name)
+        if (
+            not self._lib.Cryptography_HAS_DH_NEW_BY_NID
+            or nid == self._lib.NID_undef
+        ):
+            raise UnsupportedAlgorithm(
+                "This backend does not support the {} group.".format(name),
+                _Reasons.UNSUPPORTED_DIFFIE_HELLMAN,
+            )
+
+        dh_cdata = self._lib.DH_new_by_nid(nid)
+        self.openssl_assert(dh_cdata != self._ffi.NULL)
+        dh_cdata = self._ffi.gc(dh_cdata, self._lib.DH_free)
+        parameters = _DHParameters(self, dh_cdata)
+
+        numbers = parameters.parameter_numbers()
+        self._dh_named_group_numbers.add((numbers.p, numbers.g, numbers.q))
+        return parameters
+
     def dh_parameters_supported(self, p, g, q=None):
         dh_cdata = self._lib.DH_new()
         self.openssl_assert(dh_cdata != self._ffi.NULL)
@@ -2228,11 +2689,16 @@ class Backend(BackendInterface):
         return self._ffi.buffer(pp[0], res)[:]
 
     def x25519_load_public_bytes(self, data):
-        # When we drop support for CRYPTOGRAPHY_OPENSSL_LESS_THAN_111 we can
-        # switch this to EVP_PKEY_new_raw_public_key
+        utils._check_bytes("data", data)
         if len(data) != 32:
             raise ValueError("An X25519 public key is 32 bytes long")
 
+        # The EVP_PKEY is created when the key is first used.
+        return _X25519PublicKey(self, None, data)
+
+    def _x25519_public_evp_pkey(self, data):
+        # When we drop support for CRYPTOGRAPHY_OPENSSL_LESS_THAN_111 we can
+        # switch this to EVP_PKEY_new_raw_public_key
         evp_pkey = self._create_evp_pkey_gc()
         res = self._lib.EVP_PKEY_set_type(evp_pkey, self._lib.NID_X25519)
         self.openssl_assert(res == 1)
@@ -2240,7 +2706,7 @@ class Backend(BackendInterface):
             evp_pkey, data, len(data)
         )
         self.openssl_assert(res == 1)
-        return _X25519PublicKey(self, evp_pkey)
+        return evp_pkey
 
     def x25519_load_private_bytes(self, data):
         # When we drop support for CRYPTOGRAPHY_OPENSSL_LESS_THAN_111 we can
@@ -2299,15 +2765,18 @@ class Backend(BackendInterface):
         return not self._lib.CRYPTOGRAPHY_IS_LIBRESSL
 
     def x448_load_public_bytes(self, data):
+        utils._check_bytes("data", data)
         if len(data) != 56:
             raise ValueError("An X448 public key is 56 bytes long")
 
+        return _X448PublicKey(self, None, data)
+
+    def _x448_public_evp_pkey(self, data):
         evp_pkey = self._lib.EVP_PKEY_new_raw_public_key(
             self._lib.NID_X448, self._ffi.NULL, data, len(data)
         )
         self.openssl_assert(evp_pkey != self._ffi.NULL)
-        evp_pkey = self._ffi.gc(evp_pkey, self._lib.EVP_PKEY_free)
-        return _X448PublicKey(self, evp_pkey)
+        return self._ffi.gc(evp_pkey, self._lib.EVP_PKEY_free)
 
     def x448_load_private_bytes(self, data):
         if len(data) != 56:
@@ -2341,13 +2810,14 @@ class Backend(BackendInterface):
         if len(data) != ed25519._ED25519_KEY_SIZE:
             raise ValueError("An Ed25519 public key is 32 bytes long")
 
+        return _Ed25519PublicKey(self, None, data)
+
+    def _ed25519_public_evp_pkey(self, data):
         evp_pkey = self._lib.EVP_PKEY_new_raw_public_key(
             self._lib.NID_ED25519, self._ffi.NULL, data, len(data)
         )
         self.openssl_assert(evp_pkey != self._ffi.NULL)
-        evp_pkey = self._ffi.gc(evp_pkey, self._lib.EVP_PKEY_free)
-
-        return _Ed25519PublicKey(self, evp_pkey)
+        return self._ffi.gc(evp_pkey, self._lib.EVP_PKEY_free)
 
     def ed25519_load_private_bytes(self, data):
         if len(data) != ed25519._ED25519_KEY_SIZE:
@@ -2377,13 +2847,14 @@ class Backend(BackendInterface):
         if len(data) != _ED448_KEY_SIZE:
             raise ValueError("An Ed448 public key is 57 bytes long")
 
+        return _Ed448PublicKey(self, None, data)
+
+    def _ed448_public_evp_pkey(self, data):
         evp_pkey = self._lib.EVP_PKEY_new_raw_public_key(
             self._lib.NID_ED448, self._ffi.NULL, data, len(data)
         )
         self.openssl_assert(evp_pkey != self._ffi.NULL)
-        evp_pkey = self._ffi.gc(evp_pkey, self._lib.EVP_PKEY_free)
-
-        return _Ed448PublicKey(self, evp_pkey)
+        return self._ffi.gc(evp_pkey, self._lib.EVP_PKEY_free)
 
     def ed448_load_private_bytes(self, data):
         utils._check_byteslike("data", data)
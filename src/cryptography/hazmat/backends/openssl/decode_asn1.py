@@ -152,10 +152,15 @@ _CRL_ENTRY_REASON_ENUM_TO_CODE = {
 
 
 def _asn1_integer_to_int(backend, asn1_int):
-    bn = backend._lib.ASN1_INTEGER_to_BN(asn1_int, backend._ffi.NULL)
-    backend.openssl_assert(bn != backend._ffi.NULL)
-    bn = backend._ffi.gc(bn, backend._lib.BN_free)
-    return backend._bn_to_int(bn)
+    # An ASN1_INTEGER is an ASN1_STRING holding the big-endian magnitude,
+    # with the sign in its type.
+    asn1_string = backend._ffi.cast("ASN1_STRING *", asn1_int)
+    value = int.from_bytes(
+        backend._ffi.buffer(asn1_string.data, asn1_string.length), "big"
+    )
+    if asn1_string.type & backend._lib.V_ASN1_NEG:
+        value = -value
+    return value
 
 
 def _asn1_string_to_bytes(backend, asn1_string):
@@ -200,3 +205,30 @@ def _parse_asn1_generalized_time(backend, generalized_time):
         backend, backend._ffi.cast("ASN1_STRING *", generalized_time)
     )
     return datetime.datetime.strptime(time, "%Y%m%d%H%M%SZ")
+
+
+def _split_der(data: bytes) -> typing.List[typing.Tuple[int, bytes, bytes]]:
+    """
+    Splits concatenated DER elements into (tag, element, contents) tuples.
+
+    This does no validation and must only be used on DER produced by OpenSSL
+    or the Rust parser.
+    """
+    elements = []
+    offset = 0
+    while offset < len(data):
+        tag = data[offset]
+        length = data[offset + 1]
+        header_length = 2
+        if length & 0x80:
+            length_bytes = length & 0x7F
+            length = int.from_bytes(
+                data[offset + 2 : offset + 2 + length_bytes], "big"
+            )
+            header_length += length_bytes
+        end = offset + header_length + length
+        elements.append(
+            (tag, data[offset:end], data[offset + header_length : end])
+        )
+        offset = end
+    return elements
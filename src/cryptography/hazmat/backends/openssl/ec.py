@@ -2,6 +2,7 @@
 # 2.0, and the BSD License. See the LICENSE file in the root of this repository
 # for complete details.
 
+import typing
 
 from cryptography import utils
 from cryptography.exceptions import (
@@ -13,6 +14,7 @@ from cryptography.hazmat.backends.openssl.utils import (
     _calculate_digest_and_algorithm,
     _check_not_prehashed,
     _evp_pkey_derive,
+    _evp_pkey_derive_many,
     _warn_sign_verify_deprecated,
 )
 from cryptography.hazmat.primitives import hashes, serialization
@@ -86,16 +88,24 @@ def _sn_to_elliptic_curve(backend, sn):
 
 
 def _ecdsa_sig_sign(backend, private_key, data):
+    return _ecdsa_sig_sign_many(backend, private_key, [data])[0]
+
+
+def _ecdsa_sig_sign_many(backend, private_key, digests):
     max_size = backend._lib.ECDSA_size(private_key._ec_key)
     backend.openssl_assert(max_size > 0)
 
     sigbuf = backend._ffi.new("unsigned char[]", max_size)
     siglen_ptr = backend._ffi.new("unsigned int[]", 1)
-    res = backend._lib.ECDSA_sign(
-        0, data, len(data), sigbuf, siglen_ptr, private_key._ec_key
-    )
-    backend.openssl_assert(res == 1)
-    return backend._ffi.buffer(sigbuf)[: siglen_ptr[0]]
+    signatures = []
+    for data in digests:
+        res = backend._lib.ECDSA_sign(
+            0, data, len(data), sigbuf, siglen_ptr, private_key._ec_key
+        )
+        backend.openssl_assert(res == 1)
+        signatures.append(backend._ffi.buffer(sigbuf)[: siglen_ptr[0]])
+
+    return signatures
 
 
 def _ecdsa_sig_verify(backend, public_key, signature, data):
@@ -178,9 +188,9 @@ class _EllipticCurvePrivateKey(ec.EllipticCurvePrivateKey):
             self._backend, self, signature_algorithm.algorithm
         )
 
-    def exchange(
+    def _check_exchange(
         self, algorithm: ec.ECDH, peer_public_key: ec.EllipticCurvePublicKey
-    ) -> bytes:
+    ) -> None:
         if not (
             self._backend.elliptic_curve_exchange_algorithm_supported(
                 algorithm, self.curve
@@ -196,8 +206,25 @@ class _EllipticCurvePrivateKey(ec.EllipticCurvePrivateKey):
                 "peer_public_key and self are not on the same curve"
             )
 
+    def exchange(
+        self, algorithm: ec.ECDH, peer_public_key: ec.EllipticCurvePublicKey
+    ) -> bytes:
+        self._check_exchange(algorithm, peer_public_key)
         return _evp_pkey_derive(self._backend, self._evp_pkey, peer_public_key)
 
+    def exchange_many(
+        self,
+        algorithm: ec.ECDH,
+        peer_public_keys: typing.Iterable[ec.EllipticCurvePublicKey],
+    ) -> typing.List[bytes]:
+        peer_public_keys = list(peer_public_keys)
+        for peer_public_key in peer_public_keys:
+            self._check_exchange(algorithm, peer_public_key)
+
+        return _evp_pkey_derive_many(
+            self._backend, self._evp_pkey, peer_public_keys
+        )
+
     def public_key(self) -> ec.EllipticCurvePublicKey:
         group = self._backend._lib.EC_KEY_get0_group(self._ec_key)
         self._backend.openssl_assert(group != self._backend._ffi.NULL)
@@ -251,6 +278,22 @@ class _EllipticCurvePrivateKey(ec.EllipticCurvePrivateKey):
         )
         return _ecdsa_sig_sign(self._backend, self, data)
 
+    def sign_many(
+        self,
+        data: typing.Iterable[bytes],
+        signature_algorithm: ec.EllipticCurveSignatureAlgorithm,
+    ) -> typing.List[bytes]:
+        _check_signature_algorithm(signature_algorithm)
+        digests = [
+            _calculate_digest_and_algorithm(
+                self._backend,
+                item,
+                signature_algorithm._algorithm,  # type: ignore[attr-defined]
+            )[0]
+            for item in data
+        ]
+        return _ecdsa_sig_sign_many(self._backend, self, digests)
+
 
 class _EllipticCurvePublicKey(ec.EllipticCurvePublicKey):
     def __init__(self, backend, ec_key_cdata, evp_pkey):
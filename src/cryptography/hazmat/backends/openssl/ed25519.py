@@ -2,6 +2,7 @@
 # 2.0, and the BSD License. See the LICENSE file in the root of this repository
 # for complete details.
 
+import typing
 
 from cryptography import exceptions
 from cryptography.hazmat.primitives import serialization
@@ -13,10 +14,25 @@ from cryptography.hazmat.primitives.asymmetric.ed25519 import (
 )
 
 
+# The number of idle signing contexts kept per key for concurrent callers.
+_MD_CTX_POOL_SIZE = 8
+
+
 class _Ed25519PublicKey(Ed25519PublicKey):
-    def __init__(self, backend, evp_pkey):
+    __slots__ = ("_backend", "_evp_pkey_cdata", "_raw", "__weakref__")
+
+    def __init__(self, backend, evp_pkey, raw_public_bytes=None):
         self._backend = backend
-        self._evp_pkey = evp_pkey
+        self._evp_pkey_cdata = evp_pkey
+        self._raw = raw_public_bytes
+
+    @property
+    def _evp_pkey(self):
+        if self._evp_pkey_cdata is None:
+            self._evp_pkey_cdata = self._backend._ed25519_public_evp_pkey(
+                self._raw
+            )
+        return self._evp_pkey_cdata
 
     def public_bytes(
         self,
@@ -42,6 +58,9 @@ class _Ed25519PublicKey(Ed25519PublicKey):
         )
 
     def _raw_public_bytes(self) -> bytes:
+        if self._raw is not None:
+            return self._raw
+
         buf = self._backend._ffi.new("unsigned char []", _ED25519_KEY_SIZE)
         buflen = self._backend._ffi.new("size_t *", _ED25519_KEY_SIZE)
         res = self._backend._lib.EVP_PKEY_get_raw_public_key(
@@ -77,6 +96,7 @@ class _Ed25519PrivateKey(Ed25519PrivateKey):
     def __init__(self, backend, evp_pkey):
         self._backend = backend
         self._evp_pkey = evp_pkey
+        self._md_ctx_pool: typing.List[typing.Any] = []
 
     def public_key(self) -> Ed25519PublicKey:
         buf = self._backend._ffi.new("unsigned char []", _ED25519_KEY_SIZE)
@@ -89,12 +109,23 @@ class _Ed25519PrivateKey(Ed25519PrivateKey):
         public_bytes = self._backend._ffi.buffer(buf)[:]
         return self._backend.ed25519_load_public_bytes(public_bytes)
 
-    def sign(self, data: bytes) -> bytes:
-        evp_md_ctx = self._backend._lib.EVP_MD_CTX_new()
-        self._backend.openssl_assert(evp_md_ctx != self._backend._ffi.NULL)
-        evp_md_ctx = self._backend._ffi.gc(
-            evp_md_ctx, self._backend._lib.EVP_MD_CTX_free
-        )
+    def _acquire_md_ctx(self):
+        try:
+            return self._md_ctx_pool.pop()
+        except IndexError:
+            evp_md_ctx = self._backend._lib.EVP_MD_CTX_new()
+            self._backend.openssl_assert(evp_md_ctx != self._backend._ffi.NULL)
+            return self._backend._ffi.gc(
+                evp_md_ctx, self._backend._lib.EVP_MD_CTX_free
+            )
+
+    def _release_md_ctx(self, evp_md_ctx) -> None:
+        if len(self._md_ctx_pool) < _MD_CTX_POOL_SIZE:
+            self._md_ctx_pool.append(evp_md_ctx)
+
+    def _sign(self, evp_md_ctx, buf, buflen, data: bytes) -> bytes:
+        # A one-shot EVP_DigestSign finalizes the context, so it has to be
+        # initialized again before every signature.
         res = self._backend._lib.EVP_DigestSignInit(
             evp_md_ctx,
             self._backend._ffi.NULL,
@@ -103,8 +134,7 @@ class _Ed25519PrivateKey(Ed25519PrivateKey):
             self._evp_pkey,
         )
         self._backend.openssl_assert(res == 1)
-        buf = self._backend._ffi.new("unsigned char[]", _ED25519_SIG_SIZE)
-        buflen = self._backend._ffi.new("size_t *", len(buf))
+        buflen[0] = _ED25519_SIG_SIZE
         res = self._backend._lib.EVP_DigestSign(
             evp_md_ctx, buf, buflen, data, len(data)
         )
@@ -112,6 +142,20 @@ class _Ed25519PrivateKey(Ed25519PrivateKey):
         self._backend.openssl_assert(buflen[0] == _ED25519_SIG_SIZE)
         return self._backend._ffi.buffer(buf, buflen[0])[:]
 
+    def sign(self, data: bytes) -> bytes:
+        return self.sign_many([data])[0]
+
+    def sign_many(self, data: typing.Iterable[bytes]) -> typing.List[bytes]:
+        buf = self._backend._ffi.new("unsigned char[]", _ED25519_SIG_SIZE)
+        buflen = self._backend._ffi.new("size_t *")
+        evp_md_ctx = self._acquire_md_ctx()
+        try:
+            # The context is initialized again before each signature, so it
+            # can be reused even if signing failed.
+            return [self._sign(evp_md_ctx, buf, buflen, item) for item in data]
+        finally:
+            self._release_md_ctx(evp_md_ctx)
+
     def private_bytes(
         self,
         encoding: serialization.Encoding,
@@ -15,9 +15,20 @@ _ED448_SIG_SIZE = 114
 
 
 class _Ed448PublicKey(Ed448PublicKey):
-    def __init__(self, backend, evp_pkey):
+    __slots__ = ("_backend", "_evp_pkey_cdata", "_raw", "__weakref__")
+
+    def __init__(self, backend, evp_pkey, raw_public_bytes=None):
         self._backend = backend
-        self._evp_pkey = evp_pkey
+        self._evp_pkey_cdata = evp_pkey
+        self._raw = raw_public_bytes
+
+    @property
+    def _evp_pkey(self):
+        if self._evp_pkey_cdata is None:
+            self._evp_pkey_cdata = self._backend._ed448_public_evp_pkey(
+                self._raw
+            )
+        return self._evp_pkey_cdata
 
     def public_bytes(
         self,
@@ -43,6 +54,9 @@ class _Ed448PublicKey(Ed448PublicKey):
         )
 
     def _raw_public_bytes(self) -> bytes:
+        if self._raw is not None:
+            return self._raw
+
         buf = self._backend._ffi.new("unsigned char []", _ED448_KEY_SIZE)
         buflen = self._backend._ffi.new("size_t *", _ED448_KEY_SIZE)
         res = self._backend._lib.EVP_PKEY_get_raw_public_key(
@@ -4,7 +4,9 @@
 
 
 import calendar
+import datetime
 import ipaddress
+import typing
 
 from cryptography import utils, x509
 from cryptography.hazmat.backends.openssl.decode_asn1 import (
@@ -12,6 +14,10 @@ from cryptography.hazmat.backends.openssl.decode_asn1 import (
     _DISTPOINT_TYPE_FULLNAME,
     _DISTPOINT_TYPE_RELATIVENAME,
 )
+from cryptography.x509.base import (
+    _EARLIEST_UTC_TIME,
+    _convert_to_naive_utc_time,
+)
 from cryptography.x509.name import _ASN1Type
 from cryptography.x509.oid import (
     CRLEntryExtensionOID,
@@ -652,3 +658,90 @@ _OCSP_REQUEST_EXTENSION_ENCODE_HANDLERS = {
 _OCSP_BASICRESP_EXTENSION_ENCODE_HANDLERS = {
     OCSPExtensionOID.NONCE: _encode_nonce,
 }
+
+
+def _der_header(tag: int, length: int) -> bytes:
+    if length < 0x80:
+        return bytes([tag, length])
+
+    length_bytes = length.to_bytes((length.bit_length() + 7) // 8, "big")
+    return bytes([tag, 0x80 | len(length_bytes)]) + length_bytes
+
+
+def _der_tlv(tag: int, contents: bytes) -> bytes:
+    return _der_header(tag, len(contents)) + contents
+
+
+def _der_object_identifier(oid: x509.ObjectIdentifier) -> bytes:
+    arcs = [int(arc) for arc in oid.dotted_string.split(".")]
+    contents = bytearray()
+    for arc in [arcs[0] * 40 + arcs[1]] + arcs[2:]:
+        # Base 128, most significant group first, with the high bit set on
+        # every group but the last.
+        groups = [arc & 0x7F]
+        arc >>= 7
+        while arc:
+            groups.append(0x80 | (arc & 0x7F))
+            arc >>= 7
+        contents.extend(reversed(groups))
+    return _der_tlv(0x06, bytes(contents))
+
+
+def _der_time(time: datetime.datetime) -> bytes:
+    # RFC 5280 requires UTCTime for dates through 2049.
+    if time.year < 2050:
+        return _der_tlv(0x17, time.strftime("%y%m%d%H%M%SZ").encode("ascii"))
+    else:
+        return _der_tlv(0x18, time.strftime("%Y%m%d%H%M%SZ").encode("ascii"))
+
+
+# The DER encoding of the id-ce-cRLReasons OID.
+_CRL_REASON_OID_DER = b"\x06\x03\x55\x1d\x15"
+
+
+def _encode_revoked_certificate_der(
+    serial_number: int,
+    revocation_date: datetime.datetime,
+    reason: typing.Optional[x509.ReasonFlags],
+) -> bytes:
+    """
+    Encodes a revokedCertificates entry directly to DER, with the same
+    checks as RevokedCertificateBuilder.
+    """
+    if not isinstance(serial_number, int):
+        raise TypeError("Serial number must be of integral type.")
+    if serial_number <= 0:
+        raise ValueError("The serial number should be positive")
+    if serial_number.bit_length() >= 160:
+        raise ValueError("The serial number should not be more than 159 bits.")
+    if not isinstance(revocation_date, datetime.datetime):
+        raise TypeError("Expecting datetime object.")
+    revocation_date = _convert_to_naive_utc_time(revocation_date)
+    if revocation_date < _EARLIEST_UTC_TIME:
+        raise ValueError(
+            "The revocation date must be on or after 1950 January 1."
+        )
+
+    extensions = b""
+    if reason is not None:
+        if not isinstance(reason, x509.ReasonFlags):
+            raise TypeError("reason must be an item from the ReasonFlags enum")
+
+        reason_code = _der_tlv(
+            0x0A, bytes([_CRL_ENTRY_REASON_ENUM_TO_CODE[reason]])
+        )
+        extensions = _der_tlv(
+            0x30, _CRL_REASON_OID_DER + _der_tlv(0x04, reason_code)
+        )
+
+    return _der_revoked_certificate(serial_number, revocation_date, extensions)
+
+
+def _der_revoked_certificate(
+    serial_number: int, revocation_date: datetime.datetime, extensions: bytes
+) -> bytes:
+    serial = serial_number.to_bytes(serial_number.bit_length() // 8 + 1, "big")
+    contents = _der_tlv(0x02, serial) + _der_time(revocation_date)
+    if extensions:
+        contents += _der_tlv(0x30, extensions)
+    return _der_tlv(0x30, contents)
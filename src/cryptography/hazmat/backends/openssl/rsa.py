@@ -51,12 +51,87 @@ def _get_rsa_pss_salt_length(
         return salt
 
 
+# The most configured EVP_PKEY_CTXs each key keeps. Every combination of
+# operation, padding and hash takes an entry, so this covers the usual few
+# while bounding the cache of a key used with many different parameters.
+_MAX_CACHED_PKEY_CTXS = 8
+
+
+def _rsa_padding_cache_key(
+    padding: AsymmetricPadding,
+    algorithm: typing.Optional[hashes.HashAlgorithm],
+) -> typing.Optional[typing.Tuple]:
+    """
+    Return a hashable description of a padding/algorithm combination, for
+    use as the key of a key object's EVP_PKEY_CTX cache, or None if the
+    combination should not be cached. OAEP labels are deliberately left out
+    since they are set on each duplicated context.
+    """
+    if algorithm is None:
+        algorithm_key = None
+    else:
+        algorithm_key = (type(algorithm), algorithm.digest_size)
+
+    if type(padding) is PKCS1v15:
+        return (PKCS1v15, algorithm_key)
+
+    mgf = getattr(padding, "_mgf", None)
+    if type(mgf) is not MGF1:
+        return None
+
+    mgf_key = (type(mgf._algorithm), mgf._algorithm.digest_size)
+    if type(padding) is PSS:
+        return (PSS, algorithm_key, mgf_key, padding._salt_length)
+    elif type(padding) is OAEP:
+        oaep_algorithm = padding._algorithm
+        return (
+            OAEP,
+            (type(oaep_algorithm), oaep_algorithm.digest_size),
+            mgf_key,
+        )
+    else:
+        return None
+
+
+def _cache_pkey_ctx(key, cache_key, pkey_ctx) -> None:
+    cache = key._pkey_ctx_cache
+    if len(cache) >= _MAX_CACHED_PKEY_CTXS:
+        # Evict the oldest entry. Another thread may have evicted it first.
+        cache.pop(next(iter(cache), None), None)
+    cache[cache_key] = pkey_ctx
+
+
+def _dup_pkey_ctx(backend, pkey_ctx):
+    pkey_ctx = backend._lib.EVP_PKEY_CTX_dup(pkey_ctx)
+    backend.openssl_assert(pkey_ctx != backend._ffi.NULL)
+    return backend._ffi.gc(pkey_ctx, backend._lib.EVP_PKEY_CTX_free)
+
+
 def _enc_dec_rsa(
     backend,
     key: typing.Union["_RSAPrivateKey", "_RSAPublicKey"],
     data: bytes,
     padding: AsymmetricPadding,
 ) -> bytes:
+    # Configuring a context costs an allocation and several ctrl calls, so
+    # each key keeps a configured one per padding and duplicates it.
+    cache_key = _rsa_padding_cache_key(padding, None)
+    template = key._pkey_ctx_cache.get(cache_key)
+    if template is None:
+        template = _enc_dec_rsa_setup(backend, key, padding)
+        if cache_key is not None:
+            _cache_pkey_ctx(key, cache_key, template)
+
+    return _enc_dec_rsa_pkey_ctx(
+        backend, key, data, padding, _dup_pkey_ctx(backend, template)
+    )
+
+
+def _enc_dec_rsa_setup(
+    backend,
+    key: typing.Union["_RSAPrivateKey", "_RSAPublicKey"],
+    padding: AsymmetricPadding,
+):
     if not isinstance(padding, AsymmetricPadding):
         raise TypeError("Padding must be an instance of AsymmetricPadding.")
 
@@ -84,22 +159,10 @@ def _enc_dec_rsa(
             _Reasons.UNSUPPORTED_PADDING,
         )
 
-    return _enc_dec_rsa_pkey_ctx(backend, key, data, padding_enum, padding)
-
-
-def _enc_dec_rsa_pkey_ctx(
-    backend,
-    key: typing.Union["_RSAPrivateKey", "_RSAPublicKey"],
-    data: bytes,
-    padding_enum: int,
-    padding: AsymmetricPadding,
-) -> bytes:
     if isinstance(key, _RSAPublicKey):
         init = backend._lib.EVP_PKEY_encrypt_init
-        crypt = backend._lib.EVP_PKEY_encrypt
     else:
         init = backend._lib.EVP_PKEY_decrypt_init
-        crypt = backend._lib.EVP_PKEY_decrypt
 
     pkey_ctx = backend._lib.EVP_PKEY_CTX_new(key._evp_pkey, backend._ffi.NULL)
     backend.openssl_assert(pkey_ctx != backend._ffi.NULL)
@@ -108,8 +171,6 @@ def _enc_dec_rsa_pkey_ctx(
     backend.openssl_assert(res == 1)
     res = backend._lib.EVP_PKEY_CTX_set_rsa_padding(pkey_ctx, padding_enum)
     backend.openssl_assert(res > 0)
-    buf_size = backend._lib.EVP_PKEY_size(key._evp_pkey)
-    backend.openssl_assert(buf_size > 0)
     if isinstance(padding, OAEP) and backend._lib.Cryptography_HAS_RSA_OAEP_MD:
         mgf1_md = backend._evp_md_non_null_from_algorithm(
             padding._mgf._algorithm
@@ -120,6 +181,21 @@ def _enc_dec_rsa_pkey_ctx(
         res = backend._lib.EVP_PKEY_CTX_set_rsa_oaep_md(pkey_ctx, oaep_md)
         backend.openssl_assert(res > 0)
 
+    return pkey_ctx
+
+
+def _enc_dec_rsa_pkey_ctx(
+    backend,
+    key: typing.Union["_RSAPrivateKey", "_RSAPublicKey"],
+    data: bytes,
+    padding: AsymmetricPadding,
+    pkey_ctx,
+) -> bytes:
+    if isinstance(key, _RSAPublicKey):
+        crypt = backend._lib.EVP_PKEY_encrypt
+    else:
+        crypt = backend._lib.EVP_PKEY_decrypt
+
     if (
         isinstance(padding, OAEP)
         and padding._label is not None
@@ -135,6 +211,8 @@ def _enc_dec_rsa_pkey_ctx(
         )
         backend.openssl_assert(res == 1)
 
+    buf_size = backend._lib.EVP_PKEY_size(key._evp_pkey)
+    backend.openssl_assert(buf_size > 0)
     outlen = backend._ffi.new("size_t *", buf_size)
     buf = backend._ffi.new("unsigned char[]", buf_size)
     # Everything from this line onwards is written with the goal of being as
@@ -196,6 +274,21 @@ def _rsa_sig_determine_padding(backend, key, padding, algorithm):
 # padding type, where it means that the signature data is encoded/decoded
 # as provided, without being wrapped in a DigestInfo structure.
 def _rsa_sig_setup(backend, padding, algorithm, key, init_func):
+    cache_key = _rsa_padding_cache_key(padding, algorithm)
+    if cache_key is not None:
+        cache_key = (init_func, cache_key)
+    template = key._pkey_ctx_cache.get(cache_key)
+    if template is None:
+        template = _rsa_sig_configure(
+            backend, padding, algorithm, key, init_func
+        )
+        if cache_key is not None:
+            _cache_pkey_ctx(key, cache_key, template)
+
+    return _dup_pkey_ctx(backend, template)
+
+
+def _rsa_sig_configure(backend, padding, algorithm, key, init_func):
     padding_enum = _rsa_sig_determine_padding(backend, key, padding, algorithm)
     pkey_ctx = backend._lib.EVP_PKEY_CTX_new(key._evp_pkey, backend._ffi.NULL)
     backend.openssl_assert(pkey_ctx != backend._ffi.NULL)
@@ -238,6 +331,12 @@ def _rsa_sig_setup(backend, padding, algorithm, key, init_func):
 
 
 def _rsa_sig_sign(backend, padding, algorithm, private_key, data):
+    return _rsa_sig_sign_many(
+        backend, padding, algorithm, private_key, [data]
+    )[0]
+
+
+def _rsa_sig_sign_many(backend, padding, algorithm, private_key, digests):
     pkey_ctx = _rsa_sig_setup(
         backend,
         padding,
@@ -247,20 +346,28 @@ def _rsa_sig_sign(backend, padding, algorithm, private_key, data):
     )
     buflen = backend._ffi.new("size_t *")
     res = backend._lib.EVP_PKEY_sign(
-        pkey_ctx, backend._ffi.NULL, buflen, data, len(data)
+        pkey_ctx, backend._ffi.NULL, buflen, backend._ffi.NULL, 0
     )
     backend.openssl_assert(res == 1)
-    buf = backend._ffi.new("unsigned char[]", buflen[0])
-    res = backend._lib.EVP_PKEY_sign(pkey_ctx, buf, buflen, data, len(data))
-    if res != 1:
-        errors = backend._consume_errors_with_text()
-        raise ValueError(
-            "Digest or salt length too long for key size. Use a larger key "
-            "or shorter salt length if you are specifying a PSS salt",
-            errors,
+    max_size = buflen[0]
+    buf = backend._ffi.new("unsigned char[]", max_size)
+    signatures = []
+    for data in digests:
+        buflen[0] = max_size
+        res = backend._lib.EVP_PKEY_sign(
+            pkey_ctx, buf, buflen, data, len(data)
         )
+        if res != 1:
+            errors = backend._consume_errors_with_text()
+            raise ValueError(
+                "Digest or salt length too long for key size. Use a larger "
+                "key or shorter salt length if you are specifying a PSS salt",
+                errors,
+            )
+
+        signatures.append(backend._ffi.buffer(buf, buflen[0])[:])
 
-    return backend._ffi.buffer(buf)[:]
+    return signatures
 
 
 def _rsa_sig_verify(backend, padding, algorithm, public_key, signature, data):
@@ -382,11 +489,18 @@ class _RSAVerificationContext(AsymmetricVerificationContext):
 
 
 class _RSAPrivateKey(RSAPrivateKey):
-    def __init__(self, backend, rsa_cdata, evp_pkey):
-        res = backend._lib.RSA_check_key(rsa_cdata)
-        if res != 1:
-            errors = backend._consume_errors_with_text()
-            raise ValueError("Invalid private key", errors)
+    def __init__(
+        self, backend, rsa_cdata, evp_pkey, *, unsafe_skip_rsa_key_validation
+    ):
+        # RSA_check_key costs several modular exponentiations (and is
+        # noticeably slower still with OpenSSL 3.0's primality checks). It
+        # may only be skipped for keys that come from a trusted source, such
+        # as ones we have just generated ourselves.
+        if not unsafe_skip_rsa_key_validation:
+            res = backend._lib.RSA_check_key(rsa_cdata)
+            if res != 1:
+                errors = backend._consume_errors_with_text()
+                raise ValueError("Invalid private key", errors)
 
         # Blinding is on by default in many versions of OpenSSL, but let's
         # just be conservative here.
@@ -396,6 +510,7 @@ class _RSAPrivateKey(RSAPrivateKey):
         self._backend = backend
         self._rsa_cdata = rsa_cdata
         self._evp_pkey = evp_pkey
+        self._pkey_ctx_cache: typing.Dict[typing.Any, typing.Any] = {}
 
         n = self._backend._ffi.new("BIGNUM **")
         self._backend._lib.RSA_get0_key(
@@ -491,12 +606,33 @@ class _RSAPrivateKey(RSAPrivateKey):
         )
         return _rsa_sig_sign(self._backend, padding, algorithm, self, data)
 
+    def sign_many(
+        self,
+        data: typing.Iterable[bytes],
+        padding: AsymmetricPadding,
+        algorithm: typing.Union[asym_utils.Prehashed, hashes.HashAlgorithm],
+    ) -> typing.List[bytes]:
+        digests = []
+        for item in data:
+            digest, hash_algorithm = _calculate_digest_and_algorithm(
+                self._backend, item, algorithm
+            )
+            digests.append(digest)
+
+        if not digests:
+            return []
+
+        return _rsa_sig_sign_many(
+            self._backend, padding, hash_algorithm, self, digests
+        )
+
 
 class _RSAPublicKey(RSAPublicKey):
     def __init__(self, backend, rsa_cdata, evp_pkey):
         self._backend = backend
         self._rsa_cdata = rsa_cdata
         self._evp_pkey = evp_pkey
+        self._pkey_ctx_cache: typing.Dict[typing.Any, typing.Any] = {}
 
         n = self._backend._ffi.new("BIGNUM **")
         self._backend._lib.RSA_get0_key(
@@ -11,24 +11,36 @@ from cryptography.hazmat.primitives.asymmetric.utils import Prehashed
 
 
 def _evp_pkey_derive(backend, evp_pkey, peer_public_key):
+    return _evp_pkey_derive_many(backend, evp_pkey, [peer_public_key])[0]
+
+
+def _evp_pkey_derive_many(backend, evp_pkey, peer_public_keys):
     ctx = backend._lib.EVP_PKEY_CTX_new(evp_pkey, backend._ffi.NULL)
     backend.openssl_assert(ctx != backend._ffi.NULL)
     ctx = backend._ffi.gc(ctx, backend._lib.EVP_PKEY_CTX_free)
     res = backend._lib.EVP_PKEY_derive_init(ctx)
     backend.openssl_assert(res == 1)
-    res = backend._lib.EVP_PKEY_derive_set_peer(ctx, peer_public_key._evp_pkey)
-    backend.openssl_assert(res == 1)
     keylen = backend._ffi.new("size_t *")
-    res = backend._lib.EVP_PKEY_derive(ctx, backend._ffi.NULL, keylen)
-    backend.openssl_assert(res == 1)
-    backend.openssl_assert(keylen[0] > 0)
-    buf = backend._ffi.new("unsigned char[]", keylen[0])
-    res = backend._lib.EVP_PKEY_derive(ctx, buf, keylen)
-    if res != 1:
-        errors_with_text = backend._consume_errors_with_text()
-        raise ValueError("Error computing shared key.", errors_with_text)
-
-    return backend._ffi.buffer(buf, keylen[0])[:]
+    buf = None
+    shared_keys = []
+    for peer_public_key in peer_public_keys:
+        res = backend._lib.EVP_PKEY_derive_set_peer(
+            ctx, peer_public_key._evp_pkey
+        )
+        backend.openssl_assert(res == 1)
+        res = backend._lib.EVP_PKEY_derive(ctx, backend._ffi.NULL, keylen)
+        backend.openssl_assert(res == 1)
+        backend.openssl_assert(keylen[0] > 0)
+        if buf is None or len(buf) < keylen[0]:
+            buf = backend._ffi.new("unsigned char[]", keylen[0])
+        res = backend._lib.EVP_PKEY_derive(ctx, buf, keylen)
+        if res != 1:
+            errors_with_text = backend._consume_errors_with_text()
+            raise ValueError("Error computing shared key.", errors_with_text)
+
+        shared_keys.append(backend._ffi.buffer(buf, keylen[0])[:])
+
+    return shared_keys
 
 
 def _calculate_digest_and_algorithm(backend, data, algorithm):
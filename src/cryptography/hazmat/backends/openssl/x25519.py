@@ -15,9 +15,22 @@ _X25519_KEY_SIZE = 32
 
 
 class _X25519PublicKey(X25519PublicKey):
-    def __init__(self, backend, evp_pkey):
+    # Keys loaded from raw bytes hold only those bytes until an operation
+    # needs the EVP_PKEY, which keeps large collections of peer keys small.
+    __slots__ = ("_backend", "_evp_pkey_cdata", "_raw", "__weakref__")
+
+    def __init__(self, backend, evp_pkey, raw_public_bytes=None):
         self._backend = backend
-        self._evp_pkey = evp_pkey
+        self._evp_pkey_cdata = evp_pkey
+        self._raw = raw_public_bytes
+
+    @property
+    def _evp_pkey(self):
+        if self._evp_pkey_cdata is None:
+            self._evp_pkey_cdata = self._backend._x25519_public_evp_pkey(
+                self._raw
+            )
+        return self._evp_pkey_cdata
 
     def public_bytes(
         self,
@@ -43,6 +56,9 @@ class _X25519PublicKey(X25519PublicKey):
         )
 
     def _raw_public_bytes(self) -> bytes:
+        if self._raw is not None:
+            return self._raw
+
         ucharpp = self._backend._ffi.new("unsigned char **")
         res = self._backend._lib.EVP_PKEY_get1_tls_encodedpoint(
             self._evp_pkey, ucharpp
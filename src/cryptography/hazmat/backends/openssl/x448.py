@@ -14,9 +14,20 @@ _X448_KEY_SIZE = 56
 
 
 class _X448PublicKey(X448PublicKey):
-    def __init__(self, backend, evp_pkey):
+    __slots__ = ("_backend", "_evp_pkey_cdata", "_raw", "__weakref__")
+
+    def __init__(self, backend, evp_pkey, raw_public_bytes=None):
         self._backend = backend
-        self._evp_pkey = evp_pkey
+        self._evp_pkey_cdata = evp_pkey
+        self._raw = raw_public_bytes
+
+    @property
+    def _evp_pkey(self):
+        if self._evp_pkey_cdata is None:
+            self._evp_pkey_cdata = self._backend._x448_public_evp_pkey(
+                self._raw
+            )
+        return self._evp_pkey_cdata
 
     def public_bytes(
         self,
@@ -42,6 +53,9 @@ class _X448PublicKey(X448PublicKey):
         )
 
     def _raw_public_bytes(self) -> bytes:
+        if self._raw is not None:
+            return self._raw
+
         buf = self._backend._ffi.new("unsigned char []", _X448_KEY_SIZE)
         buflen = self._backend._ffi.new("size_t *", _X448_KEY_SIZE)
         res = self._backend._lib.EVP_PKEY_get_raw_public_key(
@@ -65,7 +79,8 @@ class _X448PrivateKey(X448PrivateKey):
         )
         self._backend.openssl_assert(res == 1)
         self._backend.openssl_assert(buflen[0] == _X448_KEY_SIZE)
-        return self._backend.x448_load_public_bytes(buf)
+        public_bytes = self._backend._ffi.buffer(buf)[:]
+        return self._backend.x448_load_public_bytes(public_bytes)
 
     def exchange(self, peer_public_key: X448PublicKey) -> bytes:
         if not isinstance(peer_public_key, X448PublicKey):
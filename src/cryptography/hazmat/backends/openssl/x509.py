@@ -3,14 +3,15 @@
 # for complete details.
 
 
+import calendar
+import collections
 import datetime
-import operator
+import threading
 import typing
 import warnings
 
 from cryptography import utils, x509
 from cryptography.exceptions import UnsupportedAlgorithm
-from cryptography.hazmat.backends.openssl import dsa, ec, rsa
 from cryptography.hazmat.backends.openssl.decode_asn1 import (
     _asn1_integer_to_int,
     _asn1_string_to_bytes,
@@ -18,13 +19,11 @@ from cryptography.hazmat.backends.openssl.decode_asn1 import (
     _obj2txt,
     _parse_asn1_time,
 )
-from cryptography.hazmat.backends.openssl.encode_asn1 import (
-    _encode_asn1_int_gc,
-    _txt2obj_gc,
-)
+from cryptography.hazmat.backends.openssl.encode_asn1 import _txt2obj_gc
 from cryptography.hazmat.primitives import hashes, serialization
 from cryptography.x509.base import PUBLIC_KEY_TYPES
 from cryptography.x509.name import _ASN1Type
+from cryptography.x509.verification import Purpose, VerificationError
 
 
 # This exists for pyOpenSSL compatibility and SHOULD NOT BE USED
@@ -75,186 +74,6 @@ class _RevokedCertificate(x509.RevokedCertificate):
         )
 
 
-class _CertificateRevocationList(x509.CertificateRevocationList):
-    def __init__(self, backend, x509_crl):
-        self._backend = backend
-        self._x509_crl = x509_crl
-
-    def __eq__(self, other: object) -> bool:
-        if not isinstance(other, _CertificateRevocationList):
-            return NotImplemented
-
-        res = self._backend._lib.X509_CRL_cmp(self._x509_crl, other._x509_crl)
-        return res == 0
-
-    def __ne__(self, other: object) -> bool:
-        return not self == other
-
-    def fingerprint(self, algorithm: hashes.HashAlgorithm) -> bytes:
-        h = hashes.Hash(algorithm, self._backend)
-        bio = self._backend._create_mem_bio_gc()
-        res = self._backend._lib.i2d_X509_CRL_bio(bio, self._x509_crl)
-        self._backend.openssl_assert(res == 1)
-        der = self._backend._read_mem_bio(bio)
-        h.update(der)
-        return h.finalize()
-
-    @utils.cached_property
-    def _sorted_crl(self):
-        # X509_CRL_get0_by_serial sorts in place, which breaks a variety of
-        # things we don't want to break (like iteration and the signature).
-        # Let's dupe it and sort that instead.
-        dup = self._backend._lib.X509_CRL_dup(self._x509_crl)
-        self._backend.openssl_assert(dup != self._backend._ffi.NULL)
-        dup = self._backend._ffi.gc(dup, self._backend._lib.X509_CRL_free)
-        return dup
-
-    def get_revoked_certificate_by_serial_number(
-        self, serial_number: int
-    ) -> typing.Optional[x509.RevokedCertificate]:
-        revoked = self._backend._ffi.new("X509_REVOKED **")
-        asn1_int = _encode_asn1_int_gc(self._backend, serial_number)
-        res = self._backend._lib.X509_CRL_get0_by_serial(
-            self._sorted_crl, revoked, asn1_int
-        )
-        if res == 0:
-            return None
-        else:
-            self._backend.openssl_assert(revoked[0] != self._backend._ffi.NULL)
-            return _RevokedCertificate(
-                self._backend, self._sorted_crl, revoked[0]
-            )
-
-    @property
-    def signature_hash_algorithm(
-        self,
-    ) -> typing.Optional[hashes.HashAlgorithm]:
-        oid = self.signature_algorithm_oid
-        try:
-            return x509._SIG_OIDS_TO_HASH[oid]
-        except KeyError:
-            raise UnsupportedAlgorithm(
-                "Signature algorithm OID:{} not recognized".format(oid)
-            )
-
-    @property
-    def signature_algorithm_oid(self) -> x509.ObjectIdentifier:
-        alg = self._backend._ffi.new("X509_ALGOR **")
-        self._backend._lib.X509_CRL_get0_signature(
-            self._x509_crl, self._backend._ffi.NULL, alg
-        )
-        self._backend.openssl_assert(alg[0] != self._backend._ffi.NULL)
-        oid = _obj2txt(self._backend, alg[0].algorithm)
-        return x509.ObjectIdentifier(oid)
-
-    @property
-    def issuer(self) -> x509.Name:
-        issuer = self._backend._lib.X509_CRL_get_issuer(self._x509_crl)
-        self._backend.openssl_assert(issuer != self._backend._ffi.NULL)
-        return _decode_x509_name(self._backend, issuer)
-
-    @property
-    def next_update(self) -> datetime.datetime:
-        nu = self._backend._lib.X509_CRL_get0_nextUpdate(self._x509_crl)
-        self._backend.openssl_assert(nu != self._backend._ffi.NULL)
-        return _parse_asn1_time(self._backend, nu)
-
-    @property
-    def last_update(self) -> datetime.datetime:
-        lu = self._backend._lib.X509_CRL_get0_lastUpdate(self._x509_crl)
-        self._backend.openssl_assert(lu != self._backend._ffi.NULL)
-        return _parse_asn1_time(self._backend, lu)
-
-    @property
-    def signature(self) -> bytes:
-        sig = self._backend._ffi.new("ASN1_BIT_STRING **")
-        self._backend._lib.X509_CRL_get0_signature(
-            self._x509_crl, sig, self._backend._ffi.NULL
-        )
-        self._backend.openssl_assert(sig[0] != self._backend._ffi.NULL)
-        return _asn1_string_to_bytes(self._backend, sig[0])
-
-    @property
-    def tbs_certlist_bytes(self) -> bytes:
-        pp = self._backend._ffi.new("unsigned char **")
-        res = self._backend._lib.i2d_re_X509_CRL_tbs(self._x509_crl, pp)
-        self._backend.openssl_assert(res > 0)
-        pp = self._backend._ffi.gc(
-            pp, lambda pointer: self._backend._lib.OPENSSL_free(pointer[0])
-        )
-        return self._backend._ffi.buffer(pp[0], res)[:]
-
-    def public_bytes(self, encoding: serialization.Encoding) -> bytes:
-        bio = self._backend._create_mem_bio_gc()
-        if encoding is serialization.Encoding.PEM:
-            res = self._backend._lib.PEM_write_bio_X509_CRL(
-                bio, self._x509_crl
-            )
-        elif encoding is serialization.Encoding.DER:
-            res = self._backend._lib.i2d_X509_CRL_bio(bio, self._x509_crl)
-        else:
-            raise TypeError("encoding must be an item from the Encoding enum")
-
-        self._backend.openssl_assert(res == 1)
-        return self._backend._read_mem_bio(bio)
-
-    def _revoked_cert(self, idx):
-        revoked = self._backend._lib.X509_CRL_get_REVOKED(self._x509_crl)
-        r = self._backend._lib.sk_X509_REVOKED_value(revoked, idx)
-        self._backend.openssl_assert(r != self._backend._ffi.NULL)
-        return _RevokedCertificate(self._backend, self, r)
-
-    def __iter__(self):
-        for i in range(len(self)):
-            yield self._revoked_cert(i)
-
-    def __getitem__(self, idx):
-        if isinstance(idx, slice):
-            start, stop, step = idx.indices(len(self))
-            return [self._revoked_cert(i) for i in range(start, stop, step)]
-        else:
-            idx = operator.index(idx)
-            if idx < 0:
-                idx += len(self)
-            if not 0 <= idx < len(self):
-                raise IndexError
-            return self._revoked_cert(idx)
-
-    def __len__(self) -> int:
-        revoked = self._backend._lib.X509_CRL_get_REVOKED(self._x509_crl)
-        if revoked == self._backend._ffi.NULL:
-            return 0
-        else:
-            return self._backend._lib.sk_X509_REVOKED_num(revoked)
-
-    @utils.cached_property
-    def extensions(self) -> x509.Extensions:
-        return self._backend._crl_extension_parser.parse(self._x509_crl)
-
-    def is_signature_valid(self, public_key: PUBLIC_KEY_TYPES) -> bool:
-        if not isinstance(
-            public_key,
-            (
-                dsa._DSAPublicKey,
-                rsa._RSAPublicKey,
-                ec._EllipticCurvePublicKey,
-            ),
-        ):
-            raise TypeError(
-                "Expecting one of DSAPublicKey, RSAPublicKey,"
-                " or EllipticCurvePublicKey."
-            )
-        res = self._backend._lib.X509_CRL_verify(
-            self._x509_crl, public_key._evp_pkey
-        )
-
-        if res != 1:
-            self._backend._consume_errors()
-            return False
-
-        return True
-
-
 class _CertificateSigningRequest(x509.CertificateSigningRequest):
     def __init__(self, backend, x509_req):
         self._backend = backend
@@ -408,3 +227,120 @@ class _CertificateSigningRequest(x509.CertificateSigningRequest):
         # that it is always a type of ASN1_STRING
         data = self._backend._ffi.cast("ASN1_STRING *", data)
         return _asn1_string_to_bytes(self._backend, data)
+
+
+# The number of intermediates an _X509Store keeps converted to OpenSSL.
+_INTERMEDIATE_CACHE_SIZE = 256
+
+
+class _X509Store(object):
+    """
+    An X509_STORE of trusted certificates that is reused for every
+    verification.
+
+    OpenSSL keeps the trusted certificates indexed by subject name, and when
+    several share a name it picks the one whose subject key identifier
+    matches the authority key identifier of the certificate being checked.
+    """
+
+    def __init__(self, backend, certs):
+        self._backend = backend
+        self._purposes = {
+            Purpose.SERVER_AUTH: backend._lib.X509_PURPOSE_SSL_SERVER,
+            Purpose.CLIENT_AUTH: backend._lib.X509_PURPOSE_SSL_CLIENT,
+        }
+        store = backend._lib.X509_STORE_new()
+        backend.openssl_assert(store != backend._ffi.NULL)
+        self._store = backend._ffi.gc(store, backend._lib.X509_STORE_free)
+        # The trusted certificates keyed by the address of their X509, so
+        # that the chains OpenSSL builds can be mapped back to Certificate
+        # objects without reparsing them.
+        self._trusted = {}
+        # Older OpenSSL versions refuse to add the same certificate twice.
+        for cert in dict.fromkeys(certs):
+            x509 = backend._cert2ossl(cert)
+            res = backend._lib.X509_STORE_add_cert(self._store, x509)
+            backend.openssl_assert(res == 1)
+            self._trusted[self._address(x509)] = cert
+
+        self._intermediates = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def _address(self, x509) -> int:
+        return int(self._backend._ffi.cast("uintptr_t", x509))
+
+    def _intermediate(self, cert: x509.Certificate):
+        with self._lock:
+            x509 = self._intermediates.get(cert)
+            if x509 is not None:
+                self._intermediates.move_to_end(cert)
+                return x509
+
+        x509 = self._backend._cert2ossl(cert)
+        with self._lock:
+            self._intermediates[cert] = x509
+            if len(self._intermediates) > _INTERMEDIATE_CACHE_SIZE:
+                self._intermediates.popitem(last=False)
+
+        return x509
+
+    def verify(
+        self,
+        leaf: x509.Certificate,
+        intermediates: typing.Sequence[x509.Certificate],
+        time: datetime.datetime,
+        purpose: typing.Optional[Purpose],
+    ) -> typing.List[x509.Certificate]:
+        lib = self._backend._lib
+        ffi = self._backend._ffi
+        x509_leaf = self._backend._cert2ossl(leaf)
+        known = {self._address(x509_leaf): leaf}
+        untrusted = lib.sk_X509_new_null()
+        self._backend.openssl_assert(untrusted != ffi.NULL)
+        untrusted = ffi.gc(untrusted, lib.sk_X509_free)
+        # This list keeps the intermediates alive until the chain is built,
+        # even if they are evicted from the cache in the meantime.
+        x509_intermediates = []
+        for cert in intermediates:
+            x509 = self._intermediate(cert)
+            x509_intermediates.append(x509)
+            known[self._address(x509)] = cert
+            res = lib.sk_X509_push(untrusted, x509)
+            self._backend.openssl_assert(res >= 1)
+
+        ctx = lib.X509_STORE_CTX_new()
+        self._backend.openssl_assert(ctx != ffi.NULL)
+        ctx = ffi.gc(ctx, lib.X509_STORE_CTX_free)
+        res = lib.X509_STORE_CTX_init(ctx, self._store, x509_leaf, untrusted)
+        self._backend.openssl_assert(res == 1)
+        param = lib.X509_STORE_CTX_get0_param(ctx)
+        lib.X509_VERIFY_PARAM_set_time(
+            param, calendar.timegm(time.timetuple())
+        )
+        if purpose is not None:
+            res = lib.X509_VERIFY_PARAM_set_purpose(
+                param, self._purposes[purpose]
+            )
+            self._backend.openssl_assert(res == 1)
+
+        if lib.X509_verify_cert(ctx) != 1:
+            self._backend._consume_errors()
+            error = lib.X509_STORE_CTX_get_error(ctx)
+            raise VerificationError(
+                ffi.string(lib.X509_verify_cert_error_string(error)).decode(
+                    "ascii"
+                )
+            )
+
+        chain = lib.X509_STORE_CTX_get_chain(ctx)
+        self._backend.openssl_assert(chain != ffi.NULL)
+        certs = []
+        for i in range(lib.sk_X509_num(chain)):
+            x509 = lib.sk_X509_value(chain, i)
+            address = self._address(x509)
+            cert = known.get(address) or self._trusted.get(address)
+            if cert is None:
+                cert = self._backend._ossl2cert(x509)
+            certs.append(cert)
+
+        return certs
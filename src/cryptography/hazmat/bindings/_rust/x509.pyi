@@ -7,14 +7,23 @@ def parse_csr_extension(
     der_oid: bytes, ext_data: bytes
 ) -> x509.ExtensionType: ...
 def parse_crl_entry_ext(der_oid: bytes, data: bytes) -> x509.ExtensionType: ...
-def parse_crl_extension(
-    der_oid: bytes, ext_data: bytes
-) -> x509.ExtensionType: ...
 def load_pem_x509_certificate(data: bytes) -> x509.Certificate: ...
+def load_pem_x509_certificates(
+    data: bytes, skip_non_certificates: bool
+) -> typing.List[x509.Certificate]: ...
 def load_der_x509_certificate(data: bytes) -> x509.Certificate: ...
+def load_pem_x509_crl(data: bytes) -> x509.CertificateRevocationList: ...
+def load_der_x509_crl(data: bytes) -> x509.CertificateRevocationList: ...
+def certificate_index_keys(
+    cert: x509.Certificate,
+) -> typing.Tuple[
+    bytes, bytes, int, typing.Optional[bytes], typing.Optional[bytes]
+]: ...
 def encode_precertificate_signed_certificate_timestamps(
     extension: x509.PrecertificateSignedCertificateTimestamps,
 ) -> bytes: ...
 
 class Sct: ...
 class Certificate: ...
+class RevokedCertificate: ...
+class CertificateRevocationList: ...
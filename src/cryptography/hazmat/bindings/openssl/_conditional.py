@@ -254,6 +254,12 @@ def cryptography_has_dtls_get_data_mtu():
     ]
 
 
+def cryptography_has_dh_new_by_nid():
+    return [
+        "DH_new_by_nid",
+    ]
+
+
 # This is a mapping of
 # {condition: function-returning-names-dependent-on-that-condition} so we can
 # loop over them and delete unsupported names at runtime. It will be removed
@@ -305,4 +311,5 @@ CONDITIONAL_NAMES = {
         cryptography_has_op_no_renegotiation
     ),
     "Cryptography_HAS_DTLS_GET_DATA_MTU": cryptography_has_dtls_get_data_mtu,
+    "Cryptography_HAS_DH_NEW_BY_NID": cryptography_has_dh_new_by_nid,
 }
@@ -4,6 +4,7 @@
 
 
 import abc
+import threading
 import typing
 
 from cryptography.hazmat.backends import _get_backend
@@ -15,10 +16,22 @@ _MIN_MODULUS_SIZE = 512
 
 
 def generate_parameters(
-    generator: int, key_size: int, backend: typing.Optional[Backend] = None
+    generator: int,
+    key_size: int,
+    backend: typing.Optional[Backend] = None,
+    *,
+    workers: int = 1,
+    progress: typing.Optional[typing.Callable[[int], None]] = None,
+    cancel: typing.Optional[threading.Event] = None,
 ) -> "DHParameters":
     backend = _get_backend(backend)
-    return backend.generate_dh_parameters(generator, key_size)
+    return backend.generate_dh_parameters(
+        generator,
+        key_size,
+        workers=workers,
+        progress=progress,
+        cancel=cancel,
+    )
 
 
 class DHParameterNumbers(object):
@@ -237,3 +250,50 @@ class DHPrivateKey(metaclass=abc.ABCMeta):
 
 
 DHPrivateKeyWithSerialization = DHPrivateKey
+
+
+class _NamedDHParameters(DHParameters):
+    """
+    One of the RFC 7919 groups. The backend's parameters are created the
+    first time they are used, and then shared by every caller.
+    """
+
+    def __init__(self, name: str):
+        self._name = name
+        self._parameters: typing.Optional[DHParameters] = None
+        self._numbers: typing.Optional[DHParameterNumbers] = None
+
+    def __repr__(self) -> str:
+        return "<DHParameters(name={})>".format(self._name)
+
+    def _backend_parameters(self) -> DHParameters:
+        if self._parameters is None:
+            backend = _get_backend(None)
+            self._parameters = backend.load_dh_named_group(self._name)
+        return self._parameters
+
+    @property
+    def _dh_cdata(self):
+        return self._backend_parameters()._dh_cdata  # type: ignore
+
+    def generate_private_key(self) -> "DHPrivateKey":
+        return self._backend_parameters().generate_private_key()
+
+    def parameter_bytes(
+        self,
+        encoding: "serialization.Encoding",
+        format: "serialization.ParameterFormat",
+    ) -> bytes:
+        return self._backend_parameters().parameter_bytes(encoding, format)
+
+    def parameter_numbers(self) -> DHParameterNumbers:
+        if self._numbers is None:
+            self._numbers = self._backend_parameters().parameter_numbers()
+        return self._numbers
+
+
+FFDHE2048 = _NamedDHParameters("ffdhe2048")
+FFDHE3072 = _NamedDHParameters("ffdhe3072")
+FFDHE4096 = _NamedDHParameters("ffdhe4096")
+FFDHE6144 = _NamedDHParameters("ffdhe6144")
+FFDHE8192 = _NamedDHParameters("ffdhe8192")
@@ -4,6 +4,7 @@
 
 
 import abc
+import threading
 import typing
 
 from cryptography.hazmat.backends import _get_backend
@@ -262,10 +263,17 @@ class DSAPrivateNumbers(object):
 
 
 def generate_parameters(
-    key_size: int, backend: typing.Optional[Backend] = None
+    key_size: int,
+    backend: typing.Optional[Backend] = None,
+    *,
+    workers: int = 1,
+    progress: typing.Optional[typing.Callable[[int], None]] = None,
+    cancel: typing.Optional[threading.Event] = None,
 ) -> DSAParameters:
     backend = _get_backend(backend)
-    return backend.generate_dsa_parameters(key_size)
+    return backend.generate_dsa_parameters(
+        key_size, workers=workers, progress=progress, cancel=cancel
+    )
 
 
 def generate_private_key(
@@ -84,6 +84,20 @@ class EllipticCurvePrivateKey(metaclass=abc.ABCMeta):
         provided peer's public key.
         """
 
+    def exchange_many(
+        self,
+        algorithm: "ECDH",
+        peer_public_keys: typing.Iterable["EllipticCurvePublicKey"],
+    ) -> typing.List[bytes]:
+        """
+        Performs a key exchange with each of the provided peers' public keys,
+        returning a list of shared keys.
+        """
+        return [
+            self.exchange(algorithm, peer_public_key)
+            for peer_public_key in peer_public_keys
+        ]
+
     @abc.abstractmethod
     def public_key(self) -> "EllipticCurvePublicKey":
         """
@@ -112,6 +126,16 @@ class EllipticCurvePrivateKey(metaclass=abc.ABCMeta):
         Signs the data
         """
 
+    def sign_many(
+        self,
+        data: typing.Iterable[bytes],
+        signature_algorithm: EllipticCurveSignatureAlgorithm,
+    ) -> typing.List[bytes]:
+        """
+        Signs each item of data, returning a list of signatures.
+        """
+        return [self.sign(item, signature_algorithm) for item in data]
+
     @abc.abstractmethod
     def private_numbers(self) -> "EllipticCurvePrivateNumbers":
         """
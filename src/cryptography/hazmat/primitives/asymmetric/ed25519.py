@@ -4,6 +4,7 @@
 
 
 import abc
+import typing
 
 from cryptography.exceptions import UnsupportedAlgorithm, _Reasons
 from cryptography.hazmat.primitives import _serialization
@@ -14,6 +15,8 @@ _ED25519_SIG_SIZE = 64
 
 
 class Ed25519PublicKey(metaclass=abc.ABCMeta):
+    __slots__ = ()
+
     @classmethod
     def from_public_bytes(cls, data: bytes) -> "Ed25519PublicKey":
         from cryptography.hazmat.backends.openssl.backend import backend
@@ -26,6 +29,20 @@ class Ed25519PublicKey(metaclass=abc.ABCMeta):
 
         return backend.ed25519_load_public_bytes(data)
 
+    @classmethod
+    def from_public_bytes_many(
+        cls, data: typing.Iterable[bytes]
+    ) -> typing.List["Ed25519PublicKey"]:
+        from cryptography.hazmat.backends.openssl.backend import backend
+
+        if not backend.ed25519_supported():
+            raise UnsupportedAlgorithm(
+                "ed25519 is not supported by this version of OpenSSL.",
+                _Reasons.UNSUPPORTED_PUBLIC_KEY_ALGORITHM,
+            )
+
+        return [backend.ed25519_load_public_bytes(item) for item in data]
+
     @abc.abstractmethod
     def public_bytes(
         self,
@@ -90,3 +107,9 @@ class Ed25519PrivateKey(metaclass=abc.ABCMeta):
         """
         Signs the data.
         """
+
+    def sign_many(self, data: typing.Iterable[bytes]) -> typing.List[bytes]:
+        """
+        Signs each item of data, returning a list of signatures.
+        """
+        return [self.sign(item) for item in data]
@@ -4,12 +4,15 @@
 
 
 import abc
+import typing
 
 from cryptography.exceptions import UnsupportedAlgorithm, _Reasons
 from cryptography.hazmat.primitives import _serialization
 
 
 class Ed448PublicKey(metaclass=abc.ABCMeta):
+    __slots__ = ()
+
     @classmethod
     def from_public_bytes(cls, data: bytes) -> "Ed448PublicKey":
         from cryptography.hazmat.backends.openssl.backend import backend
@@ -22,6 +25,20 @@ class Ed448PublicKey(metaclass=abc.ABCMeta):
 
         return backend.ed448_load_public_bytes(data)
 
+    @classmethod
+    def from_public_bytes_many(
+        cls, data: typing.Iterable[bytes]
+    ) -> typing.List["Ed448PublicKey"]:
+        from cryptography.hazmat.backends.openssl.backend import backend
+
+        if not backend.ed448_supported():
+            raise UnsupportedAlgorithm(
+                "ed448 is not supported by this version of OpenSSL.",
+                _Reasons.UNSUPPORTED_PUBLIC_KEY_ALGORITHM,
+            )
+
+        return [backend.ed448_load_public_bytes(item) for item in data]
+
     @abc.abstractmethod
     def public_bytes(
         self,
@@ -4,6 +4,7 @@
 
 
 import abc
+import threading
 import typing
 from math import gcd
 
@@ -57,6 +58,17 @@ class RSAPrivateKey(metaclass=abc.ABCMeta):
         Signs the data.
         """
 
+    def sign_many(
+        self,
+        data: typing.Iterable[bytes],
+        padding: AsymmetricPadding,
+        algorithm: typing.Union[asym_utils.Prehashed, hashes.HashAlgorithm],
+    ) -> typing.List[bytes]:
+        """
+        Signs each item of data, returning a list of signatures.
+        """
+        return [self.sign(item, padding, algorithm) for item in data]
+
     @abc.abstractmethod
     def private_numbers(self) -> "RSAPrivateNumbers":
         """
@@ -149,6 +161,10 @@ def generate_private_key(
     public_exponent: int,
     key_size: int,
     backend: typing.Optional[Backend] = None,
+    *,
+    workers: int = 1,
+    progress: typing.Optional[typing.Callable[[int], None]] = None,
+    cancel: typing.Optional[threading.Event] = None,
 ) -> RSAPrivateKey:
     backend = _get_backend(backend)
     if not isinstance(backend, RSABackend):
@@ -158,7 +174,13 @@ def generate_private_key(
         )
 
     _verify_rsa_parameters(public_exponent, key_size)
-    return backend.generate_rsa_private_key(public_exponent, key_size)
+    return backend.generate_rsa_private_key(
+        public_exponent,
+        key_size,
+        workers=workers,
+        progress=progress,
+        cancel=cancel,
+    )
 
 
 def _verify_rsa_parameters(public_exponent: int, key_size: int) -> None:
@@ -364,10 +386,15 @@ class RSAPrivateNumbers(object):
     public_numbers = property(lambda self: self._public_numbers)
 
     def private_key(
-        self, backend: typing.Optional[Backend] = None
+        self,
+        backend: typing.Optional[Backend] = None,
+        *,
+        unsafe_skip_rsa_key_validation: bool = False,
     ) -> RSAPrivateKey:
         backend = _get_backend(backend)
-        return backend.load_rsa_private_numbers(self)
+        return backend.load_rsa_private_numbers(
+            self, unsafe_skip_rsa_key_validation
+        )
 
     def __eq__(self, other):
         if not isinstance(other, RSAPrivateNumbers):
@@ -3,6 +3,12 @@
 # for complete details.
 
 
+import collections
+import os
+import threading
+import typing
+
+from cryptography.exceptions import InvalidSignature
 from cryptography.hazmat.bindings._rust import asn1
 from cryptography.hazmat.primitives import hashes
 
@@ -20,3 +26,137 @@ class Prehashed(object):
         self._digest_size = algorithm.digest_size
 
     digest_size = property(lambda self: self._digest_size)
+
+
+def verify_many(
+    signatures: typing.Iterable[typing.Tuple[typing.Any, ...]],
+) -> typing.List[bool]:
+    # Nothing is shared between the items: the signature check itself, not
+    # setting up OpenSSL for it, is what verification costs.
+    results = []
+    for public_key, signature, data, *args in signatures:
+        try:
+            public_key.verify(signature, data, *args)
+        except InvalidSignature:
+            results.append(False)
+        else:
+            results.append(True)
+
+    return results
+
+
+_K = typing.TypeVar("_K")
+
+
+class KeyPool(typing.Generic[_K]):
+    """
+    Keeps up to ``size`` keys generated ahead of time by background threads.
+    """
+
+    def __init__(
+        self,
+        generate_key: typing.Callable[[], _K],
+        size: int = 8,
+        workers: int = 1,
+    ) -> None:
+        if not callable(generate_key):
+            raise TypeError("generate_key must be callable.")
+
+        if not isinstance(size, int) or not isinstance(workers, int):
+            raise TypeError("size and workers must be integers.")
+
+        if size < 1 or workers < 1:
+            raise ValueError("size and workers must be at least 1.")
+
+        self._generate_key = generate_key
+        self._size = size
+        self._workers = workers
+        self._closed = False
+        self._reset()
+
+    size = property(lambda self: self._size)
+
+    def _reset(self) -> None:
+        # Keys and threads created in a parent process must never be used
+        # after a fork, or the parent and child would hand out the same
+        # keys. Everything, including the lock which another thread may
+        # have held at fork time, is recreated in the child.
+        self._pid = os.getpid()
+        self._cond = threading.Condition(threading.Lock())
+        self._keys: typing.Deque[_K] = collections.deque()
+        self._threads: typing.List[threading.Thread] = []
+
+    def _start(self) -> None:
+        if self._pid != os.getpid():
+            self._reset()
+
+        if len(self._threads) >= self._workers or self._closed:
+            return
+
+        with self._cond:
+            if self._closed:
+                return
+
+            # Workers that stopped after an error are replaced here.
+            for _ in range(self._workers - len(self._threads)):
+                thread = threading.Thread(target=self._refill, daemon=True)
+                thread.start()
+                self._threads.append(thread)
+
+    def _refill(self) -> None:
+        cond = self._cond
+        keys = self._keys
+        threads = self._threads
+        while True:
+            with cond:
+                while not self._closed and len(keys) >= self._size:
+                    cond.wait()
+
+                if self._closed:
+                    return
+
+            try:
+                key = self._generate_key()
+            except Exception:
+                # get() generates keys inline while the pool is empty, so
+                # the error is raised to the caller from there. The next
+                # get() starts a new worker in place of this one.
+                with cond:
+                    current = threading.current_thread()
+                    if current in threads:
+                        threads.remove(current)
+                return
+
+            with cond:
+                # Another worker may have filled the pool in the meantime.
+                if not self._closed and len(keys) < self._size:
+                    keys.append(key)
+
+    def get(self) -> _K:
+        self._start()
+        with self._cond:
+            if self._keys:
+                key = self._keys.popleft()
+                self._cond.notify()
+                return key
+
+        return self._generate_key()
+
+    def close(self) -> None:
+        if self._pid != os.getpid():
+            self._reset()
+
+        with self._cond:
+            self._closed = True
+            self._keys.clear()
+            self._cond.notify_all()
+            threads, self._threads = self._threads, []
+
+        for thread in threads:
+            thread.join()
+
+    def __enter__(self) -> "KeyPool[_K]":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
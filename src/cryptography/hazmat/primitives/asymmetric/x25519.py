@@ -4,12 +4,15 @@
 
 
 import abc
+import typing
 
 from cryptography.exceptions import UnsupportedAlgorithm, _Reasons
 from cryptography.hazmat.primitives import _serialization
 
 
 class X25519PublicKey(metaclass=abc.ABCMeta):
+    __slots__ = ()
+
     @classmethod
     def from_public_bytes(cls, data: bytes) -> "X25519PublicKey":
         from cryptography.hazmat.backends.openssl.backend import backend
@@ -22,6 +25,20 @@ class X25519PublicKey(metaclass=abc.ABCMeta):
 
         return backend.x25519_load_public_bytes(data)
 
+    @classmethod
+    def from_public_bytes_many(
+        cls, data: typing.Iterable[bytes]
+    ) -> typing.List["X25519PublicKey"]:
+        from cryptography.hazmat.backends.openssl.backend import backend
+
+        if not backend.x25519_supported():
+            raise UnsupportedAlgorithm(
+                "X25519 is not supported by this version of OpenSSL.",
+                _Reasons.UNSUPPORTED_EXCHANGE_ALGORITHM,
+            )
+
+        return [backend.x25519_load_public_bytes(item) for item in data]
+
     @abc.abstractmethod
     def public_bytes(
         self,
@@ -4,10 +4,36 @@
 
 
 import hmac
+import typing
+
+from cryptography import utils
+
+
+def _check_contiguous_byteslike(name: str, value: bytes) -> None:
+    utils._check_byteslike(name, value)
+    # hmac.compare_digest raises BufferError for buffers that aren't
+    # contiguous, such as a strided memoryview.
+    if not memoryview(value).c_contiguous:
+        raise TypeError(
+            "{} must be a contiguous bytes-like object".format(name)
+        )
 
 
 def bytes_eq(a: bytes, b: bytes) -> bool:
-    if not isinstance(a, bytes) or not isinstance(b, bytes):
-        raise TypeError("a and b must be bytes.")
+    _check_contiguous_byteslike("a", a)
+    _check_contiguous_byteslike("b", b)
 
     return hmac.compare_digest(a, b)
+
+
+def bytes_eq_any(candidate: bytes, expected: typing.Iterable[bytes]) -> bool:
+    _check_contiguous_byteslike("candidate", candidate)
+
+    # Every value is compared, and the results are combined without
+    # short-circuiting, so the time taken does not reveal which (if any)
+    # of them matched.
+    matched = False
+    for value in expected:
+        _check_contiguous_byteslike("expected", value)
+        matched |= hmac.compare_digest(candidate, value)
+    return matched
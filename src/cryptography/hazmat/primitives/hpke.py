@@ -0,0 +1,298 @@
+# This file is dual licensed under the terms of the Apache License, Version
+# 2.0, and the BSD License. See the LICENSE file in the root of this repository
+# for complete details.
+
+
+import typing
+
+from cryptography import exceptions, utils
+from cryptography.hazmat.primitives import hashes, hmac, serialization
+from cryptography.hazmat.primitives.asymmetric import x25519
+from cryptography.hazmat.primitives.ciphers.aead import (
+    AESGCM,
+    ChaCha20Poly1305,
+)
+from cryptography.hazmat.primitives.kdf.hkdf import HKDFExpand
+
+
+_MODE_BASE = b"\x00"
+_VERSION_LABEL = b"HPKE-v1"
+
+# The associated data of each chunk written by SenderContext.seal_chunks
+# starts with this label, the chunk's index in the stream and whether it is
+# the last chunk, which lets the recipient detect truncation. These have a
+# fixed length, so the caller's associated data that follows can't be
+# mistaken for them.
+_CHUNK_LABEL = b"HPKE-v1 chunk"
+_CHUNK_NOT_FINAL = b"\x00"
+_CHUNK_FINAL = b"\x01"
+
+
+class KEM(utils.Enum):
+    DHKEM_X25519_HKDF_SHA256 = 0x0020
+
+
+class KDF(utils.Enum):
+    HKDF_SHA256 = 0x0001
+    HKDF_SHA384 = 0x0002
+    HKDF_SHA512 = 0x0003
+
+
+class AEAD(utils.Enum):
+    AES_128_GCM = 0x0001
+    AES_256_GCM = 0x0002
+    CHACHA20_POLY1305 = 0x0003
+
+
+_KDF_HASHES = {
+    KDF.HKDF_SHA256: hashes.SHA256,
+    KDF.HKDF_SHA384: hashes.SHA384,
+    KDF.HKDF_SHA512: hashes.SHA512,
+}
+
+# Maps each AEAD to its implementation and key length. All of them use a
+# 12 byte nonce.
+_AEADS = {
+    AEAD.AES_128_GCM: (AESGCM, 16),
+    AEAD.AES_256_GCM: (AESGCM, 32),
+    AEAD.CHACHA20_POLY1305: (ChaCha20Poly1305, 32),
+}
+_NONCE_LENGTH = 12
+
+
+def _i2osp(value: int, length: int) -> bytes:
+    return value.to_bytes(length, byteorder="big")
+
+
+class _LabeledKDF(object):
+    def __init__(self, algorithm: hashes.HashAlgorithm, suite_id: bytes):
+        self._algorithm = algorithm
+        self._suite_id = suite_id
+
+    def extract(self, salt: bytes, label: bytes, ikm: bytes) -> bytes:
+        if not salt:
+            salt = b"\x00" * self._algorithm.digest_size
+
+        h = hmac.HMAC(salt, self._algorithm)
+        h.update(_VERSION_LABEL + self._suite_id + label + ikm)
+        return h.finalize()
+
+    def expand(
+        self, prk: bytes, label: bytes, info: bytes, length: int
+    ) -> bytes:
+        labeled_info = (
+            _i2osp(length, 2) + _VERSION_LABEL + self._suite_id + label + info
+        )
+        return HKDFExpand(self._algorithm, length, labeled_info).derive(prk)
+
+
+# DHKEM(X25519, HKDF-SHA256) always uses HKDF-SHA256, regardless of the KDF
+# chosen for the rest of the suite.
+_DHKEM_X25519 = _LabeledKDF(
+    hashes.SHA256(), b"KEM" + _i2osp(KEM.DHKEM_X25519_HKDF_SHA256.value, 2)
+)
+
+
+def _x25519_raw(public_key: x25519.X25519PublicKey) -> bytes:
+    return public_key.public_bytes(
+        serialization.Encoding.Raw, serialization.PublicFormat.Raw
+    )
+
+
+def _extract_and_expand(dh: bytes, kem_context: bytes) -> bytes:
+    eae_prk = _DHKEM_X25519.extract(b"", b"eae_prk", dh)
+    return _DHKEM_X25519.expand(eae_prk, b"shared_secret", kem_context, 32)
+
+
+class _Context(object):
+    def __init__(
+        self,
+        aead: AEAD,
+        key: bytes,
+        base_nonce: bytes,
+        kdf: _LabeledKDF,
+        exporter_secret: bytes,
+    ):
+        aead_cls, _ = _AEADS[aead]
+        self._aead = aead_cls(key)
+        self._base_nonce = int.from_bytes(base_nonce, byteorder="big")
+        self._kdf = kdf
+        self._exporter_secret = exporter_secret
+        self._seq = 0
+
+    def _compute_nonce(self) -> bytes:
+        if self._seq >= (1 << (8 * _NONCE_LENGTH)) - 1:
+            raise ValueError("The message limit for this context was reached.")
+
+        return _i2osp(self._base_nonce ^ self._seq, _NONCE_LENGTH)
+
+    def export(self, exporter_context: bytes, length: int) -> bytes:
+        utils._check_bytes("exporter_context", exporter_context)
+        return self._kdf.expand(
+            self._exporter_secret, b"sec", exporter_context, length
+        )
+
+
+class SenderContext(_Context):
+    def seal(self, plaintext: bytes, aad: bytes = b"") -> bytes:
+        ciphertext = self._aead.encrypt(self._compute_nonce(), plaintext, aad)
+        self._seq += 1
+        return ciphertext
+
+    def seal_chunks(
+        self, chunks: typing.Iterable[bytes], aad: bytes = b""
+    ) -> typing.Iterator[bytes]:
+        utils._check_bytes("aad", aad)
+        for index, (chunk, final) in enumerate(_mark_last(chunks)):
+            yield self.seal(chunk, _chunk_aad(aad, index, final))
+
+
+class RecipientContext(_Context):
+    def open(self, ciphertext: bytes, aad: bytes = b"") -> bytes:
+        plaintext = self._aead.decrypt(self._compute_nonce(), ciphertext, aad)
+        self._seq += 1
+        return plaintext
+
+    def open_chunks(
+        self, chunks: typing.Iterable[bytes], aad: bytes = b""
+    ) -> typing.Iterator[bytes]:
+        utils._check_bytes("aad", aad)
+        for index, (chunk, final) in enumerate(_mark_last(chunks)):
+            yield self.open(chunk, _chunk_aad(aad, index, final))
+
+
+def _chunk_aad(aad: bytes, index: int, final: bool) -> bytes:
+    return (
+        _CHUNK_LABEL
+        + _i2osp(index, 8)
+        + (_CHUNK_FINAL if final else _CHUNK_NOT_FINAL)
+        + aad
+    )
+
+
+def _mark_last(
+    chunks: typing.Iterable[bytes],
+) -> typing.Iterator[typing.Tuple[bytes, bool]]:
+    # An empty stream is sealed as a single empty final chunk, so that the
+    # recipient can tell it apart from a stream truncated to nothing.
+    chunks = iter(chunks)
+    chunk = next(chunks, b"")
+    for next_chunk in chunks:
+        yield chunk, False
+        chunk = next_chunk
+
+    yield chunk, True
+
+
+class Suite(object):
+    def __init__(self, kem: KEM, kdf: KDF, aead: AEAD):
+        if not isinstance(kem, KEM):
+            raise TypeError("kem must be a member of the KEM enum.")
+
+        if not isinstance(kdf, KDF):
+            raise TypeError("kdf must be a member of the KDF enum.")
+
+        if not isinstance(aead, AEAD):
+            raise TypeError("aead must be a member of the AEAD enum.")
+
+        self._kem = kem
+        self._kdf = kdf
+        self._aead = aead
+        self._labeled_kdf = _LabeledKDF(
+            _KDF_HASHES[kdf](),
+            b"HPKE"
+            + _i2osp(kem.value, 2)
+            + _i2osp(kdf.value, 2)
+            + _i2osp(aead.value, 2),
+        )
+
+    kem = utils.read_only_property("_kem")
+    kdf = utils.read_only_property("_kdf")
+    aead = utils.read_only_property("_aead")
+
+    def _key_schedule(self, shared_secret: bytes, info: bytes, context_cls):
+        kdf = self._labeled_kdf
+        _, key_length = _AEADS[self._aead]
+        psk_id_hash = kdf.extract(b"", b"psk_id_hash", b"")
+        info_hash = kdf.extract(b"", b"info_hash", info)
+        key_schedule_context = _MODE_BASE + psk_id_hash + info_hash
+        secret = kdf.extract(shared_secret, b"secret", b"")
+        return context_cls(
+            self._aead,
+            kdf.expand(secret, b"key", key_schedule_context, key_length),
+            kdf.expand(
+                secret, b"base_nonce", key_schedule_context, _NONCE_LENGTH
+            ),
+            kdf,
+            kdf.expand(
+                secret,
+                b"exp",
+                key_schedule_context,
+                self._labeled_kdf._algorithm.digest_size,
+            ),
+        )
+
+    def _setup_sender(
+        self,
+        public_key: x25519.X25519PublicKey,
+        info: bytes,
+        ephemeral_key: x25519.X25519PrivateKey,
+    ) -> typing.Tuple[bytes, SenderContext]:
+        if not isinstance(public_key, x25519.X25519PublicKey):
+            raise TypeError("public_key must be an X25519PublicKey.")
+
+        utils._check_bytes("info", info)
+        enc = _x25519_raw(ephemeral_key.public_key())
+        shared_secret = _extract_and_expand(
+            ephemeral_key.exchange(public_key), enc + _x25519_raw(public_key)
+        )
+        return enc, self._key_schedule(shared_secret, info, SenderContext)
+
+    def setup_sender(
+        self, public_key: x25519.X25519PublicKey, info: bytes = b""
+    ) -> typing.Tuple[bytes, SenderContext]:
+        return self._setup_sender(
+            public_key, info, x25519.X25519PrivateKey.generate()
+        )
+
+    def setup_recipient(
+        self,
+        enc: bytes,
+        private_key: x25519.X25519PrivateKey,
+        info: bytes = b"",
+    ) -> RecipientContext:
+        if not isinstance(private_key, x25519.X25519PrivateKey):
+            raise TypeError("private_key must be an X25519PrivateKey.")
+
+        utils._check_bytes("enc", enc)
+        utils._check_bytes("info", info)
+        ephemeral_public_key = x25519.X25519PublicKey.from_public_bytes(enc)
+        shared_secret = _extract_and_expand(
+            private_key.exchange(ephemeral_public_key),
+            enc + _x25519_raw(private_key.public_key()),
+        )
+        return self._key_schedule(shared_secret, info, RecipientContext)
+
+    def seal(
+        self,
+        public_key: x25519.X25519PublicKey,
+        plaintext: bytes,
+        info: bytes = b"",
+        aad: bytes = b"",
+    ) -> bytes:
+        enc, context = self.setup_sender(public_key, info)
+        return enc + context.seal(plaintext, aad)
+
+    def open(
+        self,
+        private_key: x25519.X25519PrivateKey,
+        ciphertext: bytes,
+        info: bytes = b"",
+        aad: bytes = b"",
+    ) -> bytes:
+        utils._check_bytes("ciphertext", ciphertext)
+        if len(ciphertext) < 32:
+            raise exceptions.InvalidTag
+
+        context = self.setup_recipient(ciphertext[:32], private_key, info)
+        return context.open(ciphertext[32:], aad)
@@ -13,6 +13,7 @@ from cryptography.hazmat.primitives._serialization import (
     PublicFormat,
 )
 from cryptography.hazmat.primitives.serialization.base import (
+    KeyCache,
     load_der_parameters,
     load_der_private_key,
     load_der_public_key,
@@ -42,4 +43,5 @@ __all__ = [
     "KeySerializationEncryption",
     "BestAvailableEncryption",
     "NoEncryption",
+    "KeyCache",
 ]
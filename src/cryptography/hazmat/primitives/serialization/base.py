@@ -3,8 +3,12 @@
 # for complete details.
 
 
+import collections
+import hashlib
+import threading
 import typing
 
+from cryptography import utils
 from cryptography.hazmat.backends import _get_backend
 from cryptography.hazmat.backends.interfaces import Backend
 from cryptography.hazmat.primitives.asymmetric import dh
@@ -18,9 +22,13 @@ def load_pem_private_key(
     data: bytes,
     password: typing.Optional[bytes],
     backend: typing.Optional[Backend] = None,
+    *,
+    unsafe_skip_rsa_key_validation: bool = False,
 ) -> PRIVATE_KEY_TYPES:
     backend = _get_backend(backend)
-    return backend.load_pem_private_key(data, password)
+    return backend.load_pem_private_key(
+        data, password, unsafe_skip_rsa_key_validation
+    )
 
 
 def load_pem_public_key(
@@ -41,9 +49,13 @@ def load_der_private_key(
     data: bytes,
     password: typing.Optional[bytes],
     backend: typing.Optional[Backend] = None,
+    *,
+    unsafe_skip_rsa_key_validation: bool = False,
 ) -> PRIVATE_KEY_TYPES:
     backend = _get_backend(backend)
-    return backend.load_der_private_key(data, password)
+    return backend.load_der_private_key(
+        data, password, unsafe_skip_rsa_key_validation
+    )
 
 
 def load_der_public_key(
@@ -58,3 +70,132 @@ def load_der_parameters(
 ) -> "dh.DHParameters":
     backend = _get_backend(backend)
     return backend.load_der_parameters(data)
+
+
+class KeyCache(object):
+    """
+    A size bounded, least recently used cache of deserialized keys.
+
+    Entries are keyed on a SHA-256 digest of the serialized key (and of the
+    password, if any) so repeatedly loading the same key returns the same
+    key object without parsing it again.
+    """
+
+    def __init__(self, maxsize: int = 128) -> None:
+        if not isinstance(maxsize, int):
+            raise TypeError("maxsize must be an integer.")
+
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1.")
+
+        self._maxsize = maxsize
+        self._lock = threading.Lock()
+        self._keys: "collections.OrderedDict[typing.Tuple, typing.Any]" = (
+            collections.OrderedDict()
+        )
+        self._hits = 0
+        self._misses = 0
+
+    maxsize = utils.read_only_property("_maxsize")
+    hits = utils.read_only_property("_hits")
+    misses = utils.read_only_property("_misses")
+
+    @property
+    def currsize(self) -> int:
+        return len(self._keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._keys.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def _load(self, cache_key, loader, *args, **kwargs):
+        with self._lock:
+            key = self._keys.get(cache_key)
+            if key is not None:
+                self._keys.move_to_end(cache_key)
+                self._hits += 1
+                return key
+
+            self._misses += 1
+
+        # Parsing happens outside the lock so that a slow load does not
+        # block lookups of other keys.
+        key = loader(*args, **kwargs)
+
+        with self._lock:
+            key = self._keys.setdefault(cache_key, key)
+            self._keys.move_to_end(cache_key)
+            while len(self._keys) > self._maxsize:
+                self._keys.popitem(last=False)
+
+        return key
+
+    def _private_cache_key(
+        self,
+        name: str,
+        data: bytes,
+        password: typing.Optional[bytes],
+        unsafe_skip_rsa_key_validation: bool,
+    ) -> typing.Tuple:
+        if password is None:
+            password_digest = None
+        else:
+            utils._check_byteslike("password", password)
+            password_digest = hashlib.sha256(password).digest()
+
+        return (
+            name,
+            hashlib.sha256(data).digest(),
+            password_digest,
+            bool(unsafe_skip_rsa_key_validation),
+        )
+
+    def load_pem_private_key(
+        self,
+        data: bytes,
+        password: typing.Optional[bytes],
+        *,
+        unsafe_skip_rsa_key_validation: bool = False,
+    ) -> PRIVATE_KEY_TYPES:
+        return self._load(
+            self._private_cache_key(
+                "pem_private", data, password, unsafe_skip_rsa_key_validation
+            ),
+            load_pem_private_key,
+            data,
+            password,
+            unsafe_skip_rsa_key_validation=unsafe_skip_rsa_key_validation,
+        )
+
+    def load_der_private_key(
+        self,
+        data: bytes,
+        password: typing.Optional[bytes],
+        *,
+        unsafe_skip_rsa_key_validation: bool = False,
+    ) -> PRIVATE_KEY_TYPES:
+        return self._load(
+            self._private_cache_key(
+                "der_private", data, password, unsafe_skip_rsa_key_validation
+            ),
+            load_der_private_key,
+            data,
+            password,
+            unsafe_skip_rsa_key_validation=unsafe_skip_rsa_key_validation,
+        )
+
+    def load_pem_public_key(self, data: bytes) -> PUBLIC_KEY_TYPES:
+        return self._load(
+            ("pem_public", hashlib.sha256(data).digest()),
+            load_pem_public_key,
+            data,
+        )
+
+    def load_der_public_key(self, data: bytes) -> PUBLIC_KEY_TYPES:
+        return self._load(
+            ("der_public", hashlib.sha256(data).digest()),
+            load_der_public_key,
+            data,
+        )
@@ -12,10 +12,14 @@ from cryptography.exceptions import UnsupportedAlgorithm, _Reasons
 from cryptography.hazmat.backends import _get_backend
 from cryptography.hazmat.backends.interfaces import Backend, HMACBackend
 from cryptography.hazmat.primitives import constant_time, hmac
-from cryptography.hazmat.primitives.hashes import SHA1, SHA256, SHA512
+from cryptography.hazmat.primitives.hashes import (
+    HashContext,
+    SHA1,
+    SHA256,
+    SHA512,
+)
 from cryptography.hazmat.primitives.twofactor import InvalidToken
 
-
 _ALLOWED_HASH_TYPES = typing.Union[SHA1, SHA256, SHA512]
 
 
@@ -49,6 +53,58 @@ def _generate_uri(
     return "otpauth://{type}/{label}?{parameters}".format(**uriparts)
 
 
+def _check_parameters(
+    length: int,
+    algorithm: _ALLOWED_HASH_TYPES,
+    backend: typing.Optional[Backend],
+) -> HMACBackend:
+    backend = _get_backend(backend)
+    if not isinstance(backend, HMACBackend):
+        raise UnsupportedAlgorithm(
+            "Backend object does not implement HMACBackend.",
+            _Reasons.BACKEND_MISSING_INTERFACE,
+        )
+
+    if not isinstance(length, int):
+        raise TypeError("Length parameter must be an integer type.")
+
+    if length < 6 or length > 8:
+        raise ValueError("Length of HOTP has to be between 6 to 8.")
+
+    if not isinstance(algorithm, (SHA1, SHA256, SHA512)):
+        raise TypeError("Algorithm must be SHA1, SHA256 or SHA512.")
+
+    return backend
+
+
+def _check_key_length(key: bytes, enforce_key_length: bool) -> None:
+    if len(key) < 16 and enforce_key_length is True:
+        raise ValueError("Key length has to be at least 128 bits.")
+
+
+def _dynamic_truncate(ctx: HashContext, counter: int) -> int:
+    ctx = ctx.copy()
+    ctx.update(struct.pack(">Q", counter))
+    hmac_value = ctx.finalize()
+
+    offset = hmac_value[len(hmac_value) - 1] & 0b1111
+    p = hmac_value[offset : offset + 4]
+    return struct.unpack(">I", p)[0] & 0x7FFFFFFF
+
+
+def _generate(ctx: HashContext, counter: int, length: int) -> bytes:
+    hotp = _dynamic_truncate(ctx, counter) % (10 ** length)
+    return "{0:0{1}}".format(hotp, length).encode()
+
+
+def _check_window(window: int) -> None:
+    if not isinstance(window, int):
+        raise TypeError("window must be an integer.")
+
+    if window < 0:
+        raise ValueError("window must be a non-negative integer.")
+
+
 class HOTP(object):
     def __init__(
         self,
@@ -58,47 +114,43 @@ class HOTP(object):
         backend: typing.Optional[Backend] = None,
         enforce_key_length: bool = True,
     ) -> None:
-        backend = _get_backend(backend)
-        if not isinstance(backend, HMACBackend):
-            raise UnsupportedAlgorithm(
-                "Backend object does not implement HMACBackend.",
-                _Reasons.BACKEND_MISSING_INTERFACE,
-            )
-
-        if len(key) < 16 and enforce_key_length is True:
-            raise ValueError("Key length has to be at least 128 bits.")
-
-        if not isinstance(length, int):
-            raise TypeError("Length parameter must be an integer type.")
-
-        if length < 6 or length > 8:
-            raise ValueError("Length of HOTP has to be between 6 to 8.")
-
-        if not isinstance(algorithm, (SHA1, SHA256, SHA512)):
-            raise TypeError("Algorithm must be SHA1, SHA256 or SHA512.")
+        backend = _check_parameters(length, algorithm, backend)
+        _check_key_length(key, enforce_key_length)
 
         self._key = key
         self._length = length
         self._algorithm = algorithm
         self._backend = backend
+        # Keyed once; every counter works on a copy of this context so the
+        # key schedule is not recomputed per generated value.
+        self._hmac = hmac.HMAC(key, algorithm, backend)
 
     def generate(self, counter: int) -> bytes:
-        truncated_value = self._dynamic_truncate(counter)
-        hotp = truncated_value % (10 ** self._length)
-        return "{0:0{1}}".format(hotp, self._length).encode()
-
-    def verify(self, hotp: bytes, counter: int) -> None:
-        if not constant_time.bytes_eq(self.generate(counter), hotp):
+        return _generate(self._hmac, counter, self._length)
+
+    def generate_range(
+        self, counter_start: int, count: int
+    ) -> typing.List[bytes]:
+        if not isinstance(count, int):
+            raise TypeError("count must be an integer.")
+
+        if count < 0:
+            raise ValueError("count must be a non-negative integer.")
+
+        return [
+            self.generate(counter)
+            for counter in range(counter_start, counter_start + count)
+        ]
+
+    def verify(self, hotp: bytes, counter: int, window: int = 0) -> None:
+        _check_window(window)
+        if not constant_time.bytes_eq_any(
+            hotp, self.generate_range(counter, window + 1)
+        ):
             raise InvalidToken("Supplied HOTP value does not match.")
 
     def _dynamic_truncate(self, counter: int) -> int:
-        ctx = hmac.HMAC(self._key, self._algorithm, self._backend)
-        ctx.update(struct.pack(">Q", counter))
-        hmac_value = ctx.finalize()
-
-        offset = hmac_value[len(hmac_value) - 1] & 0b1111
-        p = hmac_value[offset : offset + 4]
-        return struct.unpack(">I", p)[0] & 0x7FFFFFFF
+        return _dynamic_truncate(self._hmac, counter)
 
     def get_provisioning_uri(
         self, account_name: str, counter: int, issuer: typing.Optional[str]
@@ -12,10 +12,48 @@ from cryptography.hazmat.primitives.twofactor import InvalidToken
 from cryptography.hazmat.primitives.twofactor.hotp import (
     HOTP,
     _ALLOWED_HASH_TYPES,
+    _check_key_length,
+    _check_parameters,
+    _check_window,
+    _generate,
     _generate_uri,
 )
 
 
+def verify_many(
+    tokens: typing.Iterable[
+        typing.Tuple[bytes, bytes, typing.Union[int, float]]
+    ],
+    length: int,
+    algorithm: _ALLOWED_HASH_TYPES,
+    time_step: int,
+    backend: typing.Optional[Backend] = None,
+    enforce_key_length: bool = True,
+    window: int = 0,
+) -> typing.List[bool]:
+    backend = _check_parameters(length, algorithm, backend)
+    _check_window(window)
+
+    results = []
+    for key, totp, time in tokens:
+        # One bad key fails its own token rather than the whole batch.
+        try:
+            _check_key_length(key, enforce_key_length)
+        except ValueError:
+            results.append(False)
+            continue
+
+        ctx = backend.create_hmac_ctx(key, algorithm)
+        counter = int(time / time_step)
+        candidates = [
+            _generate(ctx, c, length)
+            for c in range(max(counter - window, 0), counter + window + 1)
+        ]
+        results.append(constant_time.bytes_eq_any(totp, candidates))
+
+    return results
+
+
 class TOTP(object):
     def __init__(
         self,
@@ -40,8 +78,14 @@ class TOTP(object):
         counter = int(time / self._time_step)
         return self._hotp.generate(counter)
 
-    def verify(self, totp: bytes, time: int) -> None:
-        if not constant_time.bytes_eq(self.generate(time), totp):
+    def verify(self, totp: bytes, time: int, window: int = 0) -> None:
+        _check_window(window)
+        counter = int(time / self._time_step)
+        start = max(counter - window, 0)
+        candidates = self._hotp.generate_range(
+            start, counter + window + 1 - start
+        )
+        if not constant_time.bytes_eq_any(totp, candidates):
             raise InvalidToken("Supplied TOTP value does not match.")
 
     def get_provisioning_uri(
@@ -24,7 +24,16 @@ from cryptography.hazmat.primitives.asymmetric.types import (
     PRIVATE_KEY_TYPES,
     PUBLIC_KEY_TYPES,
 )
-from cryptography.x509.extensions import Extension, ExtensionType, Extensions
+from cryptography.x509.extensions import (
+    CRLNumber,
+    CRLReason,
+    DeltaCRLIndicator,
+    Extension,
+    ExtensionNotFound,
+    ExtensionType,
+    Extensions,
+    ReasonFlags,
+)
 from cryptography.x509.name import Name
 from cryptography.x509.oid import ObjectIdentifier
 
@@ -214,6 +223,10 @@ class RevokedCertificate(metaclass=abc.ABCMeta):
         """
 
 
+# Runtime isinstance checks need this since the rust class is not a subclass.
+RevokedCertificate.register(rust_x509.RevokedCertificate)
+
+
 class CertificateRevocationList(metaclass=abc.ABCMeta):
     @abc.abstractmethod
     def public_bytes(self, encoding: serialization.Encoding) -> bytes:
@@ -236,6 +249,25 @@ class CertificateRevocationList(metaclass=abc.ABCMeta):
         is not in the CRL.
         """
 
+    def is_revoked(self, serial_number: int) -> bool:
+        """
+        Returns True if the serial_number is in the CRL.
+        """
+        return (
+            self.get_revoked_certificate_by_serial_number(serial_number)
+            is not None
+        )
+
+    def bulk_is_revoked(
+        self, serial_numbers: typing.Iterable[int]
+    ) -> typing.List[bool]:
+        """
+        Returns whether each of the serial_numbers is in the CRL.
+        """
+        return [
+            self.is_revoked(serial_number) for serial_number in serial_numbers
+        ]
+
     @abc.abstractproperty
     def signature_hash_algorithm(
         self,
@@ -334,6 +366,9 @@ class CertificateRevocationList(metaclass=abc.ABCMeta):
         """
 
 
+CertificateRevocationList.register(rust_x509.CertificateRevocationList)
+
+
 class CertificateSigningRequest(metaclass=abc.ABCMeta):
     @abc.abstractmethod
     def __eq__(self, other: object) -> bool:
@@ -425,6 +460,12 @@ def load_pem_x509_certificate(
     return rust_x509.load_pem_x509_certificate(data)
 
 
+def load_pem_x509_certificates(
+    data: bytes, *, skip_non_certificates: bool = False
+) -> typing.List[Certificate]:
+    return rust_x509.load_pem_x509_certificates(data, skip_non_certificates)
+
+
 # Backend argument preserved for API compatibility, but ignored.
 def load_der_x509_certificate(
     data: bytes, backend: typing.Any = None
@@ -446,18 +487,18 @@ def load_der_x509_csr(
     return backend.load_der_x509_csr(data)
 
 
+# Backend argument preserved for API compatibility, but ignored.
 def load_pem_x509_crl(
-    data: bytes, backend: typing.Optional[Backend] = None
+    data: bytes, backend: typing.Any = None
 ) -> CertificateRevocationList:
-    backend = _get_backend(backend)
-    return backend.load_pem_x509_crl(data)
+    return rust_x509.load_pem_x509_crl(data)
 
 
+# Backend argument preserved for API compatibility, but ignored.
 def load_der_x509_crl(
-    data: bytes, backend: typing.Optional[Backend] = None
+    data: bytes, backend: typing.Any = None
 ) -> CertificateRevocationList:
-    backend = _get_backend(backend)
-    return backend.load_der_x509_crl(data)
+    return rust_x509.load_der_x509_crl(data)
 
 
 class CertificateSigningRequestBuilder(object):
@@ -891,6 +932,58 @@ class CertificateRevocationListBuilder(object):
             self._revoked_certificates + [revoked_certificate],
         )
 
+    def delta_crl(
+        self,
+        base_crl: CertificateRevocationList,
+        removed_serial_numbers: typing.Iterable[int] = (),
+    ) -> "CertificateRevocationListBuilder":
+        """
+        Makes this a delta CRL against the base CRL.
+        """
+        if not isinstance(base_crl, CertificateRevocationList):
+            raise TypeError("base_crl must be a CertificateRevocationList")
+
+        try:
+            crl_number = base_crl.extensions.get_extension_for_class(
+                CRLNumber
+            ).value.crl_number
+        except ExtensionNotFound:
+            raise ValueError("The base CRL must have a CRL number")
+
+        builder = self._with_base_issuer(base_crl).add_extension(
+            DeltaCRLIndicator(crl_number), critical=True
+        )
+        for serial_number in removed_serial_numbers:
+            revoked = base_crl.get_revoked_certificate_by_serial_number(
+                serial_number
+            )
+            if revoked is None:
+                raise ValueError(
+                    "Serial number {} is not revoked by the base "
+                    "CRL".format(serial_number)
+                )
+            builder = builder.add_revoked_certificate(
+                RevokedCertificateBuilder(
+                    serial_number, revoked.revocation_date
+                )
+                .add_extension(
+                    CRLReason(ReasonFlags.remove_from_crl), critical=False
+                )
+                .build()
+            )
+
+        return builder
+
+    def _with_base_issuer(
+        self, base_crl: CertificateRevocationList
+    ) -> "CertificateRevocationListBuilder":
+        if self._issuer_name is None:
+            return self.issuer_name(base_crl.issuer)
+        if self._issuer_name != base_crl.issuer:
+            raise ValueError("The base CRL has a different issuer name")
+
+        return self
+
     def sign(
         self,
         private_key: PRIVATE_KEY_TYPES,
@@ -909,6 +1002,52 @@ class CertificateRevocationListBuilder(object):
 
         return backend.create_x509_crl(self, private_key, algorithm)
 
+    def sign_to_file(
+        self,
+        fileobj: typing.BinaryIO,
+        private_key: PRIVATE_KEY_TYPES,
+        algorithm: typing.Optional[hashes.HashAlgorithm],
+        revoked_certificates: typing.Iterable[
+            typing.Tuple[int, datetime.datetime, typing.Optional[ReasonFlags]]
+        ],
+    ) -> None:
+        if self._issuer_name is None:
+            raise ValueError("A CRL must have an issuer name")
+
+        if self._last_update is None:
+            raise ValueError("A CRL must have a last update time")
+
+        if self._next_update is None:
+            raise ValueError("A CRL must have a next update time")
+
+        from cryptography.hazmat.backends.openssl.backend import backend
+
+        backend.create_x509_crl_file(
+            self, private_key, algorithm, revoked_certificates, fileobj
+        )
+
+    def sign_incremental(
+        self,
+        base_crl: CertificateRevocationList,
+        private_key: PRIVATE_KEY_TYPES,
+        algorithm: typing.Optional[hashes.HashAlgorithm],
+    ) -> CertificateRevocationList:
+        if not isinstance(base_crl, CertificateRevocationList):
+            raise TypeError("base_crl must be a CertificateRevocationList")
+
+        builder = self._with_base_issuer(base_crl)
+        if builder._last_update is None:
+            raise ValueError("A CRL must have a last update time")
+
+        if builder._next_update is None:
+            raise ValueError("A CRL must have a next update time")
+
+        from cryptography.hazmat.backends.openssl.backend import backend
+
+        return backend.create_x509_crl_incremental(
+            builder, private_key, algorithm, base_crl
+        )
+
 
 class RevokedCertificateBuilder(object):
     def __init__(
@@ -95,14 +95,44 @@ class Extensions(object):
     def __init__(
         self, extensions: typing.Iterable["Extension[ExtensionType]"]
     ) -> None:
-        self._extensions = list(extensions)
+        self._extensions: typing.Sequence["Extension[ExtensionType]"] = list(
+            extensions
+        )
+        # Maps each OID's dotted string to the position of its extension,
+        # built on the first lookup.
+        self._indexes: typing.Optional[typing.Dict[str, int]] = None
+
+    @classmethod
+    def _from_raw(
+        cls,
+        raw_extensions: typing.Sequence["Extension[ExtensionType]"],
+        dotted_strings: typing.List[str],
+    ) -> "Extensions":
+        # raw_extensions decodes each extension the first time it's indexed,
+        # so lookups only decode the extension they find.
+        extensions = cls([])
+        extensions._extensions = raw_extensions
+        extensions._indexes = {
+            dotted_string: i for i, dotted_string in enumerate(dotted_strings)
+        }
+        return extensions
+
+    def _index_of(self, oid: ObjectIdentifier) -> typing.Optional[int]:
+        if self._indexes is None:
+            indexes: typing.Dict[str, int] = {}
+            for i, ext in enumerate(self._extensions):
+                indexes.setdefault(ext.oid.dotted_string, i)
+            self._indexes = indexes
+
+        return self._indexes.get(oid.dotted_string)
 
     def get_extension_for_oid(
         self, oid: ObjectIdentifier
     ) -> "Extension[ExtensionType]":
-        for ext in self:
-            if ext.oid == oid:
-                return ext
+        if isinstance(oid, ObjectIdentifier):
+            index = self._index_of(oid)
+            if index is not None:
+                return self._extensions[index]
 
         raise ExtensionNotFound("No {} extension was found".format(oid), oid)
 
@@ -116,7 +146,17 @@ class Extensions(object):
                 " class may be present."
             )
 
-        for ext in self:
+        oid = getattr(extclass, "oid", None)
+        candidates: typing.Iterable["Extension[ExtensionType]"]
+        if isinstance(oid, ObjectIdentifier):
+            index = self._index_of(oid)
+            candidates = [] if index is None else [self._extensions[index]]
+        else:
+            # Classes without an OID of their own, such as abstract bases,
+            # can match any extension.
+            candidates = self
+
+        for ext in candidates:
             if isinstance(ext.value, extclass):
                 return ext
 
@@ -127,7 +167,7 @@ class Extensions(object):
     __len__, __iter__, __getitem__ = _make_sequence_methods("_extensions")
 
     def __repr__(self) -> str:
-        return "<Extensions({})>".format(self._extensions)
+        return "<Extensions({})>".format(list(self))
 
 
 class CRLNumber(ExtensionType):
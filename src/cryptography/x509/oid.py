@@ -4,7 +4,7 @@
 
 import typing
 
-from cryptography.hazmat._oid import ObjectIdentifier
+from cryptography.hazmat._oid import ObjectIdentifier, _intern_oids
 from cryptography.hazmat.primitives import hashes
 
 
@@ -266,6 +266,24 @@ _OID_NAMES = {
     AttributeOID.CHALLENGE_PASSWORD: "challengePassword",
 }
 
+_intern_oids(
+    oid
+    for oid_class in (
+        AttributeOID,
+        AuthorityInformationAccessOID,
+        CRLEntryExtensionOID,
+        CertificatePoliciesOID,
+        ExtendedKeyUsageOID,
+        ExtensionOID,
+        NameOID,
+        OCSPExtensionOID,
+        SignatureAlgorithmOID,
+        SubjectInformationAccessOID,
+    )
+    for oid in vars(oid_class).values()
+    if isinstance(oid, ObjectIdentifier)
+)
+
 
 __all__ = [
     "AttributeOID",
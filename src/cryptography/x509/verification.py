@@ -0,0 +1,228 @@
+# This file is dual licensed under the terms of the Apache License, Version
+# 2.0, and the BSD License. See the LICENSE file in the root of this repository
+# for complete details.
+
+
+import collections
+import datetime
+import threading
+import typing
+
+from cryptography import utils
+from cryptography.hazmat.bindings._rust import x509 as rust_x509
+from cryptography.x509.base import Certificate, _convert_to_naive_utc_time
+from cryptography.x509.name import Name
+
+
+# The number of verified chains a Store remembers.
+_CHAIN_CACHE_SIZE = 1024
+
+
+class Purpose(utils.Enum):
+    SERVER_AUTH = "serverAuth"
+    CLIENT_AUTH = "clientAuth"
+
+
+class VerificationError(Exception):
+    pass
+
+
+class Store(object):
+    def __init__(self, certs: typing.Iterable[Certificate]):
+        certs = list(certs)
+        if not certs:
+            raise ValueError("A Store requires at least one certificate")
+
+        if not all(isinstance(cert, Certificate) for cert in certs):
+            raise TypeError("certs must be a list of Certificates")
+
+        from cryptography.hazmat.backends.openssl.backend import backend
+
+        self._store = backend.create_x509_store(certs)
+        # Maps (leaf, intermediates, purpose) to a verified chain and the
+        # period in which every certificate in it is valid. Without CRLs,
+        # the outcome of verifying a chain only changes with time.
+        self._chains: "collections.OrderedDict[typing.Any, typing.Any]" = (
+            collections.OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def verify(
+        self,
+        leaf: Certificate,
+        intermediates: typing.Iterable[Certificate] = (),
+        time: typing.Optional[datetime.datetime] = None,
+        purpose: typing.Optional[Purpose] = None,
+    ) -> typing.List[Certificate]:
+        if not isinstance(leaf, Certificate):
+            raise TypeError("leaf must be a Certificate")
+
+        intermediates = tuple(intermediates)
+        if not all(isinstance(cert, Certificate) for cert in intermediates):
+            raise TypeError("intermediates must be a list of Certificates")
+
+        if time is None:
+            time = datetime.datetime.utcnow()
+        elif isinstance(time, datetime.datetime):
+            time = _convert_to_naive_utc_time(time)
+        else:
+            raise TypeError("time must be a datetime")
+
+        if purpose is not None and not isinstance(purpose, Purpose):
+            raise TypeError("purpose must be a member of the Purpose enum")
+
+        key = (leaf, intermediates, purpose)
+        with self._lock:
+            cached = self._chains.get(key)
+            if cached is not None:
+                self._chains.move_to_end(key)
+
+        if cached is not None:
+            chain, not_before, not_after = cached
+            if not_before <= time <= not_after:
+                return list(chain)
+
+        chain = self._store.verify(leaf, intermediates, time, purpose)
+        not_before = max(cert.not_valid_before for cert in chain)
+        not_after = min(cert.not_valid_after for cert in chain)
+        with self._lock:
+            self._chains[key] = (chain, not_before, not_after)
+            if len(self._chains) > _CHAIN_CACHE_SIZE:
+                self._chains.popitem(last=False)
+
+        return list(chain)
+
+
+_IndexKeys = typing.Tuple[
+    bytes, bytes, int, typing.Optional[bytes], typing.Optional[bytes]
+]
+_Buckets = typing.DefaultDict[typing.Any, typing.List[Certificate]]
+
+
+class CertificateIndex(object):
+    def __init__(self, certs: typing.Iterable[Certificate] = ()):
+        # The index keys of every certificate, in insertion order.
+        self._keys: typing.Dict[Certificate, _IndexKeys] = {}
+        # Names are keyed by _name_key, which Rust computes from the DER
+        # without building Name objects.
+        self._by_subject: _Buckets = collections.defaultdict(list)
+        self._by_issuer: _Buckets = collections.defaultdict(list)
+        self._by_issuer_and_serial_number: _Buckets = collections.defaultdict(
+            list
+        )
+        self._by_ski: _Buckets = collections.defaultdict(list)
+        self._by_aki: _Buckets = collections.defaultdict(list)
+        self.extend(certs)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __iter__(self) -> typing.Iterator[Certificate]:
+        return iter(self._keys)
+
+    def __contains__(self, cert: object) -> bool:
+        return cert in self._keys
+
+    def add(self, cert: Certificate) -> None:
+        self.extend([cert])
+
+    def extend(self, certs: typing.Iterable[Certificate]) -> None:
+        certs = list(certs)
+        if not all(isinstance(cert, Certificate) for cert in certs):
+            raise TypeError("certs must be a list of Certificates")
+
+        for cert in certs:
+            if cert in self._keys:
+                continue
+
+            keys = rust_x509.certificate_index_keys(cert)
+            subject, issuer, serial_number, ski, aki = keys
+            self._keys[cert] = keys
+            self._by_subject[subject].append(cert)
+            self._by_issuer[issuer].append(cert)
+            self._by_issuer_and_serial_number[issuer, serial_number].append(
+                cert
+            )
+            if ski is not None:
+                self._by_ski[ski].append(cert)
+            if aki is not None:
+                self._by_aki[aki].append(cert)
+
+    def get_by_subject(self, name: Name) -> typing.List[Certificate]:
+        _check_name(name)
+        return list(self._by_subject.get(_name_key(name), ()))
+
+    def get_by_issuer(self, name: Name) -> typing.List[Certificate]:
+        _check_name(name)
+        return list(self._by_issuer.get(_name_key(name), ()))
+
+    def get_by_issuer_and_serial_number(
+        self, issuer: Name, serial_number: int
+    ) -> typing.List[Certificate]:
+        _check_name(issuer)
+        if not isinstance(serial_number, int):
+            raise TypeError("serial_number must be an integer")
+
+        return list(
+            self._by_issuer_and_serial_number.get(
+                (_name_key(issuer), serial_number), ()
+            )
+        )
+
+    def get_by_subject_key_identifier(
+        self, key_identifier: bytes
+    ) -> typing.List[Certificate]:
+        utils._check_bytes("key_identifier", key_identifier)
+        return list(self._by_ski.get(key_identifier, ()))
+
+    def get_by_authority_key_identifier(
+        self, key_identifier: bytes
+    ) -> typing.List[Certificate]:
+        utils._check_bytes("key_identifier", key_identifier)
+        return list(self._by_aki.get(key_identifier, ()))
+
+    def find_issuers(self, cert: Certificate) -> typing.List[Certificate]:
+        if not isinstance(cert, Certificate):
+            raise TypeError("cert must be a Certificate")
+
+        keys = self._keys.get(cert)
+        if keys is None:
+            keys = rust_x509.certificate_index_keys(cert)
+        _, issuer, _, _, aki = keys
+        candidates = self._by_subject.get(issuer, ())
+        if aki is None:
+            return list(candidates)
+
+        return [
+            candidate
+            for candidate in candidates
+            if self._keys[candidate][3] in (None, aki)
+        ]
+
+
+def _name_key(name: Name) -> bytes:
+    # The same key that Rust computes for an encoded Name, which is equal for
+    # two Names exactly when they compare equal: each attribute is its OID
+    # and value, length-prefixed, and each RDN is its number of distinct
+    # attributes followed by them in sorted order.
+    key = []
+    for rdn in name.rdns:
+        attributes = sorted(
+            {
+                _length_prefixed(attribute.oid.dotted_string.encode())
+                + _length_prefixed(attribute.value.encode("utf8"))
+                for attribute in rdn
+            }
+        )
+        key.append(len(attributes).to_bytes(4, "big"))
+        key.extend(attributes)
+    return b"".join(key)
+
+
+def _length_prefixed(data: bytes) -> bytes:
+    return len(data).to_bytes(4, "big") + data
+
+
+def _check_name(name: Name) -> None:
+    if not isinstance(name, Name):
+        raise TypeError("name must be a Name")
@@ -114,24 +114,11 @@ impl OCSPRequest {
 
     #[getter]
     fn extensions(&mut self, py: pyo3::Python<'_>) -> pyo3::PyResult<pyo3::PyObject> {
-        let x509_module = py.import("cryptography.x509")?;
         x509::parse_and_cache_extensions(
             py,
             &mut self.cached_extensions,
             &self.raw.borrow_value().tbs_request.request_extensions,
-            |oid, value| {
-                if oid == &*NONCE_OID {
-                    // This is a disaster. RFC 2560 says that the contents of the nonce is
-                    // just the raw extension value. This is nonsense, since they're always
-                    // supposed to be ASN.1 TLVs. RFC 6960 correctly specifies that the
-                    // nonce is an OCTET STRING, and so you should unwrap the TLV to get
-                    // the nonce. For now we just implement the old behavior, even though
-                    // it's deranged.
-                    Ok(Some(x509_module.call_method1("OCSPNonce", (value,))?))
-                } else {
-                    Ok(None)
-                }
-            },
+            parse_ocsp_req_extension,
         )
     }
 
@@ -193,6 +180,25 @@ struct CertID<'a> {
     serial_number: asn1::BigUint<'a>,
 }
 
+fn parse_ocsp_req_extension<'p>(
+    py: pyo3::Python<'p>,
+    oid: &asn1::ObjectIdentifier<'_>,
+    value: &[u8],
+) -> Result<Option<&'p pyo3::PyAny>, PyAsn1Error> {
+    let x509_module = py.import("cryptography.x509")?;
+    if oid == &*NONCE_OID {
+        // This is a disaster. RFC 2560 says that the contents of the nonce is
+        // just the raw extension value. This is nonsense, since they're always
+        // supposed to be ASN.1 TLVs. RFC 6960 correctly specifies that the
+        // nonce is an OCTET STRING, and so you should unwrap the TLV to get
+        // the nonce. For now we just implement the old behavior, even though
+        // it's deranged.
+        Ok(Some(x509_module.call_method1("OCSPNonce", (value,))?))
+    } else {
+        Ok(None)
+    }
+}
+
 #[pyo3::prelude::pyfunction]
 fn parse_ocsp_resp_extension(py: pyo3::Python<'_>, der_oid: &[u8], data: &[u8]) -> PyAsn1Result {
     let oid = asn1::ObjectIdentifier::from_der(der_oid).unwrap();
@@ -10,6 +10,7 @@ use std::collections::hash_map::DefaultHasher;
 use std::collections::HashSet;
 use std::convert::TryInto;
 use std::hash::{Hash, Hasher};
+use std::sync::Arc;
 
 lazy_static::lazy_static! {
     static ref TLS_FEATURE_OID: asn1::ObjectIdentifier<'static> = asn1::ObjectIdentifier::from_string("1.3.6.1.5.5.7.1.24").unwrap();
@@ -112,6 +113,9 @@ struct OwnedRawCertificate {
 struct Certificate {
     raw: OwnedRawCertificate,
     cached_extensions: Option<pyo3::PyObject>,
+    cached_public_key: pyo3::once_cell::GILOnceCell<pyo3::PyObject>,
+    // Fingerprints keyed by the hash algorithm's name and digest size.
+    cached_fingerprints: pyo3::once_cell::GILOnceCell<pyo3::Py<pyo3::types::PyDict>>,
 }
 
 #[pyo3::prelude::pyproto]
@@ -165,31 +169,70 @@ impl Certificate {
         slf
     }
 
-    fn public_key<'p>(&self, py: pyo3::Python<'p>) -> pyo3::PyResult<&'p pyo3::PyAny> {
-        // This makes an unnecessary copy. It'd be nice to get rid of it.
-        let serialized = pyo3::types::PyBytes::new(
-            py,
-            &asn1::write_single(&self.raw.borrow_value().tbs_cert.spki),
-        );
-        py.import("cryptography.hazmat.primitives.serialization")?
-            .getattr("load_der_public_key")?
-            .call1((serialized,))
+    fn public_key(&self, py: pyo3::Python<'_>) -> PyAsn1Result<pyo3::PyObject> {
+        if let Some(cached) = self.cached_public_key.get(py) {
+            return Ok(cached.clone_ref(py));
+        }
+
+        let load_der_public_key = match LOAD_DER_PUBLIC_KEY.get(py) {
+            Some(load_der_public_key) => load_der_public_key,
+            None => {
+                let load_der_public_key = py
+                    .import("cryptography.hazmat.primitives.serialization")?
+                    .getattr("load_der_public_key")?
+                    .to_object(py);
+                let _ = LOAD_DER_PUBLIC_KEY.set(py, load_der_public_key);
+                LOAD_DER_PUBLIC_KEY.get(py).unwrap()
+            }
+        };
+        let serialized =
+            pyo3::types::PyBytes::new(py, certificate_spki_bytes(self.raw.borrow_data())?);
+        let key = load_der_public_key.call1(py, (serialized,))?;
+        // Loading the key calls into Python, which can release the GIL, so
+        // another thread may have cached a key first. Everyone gets the
+        // same object either way.
+        let _ = self.cached_public_key.set(py, key);
+        Ok(self.cached_public_key.get(py).unwrap().clone_ref(py))
     }
 
-    fn fingerprint<'p>(
+    fn fingerprint(
         &self,
-        py: pyo3::Python<'p>,
-        algorithm: pyo3::PyObject,
-    ) -> pyo3::PyResult<&'p pyo3::PyAny> {
-        let hasher = py
-            .import("cryptography.hazmat.primitives.hashes")?
-            .getattr("Hash")?
-            .call1((algorithm,))?;
-        // This makes an unnecessary copy. It'd be nice to get rid of it.
-        let serialized =
-            pyo3::types::PyBytes::new(py, &asn1::write_single(&self.raw.borrow_value()));
-        hasher.call_method1("update", (serialized,))?;
-        hasher.call_method0("finalize")
+        py: pyo3::Python<'_>,
+        algorithm: &pyo3::PyAny,
+    ) -> pyo3::PyResult<pyo3::PyObject> {
+        let hashes_mod = py.import("cryptography.hazmat.primitives.hashes")?;
+        let hash_algorithm_class: &pyo3::types::PyType =
+            hashes_mod.getattr("HashAlgorithm")?.downcast()?;
+        // Anything that isn't a HashAlgorithm is left to Hash to reject.
+        let key = if hash_algorithm_class.is_instance(algorithm)? {
+            Some((
+                algorithm.getattr("name")?.extract::<String>()?,
+                algorithm.getattr("digest_size")?.extract::<usize>()?,
+            ))
+        } else {
+            None
+        };
+        // The cache is a dict rather than a field that needs &mut self:
+        // hashing calls into Python, which can release the GIL and let
+        // another thread use this certificate in the meantime.
+        let cache = self
+            .cached_fingerprints
+            .get_or_init(py, || pyo3::types::PyDict::new(py).into())
+            .as_ref(py);
+        if let Some(cached) = key.as_ref().and_then(|k| cache.get_item(k.clone())) {
+            return Ok(cached.to_object(py));
+        }
+
+        let hasher = hashes_mod.getattr("Hash")?.call1((algorithm,))?;
+        hasher.call_method1(
+            "update",
+            (pyo3::types::PyBytes::new(py, self.raw.borrow_data()),),
+        )?;
+        let digest = hasher.call_method0("finalize")?.to_object(py);
+        if let Some(k) = key {
+            cache.set_item(k, digest.clone_ref(py))?;
+        }
+        Ok(digest)
     }
 
     fn public_bytes<'p>(
@@ -201,14 +244,16 @@ impl Certificate {
             .import("cryptography.hazmat.primitives.serialization")?
             .getattr("Encoding")?;
 
-        let result = asn1::write_single(self.raw.borrow_value());
+        // The certificate was parsed from DER, so the original bytes are
+        // already its encoding.
+        let result = self.raw.borrow_data();
         if encoding == encoding_class.getattr("DER")? {
-            Ok(pyo3::types::PyBytes::new(py, &result))
+            Ok(pyo3::types::PyBytes::new(py, result))
         } else if encoding == encoding_class.getattr("PEM")? {
             let pem = pem::encode_config(
                 &pem::Pem {
                     tag: "CERTIFICATE".to_string(),
-                    contents: result,
+                    contents: result.clone(),
                 },
                 pem::EncodeConfig {
                     line_ending: pem::LineEnding::LF,
@@ -321,164 +366,11 @@ impl Certificate {
 
     #[getter]
     fn extensions(&mut self, py: pyo3::Python<'_>) -> pyo3::PyResult<pyo3::PyObject> {
-        let x509_module = py.import("cryptography.x509")?;
         parse_and_cache_extensions(
             py,
             &mut self.cached_extensions,
             &self.raw.borrow_value().tbs_cert.extensions,
-            |oid, ext_data| {
-                if oid == &*SUBJECT_ALTERNATIVE_NAME_OID {
-                    let gn_seq =
-                        asn1::parse_single::<asn1::SequenceOf<'_, GeneralName<'_>>>(ext_data)?;
-                    let sans = parse_general_names(py, gn_seq)?;
-                    Ok(Some(
-                        x509_module
-                            .getattr("SubjectAlternativeName")?
-                            .call1((sans,))?,
-                    ))
-                } else if oid == &*ISSUER_ALTERNATIVE_NAME_OID {
-                    let gn_seq =
-                        asn1::parse_single::<asn1::SequenceOf<'_, GeneralName<'_>>>(ext_data)?;
-                    let ians = parse_general_names(py, gn_seq)?;
-                    Ok(Some(
-                        x509_module
-                            .getattr("IssuerAlternativeName")?
-                            .call1((ians,))?,
-                    ))
-                } else if oid == &*TLS_FEATURE_OID {
-                    let tls_feature_type_to_enum = py
-                        .import("cryptography.x509.extensions")?
-                        .getattr("_TLS_FEATURE_TYPE_TO_ENUM")?;
-
-                    let features = pyo3::types::PyList::empty(py);
-                    for feature in asn1::parse_single::<asn1::SequenceOf<'_, u64>>(ext_data)? {
-                        let py_feature =
-                            tls_feature_type_to_enum.get_item(feature.to_object(py))?;
-                        features.append(py_feature)?;
-                    }
-                    Ok(Some(x509_module.getattr("TLSFeature")?.call1((features,))?))
-                } else if oid == &*SUBJECT_KEY_IDENTIFIER_OID {
-                    let identifier = asn1::parse_single::<&[u8]>(ext_data)?;
-                    Ok(Some(
-                        x509_module
-                            .getattr("SubjectKeyIdentifier")?
-                            .call1((identifier,))?,
-                    ))
-                } else if oid == &*EXTENDED_KEY_USAGE_OID {
-                    let ekus = pyo3::types::PyList::empty(py);
-                    for oid in asn1::parse_single::<asn1::SequenceOf<'_, asn1::ObjectIdentifier<'_>>>(
-                        ext_data,
-                    )? {
-                        let oid_obj =
-                            x509_module.call_method1("ObjectIdentifier", (oid.to_string(),))?;
-                        ekus.append(oid_obj)?;
-                    }
-                    Ok(Some(
-                        x509_module.getattr("ExtendedKeyUsage")?.call1((ekus,))?,
-                    ))
-                } else if oid == &*KEY_USAGE_OID {
-                    let kus = asn1::parse_single::<asn1::BitString<'_>>(ext_data)?;
-                    let digital_signature = kus.has_bit_set(0);
-                    let content_comitment = kus.has_bit_set(1);
-                    let key_encipherment = kus.has_bit_set(2);
-                    let data_encipherment = kus.has_bit_set(3);
-                    let key_agreement = kus.has_bit_set(4);
-                    let key_cert_sign = kus.has_bit_set(5);
-                    let crl_sign = kus.has_bit_set(6);
-                    let encipher_only = kus.has_bit_set(7);
-                    let decipher_only = kus.has_bit_set(8);
-                    Ok(Some(x509_module.getattr("KeyUsage")?.call1((
-                        digital_signature,
-                        content_comitment,
-                        key_encipherment,
-                        data_encipherment,
-                        key_agreement,
-                        key_cert_sign,
-                        crl_sign,
-                        encipher_only,
-                        decipher_only,
-                    ))?))
-                } else if oid == &*AUTHORITY_INFORMATION_ACCESS_OID {
-                    let ads = parse_access_descriptions(py, ext_data)?;
-                    Ok(Some(
-                        x509_module
-                            .getattr("AuthorityInformationAccess")?
-                            .call1((ads,))?,
-                    ))
-                } else if oid == &*SUBJECT_INFORMATION_ACCESS_OID {
-                    let ads = parse_access_descriptions(py, ext_data)?;
-                    Ok(Some(
-                        x509_module
-                            .getattr("SubjectInformationAccess")?
-                            .call1((ads,))?,
-                    ))
-                } else if oid == &*CERTIFICATE_POLICIES_OID {
-                    let cp = parse_cp(py, ext_data)?;
-                    Ok(Some(
-                        x509_module.call_method1("CertificatePolicies", (cp,))?,
-                    ))
-                } else if oid == &*POLICY_CONSTRAINTS_OID {
-                    let pc = asn1::parse_single::<PolicyConstraints>(ext_data)?;
-                    Ok(Some(x509_module.getattr("PolicyConstraints")?.call1((
-                        pc.require_explicit_policy,
-                        pc.inhibit_policy_mapping,
-                    ))?))
-                } else if oid == &*PRECERT_POISON_OID {
-                    asn1::parse_single::<()>(ext_data)?;
-                    Ok(Some(x509_module.getattr("PrecertPoison")?.call0()?))
-                } else if oid == &*OCSP_NO_CHECK_OID {
-                    asn1::parse_single::<()>(ext_data)?;
-                    Ok(Some(x509_module.getattr("OCSPNoCheck")?.call0()?))
-                } else if oid == &*INHIBIT_ANY_POLICY_OID {
-                    let bignum = asn1::parse_single::<asn1::BigUint<'_>>(ext_data)?;
-                    let pynum = big_asn1_uint_to_py(py, bignum)?;
-                    Ok(Some(
-                        x509_module.getattr("InhibitAnyPolicy")?.call1((pynum,))?,
-                    ))
-                } else if oid == &*BASIC_CONSTRAINTS_OID {
-                    let bc = asn1::parse_single::<BasicConstraints>(ext_data)?;
-                    Ok(Some(
-                        x509_module
-                            .getattr("BasicConstraints")?
-                            .call1((bc.ca, bc.path_length))?,
-                    ))
-                } else if oid == &*AUTHORITY_KEY_IDENTIFIER_OID {
-                    Ok(Some(parse_authority_key_identifier(py, ext_data)?))
-                } else if oid == &*CRL_DISTRIBUTION_POINTS_OID {
-                    let dp = parse_distribution_points(py, ext_data)?;
-                    Ok(Some(
-                        x509_module.getattr("CRLDistributionPoints")?.call1((dp,))?,
-                    ))
-                } else if oid == &*FRESHEST_CRL_OID {
-                    let dp = parse_distribution_points(py, ext_data)?;
-                    Ok(Some(x509_module.getattr("FreshestCRL")?.call1((dp,))?))
-                } else if oid == &*PRECERT_SIGNED_CERTIFICATE_TIMESTAMPS_OID {
-                    let contents = asn1::parse_single::<&[u8]>(ext_data)?;
-                    let scts = parse_scts(py, contents, LogEntryType::PreCertificate)?;
-                    Ok(Some(
-                        x509_module
-                            .getattr("PrecertificateSignedCertificateTimestamps")?
-                            .call1((scts,))?,
-                    ))
-                } else if oid == &*NAME_CONSTRAINTS_OID {
-                    let nc = asn1::parse_single::<NameConstraints<'_>>(ext_data)?;
-                    let permitted_subtrees = match nc.permitted_subtrees {
-                        Some(data) => parse_general_subtrees(py, data)?,
-                        None => py.None(),
-                    };
-                    let excluded_subtrees = match nc.excluded_subtrees {
-                        Some(data) => parse_general_subtrees(py, data)?,
-                        None => py.None(),
-                    };
-                    Ok(Some(
-                        x509_module
-                            .getattr("NameConstraints")?
-                            .call1((permitted_subtrees, excluded_subtrees))?,
-                    ))
-                } else {
-                    Ok(None)
-                }
-            },
+            parse_cert_extension,
         )
     }
     // This getter exists for compatibility with pyOpenSSL and will be removed.
@@ -504,6 +396,29 @@ impl Certificate {
     }
 }
 
+// serialization.load_der_public_key, looked up by the first call to
+// Certificate.public_key.
+static LOAD_DER_PUBLIC_KEY: pyo3::once_cell::GILOnceCell<pyo3::PyObject> =
+    pyo3::once_cell::GILOnceCell::new();
+
+// Returns the SubjectPublicKeyInfo exactly as it is encoded in the
+// certificate, so the key is loaded without re-encoding it.
+fn certificate_spki_bytes(data: &[u8]) -> Result<&[u8], asn1::ParseError> {
+    let (_, certificate, _) = split_der_element(data)?;
+    let (_, tbs_cert, _) = split_der_element(certificate)?;
+    let mut rest = tbs_cert;
+    // Skip the optional version, then the serial number, signature
+    // algorithm, issuer, validity and subject.
+    if rest.first() == Some(&0xa0) {
+        rest = split_der_element(rest)?.2;
+    }
+    for _ in 0..5 {
+        rest = split_der_element(rest)?.2;
+    }
+    let (_, _, after_spki) = split_der_element(rest)?;
+    Ok(&rest[..rest.len() - after_spki.len()])
+}
+
 fn cert_version(py: pyo3::Python<'_>, version: u8) -> Result<&pyo3::PyAny, PyAsn1Error> {
     let x509_module = py.import("cryptography.x509")?;
     match version {
@@ -528,6 +443,73 @@ fn load_pem_x509_certificate(py: pyo3::Python<'_>, data: &[u8]) -> PyAsn1Result<
     load_der_x509_certificate(py, &parsed.contents)
 }
 
+fn find_subslice(haystack: &[u8], needle: &[u8]) -> Option<usize> {
+    haystack
+        .windows(needle.len())
+        .position(|window| window == needle)
+}
+
+// Returns the length of the PEM block at the start of `data`, up to and
+// including the "-----" that closes its END line.
+fn pem_block_len(data: &[u8]) -> Option<usize> {
+    let end = find_subslice(data, b"-----END ")? + b"-----END ".len();
+    Some(end + find_subslice(&data[end..], b"-----")? + b"-----".len())
+}
+
+#[pyo3::prelude::pyfunction]
+fn load_pem_x509_certificates(
+    py: pyo3::Python<'_>,
+    data: &[u8],
+    skip_non_certificates: bool,
+) -> PyAsn1Result<Vec<Certificate>> {
+    // The whole buffer is scanned once, and each CERTIFICATE block is decoded
+    // as it is found. pem::parse_many silently drops blocks it can't decode,
+    // so each block is delimited here and parsed strictly instead.
+    let mut certs = vec![];
+    let mut offset = 0;
+    let mut index = 0;
+    while let Some(start) = find_subslice(&data[offset..], b"-----BEGIN ") {
+        let start = offset + start;
+        index += 1;
+        let block = match pem_block_len(&data[start..]) {
+            Some(len) => &data[start..start + len],
+            None => {
+                return Err(PyAsn1Error::from(pyo3::exceptions::PyValueError::new_err(
+                    format!(
+                        "PEM block {} (at byte offset {}) has no END line.",
+                        index, start
+                    ),
+                )))
+            }
+        };
+        offset = start + block.len();
+        let parsed = pem::parse(block).map_err(|e| {
+            PyAsn1Error::from(pyo3::exceptions::PyValueError::new_err(format!(
+                "Unable to load PEM block {} (at byte offset {}): {:?}",
+                index, start, e
+            )))
+        })?;
+        if parsed.tag != "CERTIFICATE" {
+            if skip_non_certificates {
+                continue;
+            }
+            return Err(PyAsn1Error::from(pyo3::exceptions::PyValueError::new_err(
+                format!(
+                    "Valid PEM but found a {} block. Pass skip_non_certificates=True to ignore blocks that are not certificates.",
+                    parsed.tag
+                ),
+            )));
+        }
+        certs.push(load_der_x509_certificate(py, &parsed.contents)?);
+    }
+    if certs.is_empty() {
+        return Err(PyAsn1Error::from(pyo3::exceptions::PyValueError::new_err(
+            "No BEGIN CERTIFICATE/END CERTIFICATE delimiters found. Are you sure this is a certificate bundle?",
+        )));
+    }
+    Ok(certs)
+}
+
 #[pyo3::prelude::pyfunction]
 fn load_der_x509_certificate(py: pyo3::Python<'_>, data: &[u8]) -> PyAsn1Result<Certificate> {
     let raw = OwnedRawCertificate::try_new(data.to_vec(), |data| asn1::parse_single(data))?;
@@ -536,31 +518,262 @@ fn load_der_x509_certificate(py: pyo3::Python<'_>, data: &[u8]) -> PyAsn1Result<
     Ok(Certificate {
         raw,
         cached_extensions: None,
+        cached_public_key: pyo3::once_cell::GILOnceCell::new(),
+        cached_fingerprints: pyo3::once_cell::GILOnceCell::new(),
     })
 }
 
-pub(crate) fn parse_and_cache_extensions<
-    'p,
-    F: Fn(&asn1::ObjectIdentifier<'_>, &[u8]) -> Result<Option<&'p pyo3::PyAny>, PyAsn1Error>,
->(
+type CertificateIndexKeys<'p> = (
+    &'p pyo3::types::PyBytes,
+    &'p pyo3::types::PyBytes,
+    &'p pyo3::PyAny,
+    Option<&'p pyo3::types::PyBytes>,
+    Option<&'p pyo3::types::PyBytes>,
+);
+
+// Returns a key that is equal for two encoded Names exactly when the Name
+// objects parsed from them are equal. Name equality ignores the string type
+// of each value and the order of the attributes in each RDN, so the key
+// drops the former and sorts the latter. CertificateIndex computes the same
+// key from a Name with _name_key.
+fn name_index_key(name: &Name<'_>) -> Vec<u8> {
+    let mut key = vec![];
+    for rdn in name.clone() {
+        let mut attributes = rdn
+            .map(|attribute| {
+                let mut encoded = vec![];
+                push_length_prefixed(&mut encoded, attribute.type_id.to_string().as_bytes());
+                push_length_prefixed(&mut encoded, attribute.value.data());
+                encoded
+            })
+            .collect::<Vec<_>>();
+        attributes.sort();
+        attributes.dedup();
+        key.extend_from_slice(&(attributes.len() as u32).to_be_bytes());
+        for attribute in attributes {
+            key.extend_from_slice(&attribute);
+        }
+    }
+    key
+}
+
+fn push_length_prefixed(out: &mut Vec<u8>, data: &[u8]) {
+    out.extend_from_slice(&(data.len() as u32).to_be_bytes());
+    out.extend_from_slice(data);
+}
+
+// Returns the index keys of the subject and issuer, the serial number, and
+// the subject and authority key identifiers, without building Name objects.
+#[pyo3::prelude::pyfunction]
+fn certificate_index_keys<'p>(
     py: pyo3::Python<'p>,
+    cert: &pyo3::PyCell<Certificate>,
+) -> Result<CertificateIndexKeys<'p>, PyAsn1Error> {
+    let cert = cert.try_borrow().map_err(pyo3::PyErr::from)?;
+    let tbs_cert = &cert.raw.borrow_value().tbs_cert;
+    let mut ski = None;
+    let mut aki = None;
+    if let Some(extensions) = &tbs_cert.extensions {
+        for ext in extensions.clone() {
+            if ext.extn_id == *SUBJECT_KEY_IDENTIFIER_OID {
+                let identifier = asn1::parse_single::<&[u8]>(ext.extn_value)?;
+                ski = Some(pyo3::types::PyBytes::new(py, identifier));
+            } else if ext.extn_id == *AUTHORITY_KEY_IDENTIFIER_OID {
+                let identifier = asn1::parse_single::<AuthorityKeyIdentifier<'_>>(ext.extn_value)?;
+                aki = identifier
+                    .key_identifier
+                    .map(|data| pyo3::types::PyBytes::new(py, data));
+            }
+        }
+    }
+    Ok((
+        pyo3::types::PyBytes::new(py, &name_index_key(&tbs_cert.subject)),
+        pyo3::types::PyBytes::new(py, &name_index_key(&tbs_cert.issuer)),
+        big_asn1_uint_to_py(py, tbs_cert.serial)?,
+        ski,
+        aki,
+    ))
+}
+
+fn parse_cert_extension<'p>(
+    py: pyo3::Python<'p>,
+    oid: &asn1::ObjectIdentifier<'_>,
+    ext_data: &[u8],
+) -> Result<Option<&'p pyo3::PyAny>, PyAsn1Error> {
+    let x509_module = py.import("cryptography.x509")?;
+    if oid == &*SUBJECT_ALTERNATIVE_NAME_OID {
+        let gn_seq = asn1::parse_single::<asn1::SequenceOf<'_, GeneralName<'_>>>(ext_data)?;
+        let sans = parse_general_names(py, gn_seq)?;
+        Ok(Some(
+            x509_module
+                .getattr("SubjectAlternativeName")?
+                .call1((sans,))?,
+        ))
+    } else if oid == &*ISSUER_ALTERNATIVE_NAME_OID {
+        let gn_seq = asn1::parse_single::<asn1::SequenceOf<'_, GeneralName<'_>>>(ext_data)?;
+        let ians = parse_general_names(py, gn_seq)?;
+        Ok(Some(
+            x509_module
+                .getattr("IssuerAlternativeName")?
+                .call1((ians,))?,
+        ))
+    } else if oid == &*TLS_FEATURE_OID {
+        let tls_feature_type_to_enum = py
+            .import("cryptography.x509.extensions")?
+            .getattr("_TLS_FEATURE_TYPE_TO_ENUM")?;
+
+        let features = pyo3::types::PyList::empty(py);
+        for feature in asn1::parse_single::<asn1::SequenceOf<'_, u64>>(ext_data)? {
+            let py_feature = tls_feature_type_to_enum.get_item(feature.to_object(py))?;
+            features.append(py_feature)?;
+        }
+        Ok(Some(x509_module.getattr("TLSFeature")?.call1((features,))?))
+    } else if oid == &*SUBJECT_KEY_IDENTIFIER_OID {
+        let identifier = asn1::parse_single::<&[u8]>(ext_data)?;
+        Ok(Some(
+            x509_module
+                .getattr("SubjectKeyIdentifier")?
+                .call1((identifier,))?,
+        ))
+    } else if oid == &*EXTENDED_KEY_USAGE_OID {
+        let ekus = pyo3::types::PyList::empty(py);
+        for oid in asn1::parse_single::<asn1::SequenceOf<'_, asn1::ObjectIdentifier<'_>>>(ext_data)?
+        {
+            let oid_obj = x509_module.call_method1("ObjectIdentifier", (oid.to_string(),))?;
+            ekus.append(oid_obj)?;
+        }
+        Ok(Some(
+            x509_module.getattr("ExtendedKeyUsage")?.call1((ekus,))?,
+        ))
+    } else if oid == &*KEY_USAGE_OID {
+        let kus = asn1::parse_single::<asn1::BitString<'_>>(ext_data)?;
+        let digital_signature = kus.has_bit_set(0);
+        let content_comitment = kus.has_bit_set(1);
+        let key_encipherment = kus.has_bit_set(2);
+        let data_encipherment = kus.has_bit_set(3);
+        let key_agreement = kus.has_bit_set(4);
+        let key_cert_sign = kus.has_bit_set(5);
+        let crl_sign = kus.has_bit_set(6);
+        let encipher_only = kus.has_bit_set(7);
+        let decipher_only = kus.has_bit_set(8);
+        Ok(Some(x509_module.getattr("KeyUsage")?.call1((
+            digital_signature,
+            content_comitment,
+            key_encipherment,
+            data_encipherment,
+            key_agreement,
+            key_cert_sign,
+            crl_sign,
+            encipher_only,
+            decipher_only,
+        ))?))
+    } else if oid == &*AUTHORITY_INFORMATION_ACCESS_OID {
+        let ads = parse_access_descriptions(py, ext_data)?;
+        Ok(Some(
+            x509_module
+                .getattr("AuthorityInformationAccess")?
+                .call1((ads,))?,
+        ))
+    } else if oid == &*SUBJECT_INFORMATION_ACCESS_OID {
+        let ads = parse_access_descriptions(py, ext_data)?;
+        Ok(Some(
+            x509_module
+                .getattr("SubjectInformationAccess")?
+                .call1((ads,))?,
+        ))
+    } else if oid == &*CERTIFICATE_POLICIES_OID {
+        let cp = parse_cp(py, ext_data)?;
+        Ok(Some(
+            x509_module.call_method1("CertificatePolicies", (cp,))?,
+        ))
+    } else if oid == &*POLICY_CONSTRAINTS_OID {
+        let pc = asn1::parse_single::<PolicyConstraints>(ext_data)?;
+        Ok(Some(x509_module.getattr("PolicyConstraints")?.call1((
+            pc.require_explicit_policy,
+            pc.inhibit_policy_mapping,
+        ))?))
+    } else if oid == &*PRECERT_POISON_OID {
+        asn1::parse_single::<()>(ext_data)?;
+        Ok(Some(x509_module.getattr("PrecertPoison")?.call0()?))
+    } else if oid == &*OCSP_NO_CHECK_OID {
+        asn1::parse_single::<()>(ext_data)?;
+        Ok(Some(x509_module.getattr("OCSPNoCheck")?.call0()?))
+    } else if oid == &*INHIBIT_ANY_POLICY_OID {
+        let bignum = asn1::parse_single::<asn1::BigUint<'_>>(ext_data)?;
+        let pynum = big_asn1_uint_to_py(py, bignum)?;
+        Ok(Some(
+            x509_module.getattr("InhibitAnyPolicy")?.call1((pynum,))?,
+        ))
+    } else if oid == &*BASIC_CONSTRAINTS_OID {
+        let bc = asn1::parse_single::<BasicConstraints>(ext_data)?;
+        Ok(Some(
+            x509_module
+                .getattr("BasicConstraints")?
+                .call1((bc.ca, bc.path_length))?,
+        ))
+    } else if oid == &*AUTHORITY_KEY_IDENTIFIER_OID {
+        Ok(Some(parse_authority_key_identifier(py, ext_data)?))
+    } else if oid == &*CRL_DISTRIBUTION_POINTS_OID {
+        let dp = parse_distribution_points(py, ext_data)?;
+        Ok(Some(
+            x509_module.getattr("CRLDistributionPoints")?.call1((dp,))?,
+        ))
+    } else if oid == &*FRESHEST_CRL_OID {
+        let dp = parse_distribution_points(py, ext_data)?;
+        Ok(Some(x509_module.getattr("FreshestCRL")?.call1((dp,))?))
+    } else if oid == &*PRECERT_SIGNED_CERTIFICATE_TIMESTAMPS_OID {
+        let contents = asn1::parse_single::<&[u8]>(ext_data)?;
+        let scts = parse_scts(py, contents, LogEntryType::PreCertificate)?;
+        Ok(Some(
+            x509_module
+                .getattr("PrecertificateSignedCertificateTimestamps")?
+                .call1((scts,))?,
+        ))
+    } else if oid == &*NAME_CONSTRAINTS_OID {
+        let nc = asn1::parse_single::<NameConstraints<'_>>(ext_data)?;
+        let permitted_subtrees = match nc.permitted_subtrees {
+            Some(data) => parse_general_subtrees(py, data)?,
+            None => py.None(),
+        };
+        let excluded_subtrees = match nc.excluded_subtrees {
+            Some(data) => parse_general_subtrees(py, data)?,
+            None => py.None(),
+        };
+        Ok(Some(
+            x509_module
+                .getattr("NameConstraints")?
+                .call1((permitted_subtrees, excluded_subtrees))?,
+        ))
+    } else {
+        Ok(None)
+    }
+}
+
+pub(crate) type ExtensionParser = for<'p> fn(
+    pyo3::Python<'p>,
+    &asn1::ObjectIdentifier<'_>,
+    &[u8],
+) -> Result<Option<&'p pyo3::PyAny>, PyAsn1Error>;
+
+pub(crate) fn parse_and_cache_extensions(
+    py: pyo3::Python<'_>,
     cached_extensions: &mut Option<pyo3::PyObject>,
     raw_exts: &Option<Extensions<'_>>,
-    parse_ext: F,
+    parse_ext: ExtensionParser,
 ) -> pyo3::PyResult<pyo3::PyObject> {
     if let Some(cached) = cached_extensions {
         return Ok(cached.clone_ref(py));
     }
 
     let x509_module = py.import("cryptography.x509")?;
-    let exts = pyo3::types::PyList::empty(py);
+    let mut raw = Vec::new();
+    let mut oids = Vec::new();
     let mut seen_oids = HashSet::new();
     if let Some(raw_exts) = raw_exts {
         for raw_ext in raw_exts.clone() {
-            let oid_obj =
-                x509_module.call_method1("ObjectIdentifier", (raw_ext.extn_id.to_string(),))?;
-
             if seen_oids.contains(&raw_ext.extn_id) {
+                let oid_obj =
+                    x509_module.call_method1("ObjectIdentifier", (raw_ext.extn_id.to_string(),))?;
                 return Err(pyo3::PyErr::from_instance(x509_module.call_method1(
                     "DuplicateExtension",
                     (
@@ -570,24 +783,110 @@ pub(crate) fn parse_and_cache_extensions<
                 )?));
             }
 
-            let extn_value = match parse_ext(&raw_ext.extn_id, raw_ext.extn_value)? {
-                Some(e) => e,
-                None => x509_module
-                    .call_method1("UnrecognizedExtension", (oid_obj, raw_ext.extn_value))?,
-            };
-            let ext_obj =
-                x509_module.call_method1("Extension", (oid_obj, raw_ext.critical, extn_value))?;
-            exts.append(ext_obj)?;
+            oids.push(raw_ext.extn_id.to_string());
+            raw.push(asn1::write_single(&raw_ext));
             seen_oids.insert(raw_ext.extn_id);
         }
     }
+    let cached = raw
+        .iter()
+        .map(|_| pyo3::once_cell::GILOnceCell::new())
+        .collect();
+    let raw_extensions = pyo3::Py::new(
+        py,
+        RawExtensions {
+            parse_ext,
+            raw,
+            cached,
+        },
+    )?;
     let extensions = x509_module
-        .call_method1("Extensions", (exts,))?
+        .getattr("Extensions")?
+        .call_method1("_from_raw", (raw_extensions, oids))?
         .to_object(py);
     *cached_extensions = Some(extensions.clone_ref(py));
     Ok(extensions)
 }
 
+// The extensions of a certificate, CRL, revoked certificate or OCSP request.
+// Each one is only decoded the first time it's accessed.
+#[pyo3::prelude::pyclass]
+struct RawExtensions {
+    parse_ext: ExtensionParser,
+    // The DER of each extension.
+    raw: Vec<Vec<u8>>,
+    cached: Vec<pyo3::once_cell::GILOnceCell<pyo3::PyObject>>,
+}
+
+impl RawExtensions {
+    fn extension(&self, py: pyo3::Python<'_>, idx: usize) -> pyo3::PyResult<pyo3::PyObject> {
+        if let Some(ext) = self.cached[idx].get(py) {
+            return Ok(ext.clone_ref(py));
+        }
+
+        // Each extension was parsed when it was collected.
+        let raw_ext = asn1::parse_single::<Extension<'_>>(&self.raw[idx]).unwrap();
+        let x509_module = py.import("cryptography.x509")?;
+        let oid_obj =
+            x509_module.call_method1("ObjectIdentifier", (raw_ext.extn_id.to_string(),))?;
+        let extn_value = match (self.parse_ext)(py, &raw_ext.extn_id, raw_ext.extn_value)? {
+            Some(e) => e,
+            None => {
+                x509_module.call_method1("UnrecognizedExtension", (oid_obj, raw_ext.extn_value))?
+            }
+        };
+        let ext = x509_module
+            .call_method1("Extension", (oid_obj, raw_ext.critical, extn_value))?
+            .to_object(py);
+        let _ = self.cached[idx].set(py, ext.clone_ref(py));
+        Ok(ext)
+    }
+}
+
+#[pyo3::prelude::pyproto]
+impl pyo3::class::mapping::PyMappingProtocol for RawExtensions {
+    fn __len__(&self) -> usize {
+        self.raw.len()
+    }
+
+    fn __getitem__(&self, idx: &pyo3::PyAny) -> pyo3::PyResult<pyo3::PyObject> {
+        let py = idx.py();
+        if let Ok(slice) = idx.downcast::<pyo3::types::PySlice>() {
+            let indices = slice.indices(self.raw.len() as std::os::raw::c_long)?;
+            let result = pyo3::types::PyList::empty(py);
+            let mut i = indices.start;
+            for _ in 0..indices.slicelength {
+                result.append(self.extension(py, i as usize)?)?;
+                i += indices.step;
+            }
+            Ok(result.to_object(py))
+        } else {
+            let mut idx = idx.extract::<isize>()?;
+            if idx < 0 {
+                idx += self.raw.len() as isize;
+            }
+            if idx < 0 || idx >= self.raw.len() as isize {
+                return Err(pyo3::exceptions::PyIndexError::new_err(()));
+            }
+            self.extension(py, idx as usize)
+        }
+    }
+}
+
+#[pyo3::prelude::pyproto]
+impl pyo3::class::iter::PyIterProtocol for RawExtensions {
+    fn __iter__(slf: pyo3::pycell::PyRef<Self>) -> pyo3::PyResult<pyo3::PyObject> {
+        let gil = pyo3::Python::acquire_gil();
+        let py = gil.python();
+
+        let exts = pyo3::types::PyList::empty(py);
+        for idx in 0..slf.raw.len() {
+            exts.append(slf.extension(py, idx)?)?;
+        }
+        Ok(pyo3::types::PyIterator::from_object(py, exts)?.to_object(py))
+    }
+}
+
 pub(crate) type Extensions<'a> = asn1::SequenceOf<'a, Extension<'a>>;
 
 #[derive(asn1::Asn1Read, asn1::Asn1Write)]
@@ -1492,9 +1791,19 @@ fn parse_csr_extension(py: pyo3::Python<'_>, der_oid: &[u8], ext_data: &[u8]) ->
 #[pyo3::prelude::pyfunction]
 pub fn parse_crl_entry_ext(py: pyo3::Python<'_>, der_oid: &[u8], data: &[u8]) -> PyAsn1Result {
     let oid = asn1::ObjectIdentifier::from_der(der_oid).unwrap();
+    match parse_crl_entry_extension(py, &oid, data)? {
+        Some(ext) => Ok(ext.to_object(py)),
+        None => Ok(py.None()),
+    }
+}
 
+fn parse_crl_entry_extension<'p>(
+    py: pyo3::Python<'p>,
+    oid: &asn1::ObjectIdentifier<'_>,
+    data: &[u8],
+) -> Result<Option<&'p pyo3::PyAny>, PyAsn1Error> {
     let x509_module = py.import("cryptography.x509")?;
-    if oid == *CRL_REASON_OID {
+    if oid == &*CRL_REASON_OID {
         let flag_name = match asn1::parse_single::<asn1::Enumerated>(data)?.value() {
             0 => "unspecified",
             1 => "key_compromise",
@@ -1513,73 +1822,66 @@ pub fn parse_crl_entry_ext(py: pyo3::Python<'_>, der_oid: &[u8], data: &[u8]) ->
             }
         };
         let flag = x509_module.getattr("ReasonFlags")?.getattr(flag_name)?;
-        Ok(x509_module
-            .getattr("CRLReason")?
-            .call1((flag,))?
-            .to_object(py))
-    } else if oid == *CERTIFICATE_ISSUER_OID {
+        Ok(Some(x509_module.getattr("CRLReason")?.call1((flag,))?))
+    } else if oid == &*CERTIFICATE_ISSUER_OID {
         let gn_seq = asn1::parse_single::<asn1::SequenceOf<'_, GeneralName<'_>>>(data)?;
         let gns = parse_general_names(py, gn_seq)?;
-        Ok(x509_module
-            .getattr("CertificateIssuer")?
-            .call1((gns,))?
-            .to_object(py))
-    } else if oid == *INVALIDITY_DATE_OID {
+        Ok(Some(
+            x509_module.getattr("CertificateIssuer")?.call1((gns,))?,
+        ))
+    } else if oid == &*INVALIDITY_DATE_OID {
         let time = asn1::parse_single::<asn1::GeneralizedTime>(data)?;
         let py_dt = chrono_to_py(py, time.as_chrono())?;
-        Ok(x509_module
-            .getattr("InvalidityDate")?
-            .call1((py_dt,))?
-            .to_object(py))
+        Ok(Some(
+            x509_module.getattr("InvalidityDate")?.call1((py_dt,))?,
+        ))
     } else {
-        Ok(py.None())
+        Ok(None)
     }
 }
 
-#[pyo3::prelude::pyfunction]
-fn parse_crl_extension(py: pyo3::Python<'_>, der_oid: &[u8], ext_data: &[u8]) -> PyAsn1Result {
-    let oid = asn1::ObjectIdentifier::from_der(der_oid).unwrap();
-
+fn parse_crl_extension<'p>(
+    py: pyo3::Python<'p>,
+    oid: &asn1::ObjectIdentifier<'_>,
+    ext_data: &[u8],
+) -> Result<Option<&'p pyo3::PyAny>, PyAsn1Error> {
     let x509_module = py.import("cryptography.x509")?;
-    if oid == *CRL_NUMBER_OID {
+    if oid == &*CRL_NUMBER_OID {
         let bignum = asn1::parse_single::<asn1::BigUint<'_>>(ext_data)?;
         let pynum = big_asn1_uint_to_py(py, bignum)?;
-        Ok(x509_module
-            .getattr("CRLNumber")?
-            .call1((pynum,))?
-            .to_object(py))
-    } else if oid == *DELTA_CRL_INDICATOR_OID {
+        Ok(Some(x509_module.getattr("CRLNumber")?.call1((pynum,))?))
+    } else if oid == &*DELTA_CRL_INDICATOR_OID {
         let bignum = asn1::parse_single::<asn1::BigUint<'_>>(ext_data)?;
         let pynum = big_asn1_uint_to_py(py, bignum)?;
-        Ok(x509_module
-            .getattr("DeltaCRLIndicator")?
-            .call1((pynum,))?
-            .to_object(py))
-    } else if oid == *ISSUER_ALTERNATIVE_NAME_OID {
+        Ok(Some(
+            x509_module.getattr("DeltaCRLIndicator")?.call1((pynum,))?,
+        ))
+    } else if oid == &*ISSUER_ALTERNATIVE_NAME_OID {
         let gn_seq = asn1::parse_single::<asn1::SequenceOf<'_, GeneralName<'_>>>(ext_data)?;
         let ians = parse_general_names(py, gn_seq)?;
-        Ok(x509_module
-            .getattr("IssuerAlternativeName")?
-            .call1((ians,))?
-            .to_object(py))
-    } else if oid == *AUTHORITY_INFORMATION_ACCESS_OID {
+        Ok(Some(
+            x509_module
+                .getattr("IssuerAlternativeName")?
+                .call1((ians,))?,
+        ))
+    } else if oid == &*AUTHORITY_INFORMATION_ACCESS_OID {
         let ads = parse_access_descriptions(py, ext_data)?;
-        Ok(x509_module
-            .getattr("AuthorityInformationAccess")?
-            .call1((ads,))?
-            .to_object(py))
-    } else if oid == *AUTHORITY_KEY_IDENTIFIER_OID {
-        Ok(parse_authority_key_identifier(py, ext_data)?.to_object(py))
-    } else if oid == *ISSUING_DISTRIBUTION_POINT_OID {
+        Ok(Some(
+            x509_module
+                .getattr("AuthorityInformationAccess")?
+                .call1((ads,))?,
+        ))
+    } else if oid == &*AUTHORITY_KEY_IDENTIFIER_OID {
+        Ok(Some(parse_authority_key_identifier(py, ext_data)?))
+    } else if oid == &*ISSUING_DISTRIBUTION_POINT_OID {
         let idp = asn1::parse_single::<IssuingDistributionPoint<'_>>(ext_data)?;
         let (full_name, relative_name) = match idp.distribution_point {
             Some(data) => parse_distribution_point_name(py, data)?,
             None => (py.None(), py.None()),
         };
         let reasons = parse_distribution_point_reasons(py, idp.only_some_reasons)?;
-        Ok(x509_module
-            .getattr("IssuingDistributionPoint")?
-            .call1((
+        Ok(Some(
+            x509_module.getattr("IssuingDistributionPoint")?.call1((
                 full_name,
                 relative_name,
                 idp.only_contains_user_certs,
@@ -1587,30 +1889,625 @@ fn parse_crl_extension(py: pyo3::Python<'_>, der_oid: &[u8], ext_data: &[u8]) ->
                 reasons,
                 idp.indirect_crl,
                 idp.only_contains_attribute_certs,
-            ))?
-            .to_object(py))
-    } else if oid == *FRESHEST_CRL_OID {
-        Ok(x509_module
-            .getattr("FreshestCRL")?
-            .call1((parse_distribution_points(py, ext_data)?,))?
-            .to_object(py))
+            ))?,
+        ))
+    } else if oid == &*FRESHEST_CRL_OID {
+        Ok(Some(
+            x509_module
+                .getattr("FreshestCRL")?
+                .call1((parse_distribution_points(py, ext_data)?,))?,
+        ))
     } else {
-        Ok(py.None())
+        Ok(None)
+    }
+}
+
+#[derive(asn1::Asn1Read, asn1::Asn1Write)]
+struct RawCertificateRevocationList<'a> {
+    tbs_cert_list: TbsCertList<'a>,
+    signature_algorithm: AlgorithmIdentifier<'a>,
+    signature_value: asn1::BitString<'a>,
+}
+
+#[derive(asn1::Asn1Read, asn1::Asn1Write)]
+struct TbsCertList<'a> {
+    version: Option<u8>,
+    signature: AlgorithmIdentifier<'a>,
+    issuer: Name<'a>,
+    this_update: Time,
+    next_update: Option<Time>,
+    // Only the framing of each entry is checked here, the entries themselves
+    // are parsed when they're accessed.
+    revoked_certificates: Option<asn1::SequenceOf<'a, asn1::Tlv<'a>>>,
+    #[explicit(0)]
+    crl_extensions: Option<Extensions<'a>>,
+}
+
+#[derive(asn1::Asn1Read)]
+struct RawRevokedCertificate<'a> {
+    user_certificate: asn1::BigUint<'a>,
+    revocation_date: Time,
+    crl_entry_extensions: Option<Extensions<'a>>,
+}
+
+#[ouroboros::self_referencing]
+struct OwnedRawCertificateRevocationList {
+    data: Arc<Vec<u8>>,
+    #[borrows(data)]
+    #[covariant]
+    value: RawCertificateRevocationList<'this>,
+}
+
+// The length of the DER header of an element with `length` bytes of contents.
+fn der_header_length(length: usize) -> usize {
+    if length < 0x80 {
+        return 2;
+    }
+    let mut header_length = 2;
+    let mut remaining = length;
+    while remaining > 0 {
+        header_length += 1;
+        remaining >>= 8;
+    }
+    header_length
+}
+
+// Splits the DER element at the start of `data` into its tag, its contents
+// and the data that follows it.
+fn split_der_element(data: &[u8]) -> Result<(u8, &[u8], &[u8]), asn1::ParseError> {
+    let invalid = || asn1::ParseError::new(asn1::ParseErrorKind::InvalidValue);
+    let tag = *data.first().ok_or_else(invalid)?;
+    let first_length_byte = *data.get(1).ok_or_else(invalid)?;
+    if tag & 0x1f == 0x1f {
+        return Err(invalid());
+    }
+    let (header_length, length) = if first_length_byte < 0x80 {
+        (2, first_length_byte as usize)
+    } else {
+        let length_bytes = (first_length_byte & 0x7f) as usize;
+        if length_bytes == 0 || length_bytes > std::mem::size_of::<usize>() {
+            return Err(invalid());
+        }
+        let mut length = 0;
+        for b in data.get(2..2 + length_bytes).ok_or_else(invalid)? {
+            length = (length << 8) | (*b as usize);
+        }
+        (2 + length_bytes, length)
+    };
+    let end = header_length.checked_add(length).ok_or_else(invalid)?;
+    let contents = data.get(header_length..end).ok_or_else(invalid)?;
+    Ok((tag, contents, &data[end..]))
+}
+
+// Returns the contents of the serial number INTEGER of the revoked entry at
+// the start of `data`. Two serial numbers are equal exactly when these are.
+// Negative serial numbers are rejected, as they are by
+// RevokedCertificate.serial_number.
+fn revoked_serial_number_bytes(data: &[u8]) -> Result<&[u8], asn1::ParseError> {
+    let (_, entry, _) = split_der_element(data)?;
+    let (tag, serial, _) = split_der_element(entry)?;
+    if tag != 0x02 || serial.is_empty() || serial[0] & 0x80 != 0 {
+        return Err(asn1::ParseError::new(asn1::ParseErrorKind::InvalidValue));
+    }
+    Ok(serial)
+}
+
+// Returns the contents of the DER INTEGER encoding of a Python int, or None
+// if it's negative and so can't be the serial number of a revoked entry.
+// `operator_index` is operator.index, looked up once by the caller.
+fn py_int_to_der_integer_bytes(
+    operator_index: &pyo3::PyAny,
+    value: &pyo3::PyAny,
+) -> pyo3::PyResult<Option<Vec<u8>>> {
+    let value = operator_index.call1((value,))?;
+    if value.compare(0)? == std::cmp::Ordering::Less {
+        return Ok(None);
+    }
+    // One more byte than the magnitude needs leaves room for the leading
+    // zero that keeps the INTEGER positive.
+    let length = value.call_method0("bit_length")?.extract::<usize>()? / 8 + 1;
+    Ok(Some(
+        value
+            .call_method1("to_bytes", (length, "big"))?
+            .extract::<&[u8]>()?
+            .to_vec(),
+    ))
+}
+
+#[pyo3::prelude::pyclass]
+struct CertificateRevocationList {
+    raw: OwnedRawCertificateRevocationList,
+    // The revoked entries are the DER elements in this range of the data.
+    revoked_start: usize,
+    revoked_end: usize,
+    revoked_count: usize,
+    // The offset of each revoked entry, built the first time it's indexed.
+    cached_revoked_offsets: pyo3::once_cell::GILOnceCell<Vec<usize>>,
+    // The offsets again, sorted by serial number, for lookups.
+    cached_serial_number_index: pyo3::once_cell::GILOnceCell<Vec<usize>>,
+    cached_extensions: Option<pyo3::PyObject>,
+}
+
+impl CertificateRevocationList {
+    fn revoked_certificate(&self, start: usize) -> RevokedCertificate {
+        let data = self.raw.borrow_data();
+        // The entries' framing was checked when the CRL was loaded.
+        let (_, _, rest) = split_der_element(&data[start..self.revoked_end]).unwrap();
+        RevokedCertificate {
+            data: Arc::clone(data),
+            start,
+            end: self.revoked_end - rest.len(),
+            cached_extensions: None,
+        }
+    }
+
+    fn revoked_offsets(&self, py: pyo3::Python<'_>) -> &[usize] {
+        self.cached_revoked_offsets.get_or_init(py, || {
+            let data = self.raw.borrow_data();
+            let mut offsets = Vec::with_capacity(self.revoked_count);
+            let mut position = self.revoked_start;
+            while position < self.revoked_end {
+                offsets.push(position);
+                let (_, _, rest) = split_der_element(&data[position..self.revoked_end]).unwrap();
+                position = self.revoked_end - rest.len();
+            }
+            offsets
+        })
+    }
+
+    fn serial_number_index(&self, py: pyo3::Python<'_>) -> Result<&[usize], PyAsn1Error> {
+        if let Some(index) = self.cached_serial_number_index.get(py) {
+            return Ok(index);
+        }
+
+        let data: &[u8] = self.raw.borrow_data();
+        let mut index = self.revoked_offsets(py).to_vec();
+        for &offset in &index {
+            revoked_serial_number_bytes(&data[offset..])?;
+        }
+        index.sort_by(|&a, &b| {
+            revoked_serial_number_bytes(&data[a..])
+                .unwrap()
+                .cmp(revoked_serial_number_bytes(&data[b..]).unwrap())
+        });
+        let _ = self.cached_serial_number_index.set(py, index);
+        Ok(self.cached_serial_number_index.get(py).unwrap())
+    }
+
+    fn find_revoked(
+        &self,
+        py: pyo3::Python<'_>,
+        operator_index: &pyo3::PyAny,
+        serial_number: &pyo3::PyAny,
+    ) -> Result<Option<usize>, PyAsn1Error> {
+        let serial_number = match py_int_to_der_integer_bytes(operator_index, serial_number)? {
+            Some(serial_number) => serial_number,
+            None => return Ok(None),
+        };
+        let data: &[u8] = self.raw.borrow_data();
+        let index = self.serial_number_index(py)?;
+        Ok(index
+            .binary_search_by(|&offset| {
+                revoked_serial_number_bytes(&data[offset..])
+                    .unwrap()
+                    .cmp(&serial_number[..])
+            })
+            .ok()
+            .map(|i| index[i]))
+    }
+}
+
+#[pyo3::prelude::pyproto]
+impl pyo3::class::basic::PyObjectProtocol for CertificateRevocationList {
+    fn __richcmp__(
+        &self,
+        other: pyo3::pycell::PyRef<CertificateRevocationList>,
+        op: pyo3::class::basic::CompareOp,
+    ) -> pyo3::PyResult<bool> {
+        match op {
+            pyo3::class::basic::CompareOp::Eq => {
+                Ok(self.raw.borrow_data() == other.raw.borrow_data())
+            }
+            pyo3::class::basic::CompareOp::Ne => {
+                Ok(self.raw.borrow_data() != other.raw.borrow_data())
+            }
+            _ => Err(pyo3::exceptions::PyTypeError::new_err(
+                "CRLs cannot be ordered",
+            )),
+        }
+    }
+}
+
+#[pyo3::prelude::pyproto]
+impl pyo3::class::mapping::PyMappingProtocol for CertificateRevocationList {
+    fn __len__(&self) -> usize {
+        self.revoked_count
+    }
+
+    fn __getitem__(&self, idx: &pyo3::PyAny) -> pyo3::PyResult<pyo3::PyObject> {
+        let gil = pyo3::Python::acquire_gil();
+        let py = gil.python();
+
+        let offsets = self.revoked_offsets(py);
+        if let Ok(slice) = idx.downcast::<pyo3::types::PySlice>() {
+            let indices = slice.indices(offsets.len() as std::os::raw::c_long)?;
+            let result = pyo3::types::PyList::empty(py);
+            let mut i = indices.start;
+            for _ in 0..indices.slicelength {
+                let revoked = self.revoked_certificate(offsets[i as usize]);
+                result.append(pyo3::Py::new(py, revoked)?)?;
+                i += indices.step;
+            }
+            Ok(result.to_object(py))
+        } else {
+            let mut idx = idx.extract::<isize>()?;
+            if idx < 0 {
+                idx += offsets.len() as isize;
+            }
+            if idx < 0 || idx >= offsets.len() as isize {
+                return Err(pyo3::exceptions::PyIndexError::new_err(()));
+            }
+            let revoked = self.revoked_certificate(offsets[idx as usize]);
+            Ok(pyo3::Py::new(py, revoked)?.to_object(py))
+        }
+    }
+}
+
+#[pyo3::prelude::pyproto]
+impl pyo3::class::iter::PyIterProtocol for CertificateRevocationList {
+    fn __iter__(slf: pyo3::pycell::PyRef<Self>) -> CRLIterator {
+        CRLIterator {
+            data: Arc::clone(slf.raw.borrow_data()),
+            position: slf.revoked_start,
+            end: slf.revoked_end,
+        }
+    }
+}
+
+#[pyo3::prelude::pymethods]
+impl CertificateRevocationList {
+    fn __deepcopy__(
+        slf: pyo3::pycell::PyRef<'_, Self>,
+        _memo: pyo3::PyObject,
+    ) -> pyo3::pycell::PyRef<'_, Self> {
+        slf
+    }
+
+    fn fingerprint<'p>(
+        &self,
+        py: pyo3::Python<'p>,
+        algorithm: &pyo3::PyAny,
+    ) -> pyo3::PyResult<&'p pyo3::PyAny> {
+        let hasher = py
+            .import("cryptography.hazmat.primitives.hashes")?
+            .getattr("Hash")?
+            .call1((algorithm,))?;
+        hasher.call_method1(
+            "update",
+            (pyo3::types::PyBytes::new(py, self.raw.borrow_data()),),
+        )?;
+        hasher.call_method0("finalize")
+    }
+
+    fn public_bytes<'p>(
+        &self,
+        py: pyo3::Python<'p>,
+        encoding: &pyo3::PyAny,
+    ) -> pyo3::PyResult<&'p pyo3::types::PyBytes> {
+        let encoding_class = py
+            .import("cryptography.hazmat.primitives.serialization")?
+            .getattr("Encoding")?;
+
+        let result = self.raw.borrow_data();
+        if encoding == encoding_class.getattr("DER")? {
+            Ok(pyo3::types::PyBytes::new(py, result))
+        } else if encoding == encoding_class.getattr("PEM")? {
+            let pem = pem::encode_config(
+                &pem::Pem {
+                    tag: "X509 CRL".to_string(),
+                    contents: result.to_vec(),
+                },
+                pem::EncodeConfig {
+                    line_ending: pem::LineEnding::LF,
+                },
+            )
+            .into_bytes();
+            Ok(pyo3::types::PyBytes::new(py, &pem))
+        } else {
+            Err(pyo3::exceptions::PyTypeError::new_err(
+                "encoding must be an item from the Encoding enum",
+            ))
+        }
+    }
+
+    fn get_revoked_certificate_by_serial_number(
+        &self,
+        py: pyo3::Python<'_>,
+        serial_number: &pyo3::PyAny,
+    ) -> Result<Option<RevokedCertificate>, PyAsn1Error> {
+        let operator_index = py.import("operator")?.getattr("index")?;
+        Ok(self
+            .find_revoked(py, operator_index, serial_number)?
+            .map(|offset| self.revoked_certificate(offset)))
+    }
+
+    fn is_revoked(
+        &self,
+        py: pyo3::Python<'_>,
+        serial_number: &pyo3::PyAny,
+    ) -> Result<bool, PyAsn1Error> {
+        let operator_index = py.import("operator")?.getattr("index")?;
+        Ok(self
+            .find_revoked(py, operator_index, serial_number)?
+            .is_some())
+    }
+
+    fn bulk_is_revoked(
+        &self,
+        py: pyo3::Python<'_>,
+        serial_numbers: &pyo3::PyAny,
+    ) -> Result<Vec<bool>, PyAsn1Error> {
+        let operator_index = py.import("operator")?.getattr("index")?;
+        let mut result = vec![];
+        for serial_number in serial_numbers.iter()? {
+            result.push(
+                self.find_revoked(py, operator_index, serial_number?)?
+                    .is_some(),
+            );
+        }
+        Ok(result)
+    }
+
+    #[getter]
+    fn signature_hash_algorithm<'p>(
+        &self,
+        py: pyo3::Python<'p>,
+    ) -> Result<&'p pyo3::PyAny, PyAsn1Error> {
+        let sig_oids_to_hash = py
+            .import("cryptography.x509")?
+            .getattr("_SIG_OIDS_TO_HASH")?;
+        let hash_alg = sig_oids_to_hash.get_item(self.signature_algorithm_oid(py)?);
+        match hash_alg {
+            Ok(data) => Ok(data),
+            Err(_) => Err(PyAsn1Error::from(pyo3::PyErr::from_instance(
+                py.import("cryptography.exceptions")?.call_method1(
+                    "UnsupportedAlgorithm",
+                    (format!(
+                        "Signature algorithm OID: {} not recognized",
+                        self.raw.borrow_value().signature_algorithm.oid.to_string()
+                    ),),
+                )?,
+            ))),
+        }
+    }
+
+    #[getter]
+    fn signature_algorithm_oid<'p>(&self, py: pyo3::Python<'p>) -> pyo3::PyResult<&'p pyo3::PyAny> {
+        py.import("cryptography.x509")?.call_method1(
+            "ObjectIdentifier",
+            (self.raw.borrow_value().signature_algorithm.oid.to_string(),),
+        )
+    }
+
+    #[getter]
+    fn issuer<'p>(&self, py: pyo3::Python<'p>) -> pyo3::PyResult<&'p pyo3::PyAny> {
+        parse_name(py, &self.raw.borrow_value().tbs_cert_list.issuer)
+    }
+
+    #[getter]
+    fn next_update(&self, py: pyo3::Python<'_>) -> pyo3::PyResult<pyo3::PyObject> {
+        match &self.raw.borrow_value().tbs_cert_list.next_update {
+            Some(t) => Ok(chrono_to_py(py, t.as_chrono())?.to_object(py)),
+            None => Ok(py.None()),
+        }
+    }
+
+    #[getter]
+    fn last_update<'p>(&self, py: pyo3::Python<'p>) -> pyo3::PyResult<&'p pyo3::PyAny> {
+        chrono_to_py(
+            py,
+            self.raw
+                .borrow_value()
+                .tbs_cert_list
+                .this_update
+                .as_chrono(),
+        )
+    }
+
+    #[getter]
+    fn signature<'p>(&self, py: pyo3::Python<'p>) -> &'p pyo3::types::PyBytes {
+        pyo3::types::PyBytes::new(py, self.raw.borrow_value().signature_value.as_bytes())
+    }
+
+    #[getter]
+    fn tbs_certlist_bytes<'p>(&self, py: pyo3::Python<'p>) -> &'p pyo3::types::PyBytes {
+        // The TBSCertList is the first element of the CRL, and its framing
+        // was checked when the CRL was parsed.
+        let data: &[u8] = self.raw.borrow_data();
+        let (_, crl, _) = split_der_element(data).unwrap();
+        let (_, _, rest) = split_der_element(crl).unwrap();
+        pyo3::types::PyBytes::new(py, &crl[..crl.len() - rest.len()])
+    }
+
+    #[getter]
+    fn extensions(&mut self, py: pyo3::Python<'_>) -> pyo3::PyResult<pyo3::PyObject> {
+        parse_and_cache_extensions(
+            py,
+            &mut self.cached_extensions,
+            &self.raw.borrow_value().tbs_cert_list.crl_extensions,
+            parse_crl_extension,
+        )
+    }
+
+    fn is_signature_valid<'p>(
+        slf: pyo3::pycell::PyRef<'_, Self>,
+        py: pyo3::Python<'p>,
+        public_key: &'p pyo3::PyAny,
+    ) -> pyo3::PyResult<&'p pyo3::PyAny> {
+        let backend = py
+            .import("cryptography.hazmat.backends.openssl.backend")?
+            .getattr("backend")?;
+        backend.call_method1("_crl_is_signature_valid", (slf, public_key))
     }
+
+    // This getter exists for compatibility with pyOpenSSL and will be removed.
+    // DO NOT RELY ON IT. WE WILL BREAK YOU WHEN WE FEEL LIKE IT.
+    #[getter]
+    fn _x509_crl<'p>(
+        slf: pyo3::pycell::PyRef<'_, Self>,
+        py: pyo3::Python<'p>,
+    ) -> Result<&'p pyo3::PyAny, PyAsn1Error> {
+        let cryptography_warning = py.import("cryptography.utils")?.getattr("DeprecatedIn35")?;
+        let warnings = py.import("warnings")?;
+        warnings.call_method1(
+            "warn",
+            (
+                "This version of cryptography contains a temporary pyOpenSSL fallback path. Upgrade pyOpenSSL now.",
+                cryptography_warning,
+            ),
+        )?;
+        let backend = py
+            .import("cryptography.hazmat.backends.openssl.backend")?
+            .getattr("backend")?;
+        Ok(backend.call_method1("_crl2ossl", (slf,))?)
+    }
+}
+
+#[pyo3::prelude::pyclass]
+struct CRLIterator {
+    data: Arc<Vec<u8>>,
+    position: usize,
+    end: usize,
+}
+
+#[pyo3::prelude::pyproto]
+impl pyo3::class::iter::PyIterProtocol for CRLIterator {
+    fn __iter__(slf: pyo3::pycell::PyRef<Self>) -> pyo3::pycell::PyRef<Self> {
+        slf
+    }
+
+    fn __next__(mut slf: pyo3::pycell::PyRefMut<Self>) -> Option<RevokedCertificate> {
+        if slf.position >= slf.end {
+            return None;
+        }
+        // The entries' framing was checked when the CRL was loaded.
+        let start = slf.position;
+        let end = {
+            let (_, _, rest) = split_der_element(&slf.data[start..slf.end]).unwrap();
+            slf.end - rest.len()
+        };
+        slf.position = end;
+        Some(RevokedCertificate {
+            data: Arc::clone(&slf.data),
+            start,
+            end,
+            cached_extensions: None,
+        })
+    }
+}
+
+// A revoked entry is a view of its CRL's data, and is parsed again on each
+// access rather than kept parsed.
+#[pyo3::prelude::pyclass]
+struct RevokedCertificate {
+    data: Arc<Vec<u8>>,
+    start: usize,
+    end: usize,
+    cached_extensions: Option<pyo3::PyObject>,
+}
+
+impl RevokedCertificate {
+    fn raw(&self) -> Result<RawRevokedCertificate<'_>, PyAsn1Error> {
+        Ok(asn1::parse_single(&self.data[self.start..self.end])?)
+    }
+}
+
+#[pyo3::prelude::pymethods]
+impl RevokedCertificate {
+    #[getter]
+    fn serial_number<'p>(&self, py: pyo3::Python<'p>) -> Result<&'p pyo3::PyAny, PyAsn1Error> {
+        Ok(big_asn1_uint_to_py(py, self.raw()?.user_certificate)?)
+    }
+
+    #[getter]
+    fn revocation_date<'p>(&self, py: pyo3::Python<'p>) -> Result<&'p pyo3::PyAny, PyAsn1Error> {
+        Ok(chrono_to_py(py, self.raw()?.revocation_date.as_chrono())?)
+    }
+
+    #[getter]
+    fn extensions(&mut self, py: pyo3::Python<'_>) -> pyo3::PyResult<pyo3::PyObject> {
+        let raw = asn1::parse_single::<RawRevokedCertificate<'_>>(&self.data[self.start..self.end])
+            .map_err(PyAsn1Error::from)?;
+        parse_and_cache_extensions(
+            py,
+            &mut self.cached_extensions,
+            &raw.crl_entry_extensions,
+            parse_crl_entry_extension,
+        )
+    }
+}
+
+#[pyo3::prelude::pyfunction]
+fn load_pem_x509_crl(data: &[u8]) -> PyAsn1Result<CertificateRevocationList> {
+    let parsed = pem::parse(data)?;
+    if parsed.tag != "X509 CRL" {
+        return Err(PyAsn1Error::from(pyo3::exceptions::PyValueError::new_err(
+            "Valid PEM but no BEGIN X509 CRL/END X509 CRL delimiters. Are you sure this is a CRL?",
+        )));
+    }
+    load_der_x509_crl(&parsed.contents)
+}
+
+#[pyo3::prelude::pyfunction]
+fn load_der_x509_crl(data: &[u8]) -> PyAsn1Result<CertificateRevocationList> {
+    let raw = OwnedRawCertificateRevocationList::try_new(Arc::new(data.to_vec()), |data| {
+        asn1::parse_single(data)
+    })?;
+
+    // Find where the entries are, so they can be walked without keeping the
+    // parsed list around.
+    let mut revoked_start = 0;
+    let mut revoked_end = 0;
+    let mut revoked_count = 0;
+    if let Some(revoked) = &raw.borrow_value().tbs_cert_list.revoked_certificates {
+        let base = raw.borrow_data().as_ptr() as usize;
+        for entry in revoked.clone() {
+            let contents_start = entry.data().as_ptr() as usize - base;
+            if revoked_count == 0 {
+                revoked_start = contents_start - der_header_length(entry.data().len());
+            }
+            revoked_end = contents_start + entry.data().len();
+            revoked_count += 1;
+        }
+    }
+    Ok(CertificateRevocationList {
+        raw,
+        revoked_start,
+        revoked_end,
+        revoked_count,
+        cached_revoked_offsets: pyo3::once_cell::GILOnceCell::new(),
+        cached_serial_number_index: pyo3::once_cell::GILOnceCell::new(),
+        cached_extensions: None,
+    })
 }
 
 pub(crate) fn create_submodule(py: pyo3::Python<'_>) -> pyo3::PyResult<&pyo3::prelude::PyModule> {
     let submod = pyo3::prelude::PyModule::new(py, "x509")?;
 
     submod.add_wrapped(pyo3::wrap_pyfunction!(load_der_x509_certificate))?;
+    submod.add_wrapped(pyo3::wrap_pyfunction!(certificate_index_keys))?;
     submod.add_wrapped(pyo3::wrap_pyfunction!(load_pem_x509_certificate))?;
+    submod.add_wrapped(pyo3::wrap_pyfunction!(load_pem_x509_certificates))?;
+    submod.add_wrapped(pyo3::wrap_pyfunction!(load_der_x509_crl))?;
+    submod.add_wrapped(pyo3::wrap_pyfunction!(load_pem_x509_crl))?;
     submod.add_wrapped(pyo3::wrap_pyfunction!(parse_csr_extension))?;
     submod.add_wrapped(pyo3::wrap_pyfunction!(parse_crl_entry_ext))?;
-    submod.add_wrapped(pyo3::wrap_pyfunction!(parse_crl_extension))?;
     submod.add_wrapped(pyo3::wrap_pyfunction!(
         encode_precertificate_signed_certificate_timestamps
     ))?;
     submod.add_class::<Certificate>()?;
+    submod.add_class::<CertificateRevocationList>()?;
+    submod.add_class::<RevokedCertificate>()?;
     submod.add_class::<Sct>()?;
 
     Ok(submod)
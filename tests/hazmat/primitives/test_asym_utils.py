@@ -3,15 +3,26 @@
 # for complete details.
 
 
+import collections
+import itertools
+import os
+import threading
+import time
+
 import pytest
 
 from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric import ec, padding
 from cryptography.hazmat.primitives.asymmetric.utils import (
+    KeyPool,
     Prehashed,
     decode_dss_signature,
     encode_dss_signature,
+    verify_many,
 )
 
+from .fixtures_rsa import RSA_KEY_2048
+
 
 def test_dss_signature():
     sig = encode_dss_signature(1, 1)
@@ -82,3 +93,149 @@ def test_pass_invalid_prehashed_arg():
 def test_prehashed_digest_size():
     p = Prehashed(hashes.SHA256())
     assert p.digest_size == 32
+
+
+def test_verify_many(backend):
+    rsa_key = RSA_KEY_2048.private_key(backend)
+    ec_key = ec.generate_private_key(ec.SECP256R1(), backend)
+    pkcs1 = padding.PKCS1v15()
+    ecdsa = ec.ECDSA(hashes.SHA256())
+    rsa_sig = rsa_key.sign(b"data", pkcs1, hashes.SHA256())
+    ec_sig = ec_key.sign(b"data", ecdsa)
+
+    rsa_pub = rsa_key.public_key()
+    ec_pub = ec_key.public_key()
+    assert (
+        verify_many(
+            [
+                (rsa_pub, rsa_sig, b"data", pkcs1, hashes.SHA256()),
+                (rsa_pub, rsa_sig, b"other", pkcs1, hashes.SHA256()),
+                (ec_pub, ec_sig, b"data", ecdsa),
+                (ec_pub, b"\x00" * 8, b"data", ecdsa),
+                (ec_pub, rsa_sig, b"data", ecdsa),
+            ]
+        )
+        == [True, False, True, False, False]
+    )
+    assert verify_many([]) == []
+
+
+def test_verify_many_invalid_arguments(backend):
+    ec_key = ec.generate_private_key(ec.SECP256R1(), backend)
+    with pytest.raises(TypeError):
+        verify_many([(ec_key.public_key(), b"sig", b"data")])
+
+
+def _wait_for_keys(pool, count):
+    deadline = time.monotonic() + 10
+    while len(pool._keys) < count:
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+class TestKeyPool(object):
+    def test_invalid_arguments(self):
+        with pytest.raises(TypeError):
+            KeyPool(None)  # type: ignore[arg-type]
+        with pytest.raises(TypeError):
+            KeyPool(ec.generate_private_key, size="1")  # type: ignore
+        with pytest.raises(ValueError):
+            KeyPool(ec.generate_private_key, size=0)
+        with pytest.raises(ValueError):
+            KeyPool(ec.generate_private_key, workers=0)
+
+    def test_get(self):
+        with KeyPool(itertools.count().__next__, size=4, workers=2) as pool:
+            assert pool.size == 4
+            first = pool.get()
+            _wait_for_keys(pool, 4)
+            keys = [pool.get() for _ in range(4)]
+            assert len(set(keys + [first])) == 5
+            # The pool refills after keys are taken.
+            _wait_for_keys(pool, 4)
+
+        assert len(pool._keys) == 0
+        assert pool.get() not in keys
+
+    def test_keys(self, backend):
+        with KeyPool(lambda: ec.generate_private_key(ec.SECP256R1())) as pool:
+            key = pool.get()
+            assert isinstance(key, ec.EllipticCurvePrivateKey)
+            assert key.private_numbers() != pool.get().private_numbers()
+
+    def test_generate_error(self):
+        def generate_key():
+            raise ValueError("no keys")
+
+        with KeyPool(generate_key) as pool:
+            with pytest.raises(ValueError):
+                pool.get()
+
+    def test_generate_error_recovers(self):
+        failing = threading.Event()
+        failing.set()
+        counter = itertools.count()
+
+        def generate_key():
+            if failing.is_set() and threading.current_thread() is not (
+                threading.main_thread()
+            ):
+                raise ValueError("temporary failure")
+            return next(counter)
+
+        with KeyPool(generate_key, size=2, workers=1) as pool:
+            pool.get()
+            deadline = time.monotonic() + 10
+            while pool._threads:
+                assert time.monotonic() < deadline
+                time.sleep(0.01)
+
+            # Once generation works again the next get() restarts the
+            # worker that failed.
+            failing.clear()
+            pool.get()
+            _wait_for_keys(pool, 2)
+
+    def test_size_bound(self):
+        lengths = []
+
+        class Keys(collections.deque):
+            def append(self, key):
+                super().append(key)
+                lengths.append(len(self))
+
+        barrier = threading.Barrier(4, timeout=10)
+        local = threading.local()
+        counter = itertools.count()
+
+        def generate_key():
+            # The first key of every worker is generated concurrently, so
+            # all of them find the pool empty before appending.
+            if threading.current_thread() is not threading.main_thread():
+                if not getattr(local, "started", False):
+                    local.started = True
+                    barrier.wait()
+            return next(counter)
+
+        pool = KeyPool(generate_key, size=2, workers=4)
+        pool._keys = Keys()
+        with pool:
+            pool.get()
+            _wait_for_keys(pool, 2)
+
+        assert lengths
+        assert max(lengths) <= 2
+
+    def test_fork(self, monkeypatch):
+        with KeyPool(itertools.count().__next__, size=2) as pool:
+            pool.get()
+            _wait_for_keys(pool, 2)
+            parent_keys = list(pool._keys)
+
+            # A process with a different pid must not see keys generated by
+            # its parent.
+            pid = os.getpid()
+            monkeypatch.setattr(os, "getpid", lambda: pid + 1)
+            assert pool.get() not in parent_keys
+            _wait_for_keys(pool, 2)
+            assert not set(pool._keys) & set(parent_keys)
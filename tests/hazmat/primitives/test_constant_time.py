@@ -27,3 +27,48 @@ class TestConstantTimeBytesEq(object):
         assert constant_time.bytes_eq(b"foobar", b"foo") is False
 
         assert constant_time.bytes_eq(b"foo", b"foobar") is False
+
+    def test_bytes_like(self):
+        assert constant_time.bytes_eq(bytearray(b"foo"), b"foo") is True
+        assert constant_time.bytes_eq(b"foo", memoryview(b"foo")) is True
+        assert constant_time.bytes_eq(memoryview(b"xfoo")[1:], b"foo") is True
+        assert constant_time.bytes_eq(bytearray(b"foo"), b"bar") is False
+
+        with pytest.raises(TypeError):
+            constant_time.bytes_eq(b"foo", object())  # type: ignore[arg-type]
+
+    def test_non_contiguous(self):
+        strided = memoryview(b"abcdef")[::2]
+        with pytest.raises(TypeError):
+            constant_time.bytes_eq(strided, b"ace")
+        with pytest.raises(TypeError):
+            constant_time.bytes_eq(b"ace", strided)
+        assert constant_time.bytes_eq(strided.tobytes(), b"ace") is True
+
+
+class TestConstantTimeBytesEqAny(object):
+    def test_compares(self):
+        assert constant_time.bytes_eq_any(b"foo", [b"bar", b"foo"]) is True
+        assert constant_time.bytes_eq_any(b"foo", [b"foo", b"foo"]) is True
+        assert constant_time.bytes_eq_any(b"foo", [b"bar", b"foobar"]) is False
+        assert constant_time.bytes_eq_any(b"foo", []) is False
+        assert constant_time.bytes_eq_any(b"foo", iter([b"foo"])) is True
+
+    def test_bytes_like(self):
+        assert constant_time.bytes_eq_any(
+            memoryview(b"foo"), [bytearray(b"bar"), memoryview(b"foo")]
+        )
+
+    def test_reject_unicode(self):
+        with pytest.raises(TypeError):
+            constant_time.bytes_eq_any("foo", [b"foo"])  # type: ignore
+
+        with pytest.raises(TypeError):
+            constant_time.bytes_eq_any(b"foo", ["foo"])  # type: ignore
+
+    def test_non_contiguous(self):
+        strided = memoryview(b"abcdef")[::2]
+        with pytest.raises(TypeError):
+            constant_time.bytes_eq_any(strided, [b"ace"])
+        with pytest.raises(TypeError):
+            constant_time.bytes_eq_any(b"ace", [strided])
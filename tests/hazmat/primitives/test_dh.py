@@ -6,10 +6,12 @@
 import binascii
 import itertools
 import os
+import threading
 import typing
 
 import pytest
 
+from cryptography.exceptions import Cancelled
 from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.primitives.asymmetric import dh
 
@@ -144,6 +146,73 @@ class TestDH(object):
         with pytest.raises(ValueError):
             dh.generate_parameters(7, 512, backend)
 
+    @pytest.mark.skip_fips(reason="FIPS requires key size >= 2048")
+    def test_generate_dh_workers(self, backend):
+        parameters = dh.generate_parameters(2, 512, backend, workers=4)
+        assert parameters.parameter_numbers().p.bit_length() == 512
+
+    def test_generate_dh_invalid_workers(self, backend):
+        for workers in [0, -1, 1.5]:
+            with pytest.raises(ValueError):
+                dh.generate_parameters(
+                    2, 512, backend, workers=workers  # type: ignore[arg-type]
+                )
+
+    def test_generate_dh_cancelled(self, backend):
+        cancel = threading.Event()
+        cancel.set()
+        with pytest.raises(Cancelled):
+            dh.generate_parameters(2, 512, backend, cancel=cancel)
+
+    def test_generate_dh_progress(self, backend):
+        # progress is called when the search starts and cancel is checked
+        # right after it, so this never depends on how long the search
+        # takes.
+        cancel = threading.Event()
+        candidates = []
+
+        def progress(count):
+            candidates.append(count)
+            cancel.set()
+
+        with pytest.raises(Cancelled):
+            dh.generate_parameters(
+                2, 512, backend, workers=2, progress=progress, cancel=cancel
+            )
+        assert len(candidates) == 1
+        assert backend._consume_errors() == []
+
+    def test_generate_dh_progress_cancel_later(self, backend):
+        cancel = threading.Event()
+        candidates = []
+
+        def progress(count):
+            candidates.append(count)
+            if len(candidates) == 3:
+                cancel.set()
+
+        # A 4096-bit safe prime isn't found within three progress calls in
+        # practice, but finishing first is also a valid outcome.
+        try:
+            dh.generate_parameters(
+                2, 4096, backend, progress=progress, cancel=cancel
+            )
+        except Cancelled:
+            assert len(candidates) == 3
+        assert candidates == sorted(candidates)
+        assert backend._consume_errors() == []
+
+    def test_generate_dh_progress_raises(self, backend):
+        class Stop(Exception):
+            pass
+
+        def progress(count):
+            raise Stop
+
+        with pytest.raises(Stop):
+            dh.generate_parameters(2, 512, backend, progress=progress)
+        assert backend._consume_errors() == []
+
     @pytest.mark.skip_fips(reason="non-FIPS parameters")
     def test_dh_parameters_supported(self, backend):
         valid_p = int(
@@ -457,6 +526,57 @@ class TestDH(object):
         assert int.from_bytes(symkey2, "big") == int(vector["z"], 16)
 
 
+@pytest.mark.supported(
+    only_if=lambda backend: backend._lib.Cryptography_HAS_DH_NEW_BY_NID,
+    skip_message="Requires OpenSSL with RFC 7919 named groups",
+)
+class TestDHNamedGroups(object):
+    @pytest.mark.parametrize(
+        ("parameters", "key_size"),
+        [
+            (dh.FFDHE2048, 2048),
+            (dh.FFDHE3072, 3072),
+            (dh.FFDHE4096, 4096),
+            (dh.FFDHE6144, 6144),
+            (dh.FFDHE8192, 8192),
+        ],
+    )
+    def test_named_group(self, backend, parameters, key_size):
+        assert isinstance(parameters, dh.DHParameters)
+        numbers = parameters.parameter_numbers()
+        assert numbers.p.bit_length() == key_size
+        assert numbers.g == 2
+        assert parameters.parameter_numbers() is numbers
+        assert repr(parameters).startswith("<DHParameters(name=ffdhe")
+
+    def test_rfc7919_prime(self, backend):
+        numbers = dh.FFDHE3072.parameter_numbers()
+        assert (numbers.p, numbers.g) == (FFDH3072_P.p, FFDH3072_P.g)
+
+    def test_exchange(self, backend):
+        key1 = dh.FFDHE2048.generate_private_key()
+        key2 = dh.FFDHE2048.generate_private_key()
+        assert key1.key_size == 2048
+        assert key1.exchange(key2.public_key()) == key2.exchange(
+            key1.public_key()
+        )
+
+    def test_private_numbers_round_trip(self, backend):
+        key = dh.FFDHE2048.generate_private_key()
+        numbers = key.private_numbers()
+        loaded = numbers.private_key(backend)
+        assert loaded.private_numbers() == numbers
+
+    def test_parameter_bytes(self, backend):
+        data = dh.FFDHE2048.parameter_bytes(
+            serialization.Encoding.PEM, serialization.ParameterFormat.PKCS3
+        )
+        loaded = serialization.load_pem_parameters(data, backend)
+        assert loaded.parameter_numbers().p == (
+            dh.FFDHE2048.parameter_numbers().p
+        )
+
+
 class TestDHPrivateKeySerialization(object):
     @pytest.mark.parametrize(
         ("encoding", "loader_func"),
@@ -64,6 +64,14 @@ class TestDSA(object):
         parameters = dsa.generate_parameters(2048, backend)
         assert isinstance(parameters, dsa.DSAParameters)
 
+    def test_generate_dsa_parameters_workers(self, backend):
+        candidates = []
+        parameters = dsa.generate_parameters(
+            2048, backend, workers=2, progress=candidates.append
+        )
+        assert parameters.parameter_numbers().p.bit_length() == 2048
+        assert candidates == sorted(candidates)
+
     def test_generate_invalid_dsa_parameters(self, backend):
         with pytest.raises(ValueError):
             dsa.generate_parameters(1, backend)
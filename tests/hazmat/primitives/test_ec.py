@@ -554,6 +554,31 @@ class TestECDSAVectors(object):
         public_key = private_key.public_key()
         public_key.verify(signature, message, ec.ECDSA(hashes.SHA1()))
 
+    def test_sign_many(self, backend):
+        _skip_curve_unsupported(backend, ec.SECP256R1())
+        messages = [b"one little message", b"", b"another message"]
+        algorithm = ec.ECDSA(hashes.SHA256())
+        private_key = ec.generate_private_key(ec.SECP256R1(), backend)
+        signatures = private_key.sign_many(messages, algorithm)
+        assert len(signatures) == len(messages)
+        public_key = private_key.public_key()
+        for signature, message in zip(signatures, messages):
+            public_key.verify(signature, message, algorithm)
+
+        assert private_key.sign_many([], algorithm) == []
+
+    def test_sign_many_prehashed(self, backend):
+        _skip_curve_unsupported(backend, ec.SECP256R1())
+        private_key = ec.generate_private_key(ec.SECP256R1(), backend)
+        algorithm = ec.ECDSA(Prehashed(hashes.SHA256()))
+        with pytest.raises(ValueError):
+            private_key.sign_many([b"\x00" * 32, b"\x00" * 20], algorithm)
+
+        with raises_unsupported_algorithm(
+            exceptions._Reasons.UNSUPPORTED_PUBLIC_KEY_ALGORITHM
+        ):
+            private_key.sign_many([b"data"], DummySignatureAlgorithm())
+
     def test_sign_prehashed_digest_mismatch(self, backend):
         _skip_curve_unsupported(backend, ec.SECP256R1())
         message = b"one little message"
@@ -1291,3 +1316,70 @@ class TestECDH(object):
 
         with pytest.raises(ValueError):
             key.exchange(ec.ECDH(), public_key)
+
+    def test_exchange_many(self, backend):
+        _skip_exchange_algorithm_unsupported(
+            backend, ec.ECDH(), ec.SECP256R1()
+        )
+        key = ec.generate_private_key(ec.SECP256R1(), backend)
+        peers = [
+            ec.generate_private_key(ec.SECP256R1(), backend).public_key()
+            for _ in range(4)
+        ]
+        shared_keys = key.exchange_many(ec.ECDH(), iter(peers))
+        assert shared_keys == [key.exchange(ec.ECDH(), p) for p in peers]
+        assert key.exchange_many(ec.ECDH(), []) == []
+
+    def test_exchange_many_non_matching_curve(self, backend):
+        _skip_curve_unsupported(backend, ec.SECP256R1())
+        _skip_curve_unsupported(backend, ec.SECP384R1())
+        key = ec.generate_private_key(ec.SECP256R1(), backend)
+        peers = [
+            key.public_key(),
+            EC_KEY_SECP384R1.public_numbers.public_key(backend),
+        ]
+        with pytest.raises(ValueError):
+            key.exchange_many(ec.ECDH(), peers)
+
+        with raises_unsupported_algorithm(
+            exceptions._Reasons.UNSUPPORTED_EXCHANGE_ALGORITHM
+        ):
+            key.exchange_many(None, [key.public_key()])
+
+    def test_exchange_many_default(self, backend):
+        _skip_exchange_algorithm_unsupported(
+            backend, ec.ECDH(), ec.SECP256R1()
+        )
+        key = ec.generate_private_key(ec.SECP256R1(), backend)
+
+        class WrappedKey(ec.EllipticCurvePrivateKey):
+            curve = key.curve
+            key_size = key.key_size
+
+            def signer(self, signature_algorithm):
+                return key.signer(signature_algorithm)
+
+            def exchange(self, algorithm, peer_public_key):
+                return key.exchange(algorithm, peer_public_key)
+
+            def public_key(self):
+                return key.public_key()
+
+            def sign(self, data, signature_algorithm):
+                return key.sign(data, signature_algorithm)
+
+            def private_numbers(self):
+                return key.private_numbers()
+
+            def private_bytes(self, encoding, format, encryption_algorithm):
+                return key.private_bytes(
+                    encoding, format, encryption_algorithm
+                )
+
+        peers = [
+            ec.generate_private_key(ec.SECP256R1(), backend).public_key()
+            for _ in range(2)
+        ]
+        assert WrappedKey().exchange_many(
+            ec.ECDH(), peers
+        ) == key.exchange_many(ec.ECDH(), peers)
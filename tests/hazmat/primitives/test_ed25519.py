@@ -4,7 +4,9 @@
 
 
 import binascii
+import concurrent.futures
 import os
+import weakref
 
 import pytest
 
@@ -101,6 +103,51 @@ class TestEd25519Signing(object):
         with pytest.raises(InvalidSignature):
             key.public_key().verify(b"0" * 64, b"test data")
 
+    def test_sign_many(self, backend):
+        key = Ed25519PrivateKey.generate()
+        messages = [b"", b"test data", b"more test data", b"test data"]
+        signatures = key.sign_many(messages)
+        assert signatures == [key.sign(message) for message in messages]
+        for signature, message in zip(signatures, messages):
+            key.public_key().verify(signature, message)
+
+        assert key.sign_many(iter([])) == []
+
+    def test_sign_many_invalid_item(self, backend):
+        key = Ed25519PrivateKey.generate()
+        with pytest.raises(TypeError):
+            key.sign_many([b"test data", "text"])  # type: ignore[list-item]
+        signature = key.sign_many([b"test data"])[0]
+        key.public_key().verify(signature, b"test data")
+
+    def test_sign_many_default(self, backend):
+        key = Ed25519PrivateKey.generate()
+
+        class WrappedKey(Ed25519PrivateKey):
+            def public_key(self):
+                return key.public_key()
+
+            def private_bytes(self, encoding, format, encryption_algorithm):
+                return key.private_bytes(
+                    encoding, format, encryption_algorithm
+                )
+
+            def sign(self, data):
+                return key.sign(data)
+
+        messages = [b"test data", b"more test data"]
+        assert WrappedKey().sign_many(messages) == key.sign_many(messages)
+
+    def test_sign_concurrent(self, backend):
+        key = Ed25519PrivateKey.generate()
+        public_key = key.public_key()
+        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as pool:
+            messages = [b"%d" % i for i in range(64)]
+            signatures = list(pool.map(key.sign, messages))
+
+        for signature, message in zip(signatures, messages):
+            public_key.verify(signature, message)
+
     def test_generate(self, backend):
         key = Ed25519PrivateKey.generate()
         assert key
@@ -134,6 +181,32 @@ class TestEd25519Signing(object):
         with pytest.raises(ValueError):
             Ed25519PublicKey.from_public_bytes(b"a" * 33)
 
+    def test_from_public_bytes_many(self, backend):
+        keys = [Ed25519PrivateKey.generate() for _ in range(3)]
+        raw = [
+            key.public_key().public_bytes(
+                serialization.Encoding.Raw, serialization.PublicFormat.Raw
+            )
+            for key in keys
+        ]
+        public_keys = Ed25519PublicKey.from_public_bytes_many(raw)
+        for key, public_key, data in zip(keys, public_keys, raw):
+            assert not hasattr(public_key, "__dict__")
+            assert weakref.ref(public_key)() is public_key
+            public_key.verify(key.sign(b"test data"), b"test data")
+            with pytest.raises(InvalidSignature):
+                public_key.verify(key.sign(b"test data"), b"wrong data")
+            assert (
+                public_key.public_bytes(
+                    serialization.Encoding.Raw, serialization.PublicFormat.Raw
+                )
+                == data
+            )
+
+        assert Ed25519PublicKey.from_public_bytes_many([]) == []
+        with pytest.raises(ValueError):
+            Ed25519PublicKey.from_public_bytes_many([b"a" * 33])
+
     def test_invalid_length_from_private_bytes(self, backend):
         with pytest.raises(ValueError):
             Ed25519PrivateKey.from_private_bytes(b"a" * 31)
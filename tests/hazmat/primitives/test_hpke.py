@@ -0,0 +1,225 @@
+# This file is dual licensed under the terms of the Apache License, Version
+# 2.0, and the BSD License. See the LICENSE file in the root of this repository
+# for complete details.
+
+
+import binascii
+import itertools
+
+import pytest
+
+from cryptography.exceptions import InvalidTag, UnsupportedAlgorithm
+from cryptography.hazmat.primitives import hpke
+from cryptography.hazmat.primitives.asymmetric.x25519 import X25519PrivateKey
+from cryptography.hazmat.primitives.ciphers.aead import ChaCha20Poly1305
+
+
+def _suite(kdf=hpke.KDF.HKDF_SHA256, aead=hpke.AEAD.AES_128_GCM):
+    return hpke.Suite(hpke.KEM.DHKEM_X25519_HKDF_SHA256, kdf, aead)
+
+
+def _chacha_supported():
+    try:
+        ChaCha20Poly1305(b"0" * 32)
+        return True
+    except UnsupportedAlgorithm:
+        return False
+
+
+@pytest.mark.supported(
+    only_if=lambda backend: backend.x25519_supported(),
+    skip_message="Requires OpenSSL with X25519 support",
+)
+class TestHPKE(object):
+    def test_rfc9180_base_vector(self, backend):
+        # RFC 9180 Appendix A.1.1:
+        # DHKEM(X25519, HKDF-SHA256), HKDF-SHA256, AES-128-GCM, base mode
+        ephemeral_key = X25519PrivateKey.from_private_bytes(
+            binascii.unhexlify(
+                b"52c4a758a802cd8b936eceea314432798d5baf2d7e9235dc084ab1b9cfa"
+                b"2f736"
+            )
+        )
+        recipient_key = X25519PrivateKey.from_private_bytes(
+            binascii.unhexlify(
+                b"4612c550263fc8ad58375df3f557aac531d26850903e55a9f23f21d8534"
+                b"e8ac8"
+            )
+        )
+        info = binascii.unhexlify(b"4f6465206f6e2061204772656369616e2055726e")
+        plaintext = b"Beauty is truth, truth beauty"
+        ciphertexts = [
+            b"f938558b5d72f1a23810b4be2ab4f84331acc02fc97babc53a52ae8218a355"
+            b"a96d8770ac83d07bea87e13c512a",
+            b"af2d7e9ac9ae7e270f46ba1f975be53c09f8d875bdc8535458c2494e8a6eab"
+            b"251c03d0c22a56b8ca42c2063b84",
+        ]
+        exports = [
+            (
+                b"",
+                b"3853fe2b4035195a573ffc53856e77058e15d9ea064de3e59f4961d0095"
+                b"250ee",
+            ),
+            (
+                b"\x00",
+                b"2e8f0b54673c7029649d4eb9d5e33bf1872cf76d623ff164ac185da9e88"
+                b"c21a5",
+            ),
+            (
+                b"TestContext",
+                b"e9e43065102c3836401bed8c3c3c75ae46be1639869391d62c61f1ec7af"
+                b"54931",
+            ),
+        ]
+
+        suite = _suite()
+        enc, sender = suite._setup_sender(
+            recipient_key.public_key(), info, ephemeral_key
+        )
+        assert binascii.hexlify(enc) == (
+            b"37fda3567bdbd628e88668c3c8d7e97d1d1253b6d4ea6d44c150f741f1bf4431"
+        )
+        recipient = suite.setup_recipient(enc, recipient_key, info)
+        for seq, ciphertext in enumerate(ciphertexts):
+            aad = b"Count-%d" % seq
+            ct = sender.seal(plaintext, aad)
+            assert binascii.hexlify(ct) == ciphertext
+            assert recipient.open(ct, aad) == plaintext
+
+        for exporter_context, exported in exports:
+            for context in [sender, recipient]:
+                secret = context.export(exporter_context, 32)
+                assert binascii.hexlify(secret) == exported
+
+    @pytest.mark.parametrize(
+        ("kdf", "aead"), list(itertools.product(hpke.KDF, hpke.AEAD))
+    )
+    def test_seal_open(self, kdf, aead, backend):
+        if aead is hpke.AEAD.CHACHA20_POLY1305 and not _chacha_supported():
+            pytest.skip("Does not support ChaCha20Poly1305")
+
+        suite = _suite(kdf, aead)
+        assert (suite.kdf, suite.aead) == (kdf, aead)
+        key = X25519PrivateKey.generate()
+        ciphertext = suite.seal(key.public_key(), b"data", b"info", b"aad")
+        assert suite.open(key, ciphertext, b"info", b"aad") == b"data"
+
+        with pytest.raises(InvalidTag):
+            suite.open(key, ciphertext, b"other info", b"aad")
+        with pytest.raises(InvalidTag):
+            suite.open(key, ciphertext, b"info", b"other aad")
+        with pytest.raises(InvalidTag):
+            suite.open(
+                X25519PrivateKey.generate(), ciphertext, b"info", b"aad"
+            )
+        with pytest.raises(InvalidTag):
+            suite.open(key, ciphertext[:31])
+
+    def test_context_reuse(self, backend):
+        suite = _suite()
+        key = X25519PrivateKey.generate()
+        enc, sender = suite.setup_sender(key.public_key())
+        recipient = suite.setup_recipient(enc, key)
+        ciphertexts = [sender.seal(b"message %d" % i) for i in range(3)]
+        assert sender.export(b"context", 16) == recipient.export(
+            b"context", 16
+        )
+
+        # Messages must be opened in order, but a failure does not advance
+        # the recipient's sequence number.
+        with pytest.raises(InvalidTag):
+            recipient.open(ciphertexts[1])
+        for i, ciphertext in enumerate(ciphertexts):
+            assert recipient.open(ciphertext) == b"message %d" % i
+
+    def test_chunks(self, backend):
+        suite = _suite()
+        key = X25519PrivateKey.generate()
+        chunks = [b"a" * 100, b"b" * 100, b"c"]
+        enc, sender = suite.setup_sender(key.public_key(), b"info")
+        sealed = list(sender.seal_chunks(iter(chunks), b"aad"))
+        assert len(sealed) == 3
+
+        recipient = suite.setup_recipient(enc, key, b"info")
+        assert list(recipient.open_chunks(sealed, b"aad")) == chunks
+
+        # Truncating the stream is detected.
+        recipient = suite.setup_recipient(enc, key, b"info")
+        with pytest.raises(InvalidTag):
+            list(recipient.open_chunks(sealed[:2], b"aad"))
+
+        # So is reordering it.
+        recipient = suite.setup_recipient(enc, key, b"info")
+        with pytest.raises(InvalidTag):
+            list(recipient.open_chunks(sealed[::-1], b"aad"))
+
+    def test_chunks_not_confused_with_messages(self, backend):
+        suite = _suite()
+        key = X25519PrivateKey.generate()
+        enc, sender = suite.setup_sender(key.public_key())
+        # A message sealed with associated data that ends like the old final
+        # chunk marker is not accepted as the end of a stream.
+        sealed = [sender.seal(b"data", b"aad\x01")]
+        recipient = suite.setup_recipient(enc, key)
+        with pytest.raises(InvalidTag):
+            list(recipient.open_chunks(sealed, b"aad"))
+
+        # Nor is a chunk sealed with different associated data and marker.
+        enc, sender = suite.setup_sender(key.public_key())
+        sealed = list(sender.seal_chunks([b"a", b"b"], b"aad\x01"))
+        recipient = suite.setup_recipient(enc, key)
+        with pytest.raises(InvalidTag):
+            list(recipient.open_chunks(sealed[:1], b"aad"))
+
+        # A stream sealed after other messages has its own chunk indexes, and
+        # only opens from the same point in the sequence.
+        enc, sender = suite.setup_sender(key.public_key())
+        message = sender.seal(b"message")
+        sealed = list(sender.seal_chunks([b"a", b"b"]))
+        recipient = suite.setup_recipient(enc, key)
+        assert recipient.open(message) == b"message"
+        assert list(recipient.open_chunks(sealed)) == [b"a", b"b"]
+
+    def test_empty_chunks(self, backend):
+        suite = _suite()
+        key = X25519PrivateKey.generate()
+        enc, sender = suite.setup_sender(key.public_key())
+        sealed = list(sender.seal_chunks([]))
+        assert len(sealed) == 1
+
+        recipient = suite.setup_recipient(enc, key)
+        assert list(recipient.open_chunks(sealed)) == [b""]
+        recipient = suite.setup_recipient(enc, key)
+        with pytest.raises(InvalidTag):
+            list(recipient.open_chunks([]))
+
+    def test_invalid_arguments(self, backend):
+        with pytest.raises(TypeError):
+            hpke.Suite(
+                None,  # type: ignore[arg-type]
+                hpke.KDF.HKDF_SHA256,
+                hpke.AEAD.AES_128_GCM,
+            )
+        with pytest.raises(TypeError):
+            hpke.Suite(
+                hpke.KEM.DHKEM_X25519_HKDF_SHA256,
+                None,  # type: ignore[arg-type]
+                hpke.AEAD.AES_128_GCM,
+            )
+        with pytest.raises(TypeError):
+            hpke.Suite(
+                hpke.KEM.DHKEM_X25519_HKDF_SHA256,
+                hpke.KDF.HKDF_SHA256,
+                None,  # type: ignore[arg-type]
+            )
+
+        suite = _suite()
+        key = X25519PrivateKey.generate()
+        with pytest.raises(TypeError):
+            suite.seal(key, b"data")  # type: ignore[arg-type]
+        with pytest.raises(TypeError):
+            suite.open(key.public_key(), b"0" * 48)  # type: ignore[arg-type]
+        with pytest.raises(TypeError):
+            suite.seal(key.public_key(), b"data", info="info")  # type: ignore
+        with pytest.raises(ValueError):
+            suite.setup_recipient(b"0" * 31, key)
@@ -194,6 +194,11 @@ class TestRSA(object):
         pkey = skey.public_key()
         assert isinstance(pkey.public_numbers(), rsa.RSAPublicNumbers)
 
+    def test_generate_rsa_keys_workers(self, backend):
+        skey = rsa.generate_private_key(65537, 2048, backend, workers=2)
+        assert skey.key_size == 2048
+        _check_rsa_private_numbers_if_serializable(skey)
+
     def test_generate_bad_public_exponent(self, backend):
         with pytest.raises(ValueError):
             rsa.generate_private_key(
@@ -763,6 +768,123 @@ class TestRSASignature(object):
                 RSA_KEY_CORRUPTED, password=None, backend=backend
             )
 
+    def test_corrupted_private_key_skip_validation(self, backend):
+        key = serialization.load_pem_private_key(
+            RSA_KEY_CORRUPTED,
+            password=None,
+            backend=backend,
+            unsafe_skip_rsa_key_validation=True,
+        )
+        assert isinstance(key, rsa.RSAPrivateKey)
+
+        der = key.private_bytes(
+            serialization.Encoding.DER,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        )
+        with pytest.raises(ValueError):
+            serialization.load_der_private_key(der, None, backend)
+        key = serialization.load_der_private_key(
+            der, None, backend, unsafe_skip_rsa_key_validation=True
+        )
+        assert isinstance(key, rsa.RSAPrivateKey)
+
+    def test_private_numbers_skip_validation(self, backend):
+        private_key = RSA_KEY_2048.private_key(
+            backend, unsafe_skip_rsa_key_validation=True
+        )
+        signature = private_key.sign(
+            b"data", padding.PKCS1v15(), hashes.SHA256()
+        )
+        private_key.public_key().verify(
+            signature, b"data", padding.PKCS1v15(), hashes.SHA256()
+        )
+        assert private_key.private_numbers() == RSA_KEY_2048
+
+    @pytest.mark.supported(
+        only_if=lambda backend: backend.rsa_padding_supported(
+            padding.PSS(
+                mgf=padding.MGF1(hashes.SHA256()),
+                salt_length=padding.PSS.MAX_LENGTH,
+            )
+        ),
+        skip_message="Does not support PSS.",
+    )
+    @pytest.mark.parametrize("max_cached", [None, 1])
+    def test_reused_context_mixed_paddings(
+        self, backend, monkeypatch, max_cached
+    ):
+        if max_cached is not None:
+            # Evict a cached context on every change of padding or hash.
+            from cryptography.hazmat.backends.openssl import rsa as ossl_rsa
+
+            monkeypatch.setattr(ossl_rsa, "_MAX_CACHED_PKEY_CTXS", max_cached)
+
+        private_key = RSA_KEY_2048.private_key(backend)
+        public_key = private_key.public_key()
+        paddings = [
+            padding.PKCS1v15(),
+            padding.PSS(
+                mgf=padding.MGF1(hashes.SHA256()),
+                salt_length=padding.PSS.MAX_LENGTH,
+            ),
+            padding.PSS(mgf=padding.MGF1(hashes.SHA1()), salt_length=20),
+        ]
+        for _ in range(2):
+            for pad in paddings:
+                for algorithm in [hashes.SHA256(), hashes.SHA512()]:
+                    signature = private_key.sign(b"data", pad, algorithm)
+                    public_key.verify(signature, b"data", pad, algorithm)
+                    for other in paddings:
+                        if other is pad:
+                            continue
+                        with pytest.raises(InvalidSignature):
+                            public_key.verify(
+                                signature, b"data", other, algorithm
+                            )
+
+    def test_sign_many(self, backend):
+        private_key = RSA_KEY_2048.private_key(backend)
+        public_key = private_key.public_key()
+        messages = [b"", b"data", b"more data"]
+        for pad in [
+            padding.PKCS1v15(),
+            padding.PSS(
+                mgf=padding.MGF1(hashes.SHA256()),
+                salt_length=padding.PSS.MAX_LENGTH,
+            ),
+        ]:
+            signatures = private_key.sign_many(messages, pad, hashes.SHA256())
+            assert len(signatures) == len(messages)
+            for signature, message in zip(signatures, messages):
+                public_key.verify(signature, message, pad, hashes.SHA256())
+
+        assert (
+            private_key.sign_many([], padding.PKCS1v15(), hashes.SHA256())
+            == []
+        )
+
+    def test_sign_many_prehashed(self, backend):
+        private_key = RSA_KEY_2048.private_key(backend)
+        digests = [b"\x00" * 32, b"\x01" * 32]
+        signatures = private_key.sign_many(
+            digests, padding.PKCS1v15(), asym_utils.Prehashed(hashes.SHA256())
+        )
+        assert signatures == [
+            private_key.sign(
+                digest,
+                padding.PKCS1v15(),
+                asym_utils.Prehashed(hashes.SHA256()),
+            )
+            for digest in digests
+        ]
+        with pytest.raises(ValueError):
+            private_key.sign_many(
+                [b"\x00" * 20],
+                padding.PKCS1v15(),
+                asym_utils.Prehashed(hashes.SHA256()),
+            )
+
 
 class TestRSAVerification(object):
     @pytest.mark.supported(
@@ -1712,6 +1834,40 @@ class TestRSADecryption(object):
                 ),
             )
 
+    @pytest.mark.supported(
+        only_if=lambda backend: backend.rsa_padding_supported(
+            padding.OAEP(
+                mgf=padding.MGF1(algorithm=hashes.SHA256()),
+                algorithm=hashes.SHA256(),
+                label=b"label",
+            )
+        ),
+        skip_message="Does not support OAEP with labels.",
+    )
+    def test_reused_context_oaep_labels(self, backend):
+        private_key = RSA_KEY_2048.private_key(backend)
+        public_key = private_key.public_key()
+
+        def oaep(label):
+            return padding.OAEP(
+                mgf=padding.MGF1(algorithm=hashes.SHA256()),
+                algorithm=hashes.SHA256(),
+                label=label,
+            )
+
+        # Labels are applied to each duplicated context, so they must not
+        # leak between operations that share a cached context.
+        ct_a = public_key.encrypt(b"data", oaep(b"a"))
+        ct_none = public_key.encrypt(b"data", oaep(None))
+        ct_b = public_key.encrypt(b"data", oaep(b"b"))
+        assert private_key.decrypt(ct_a, oaep(b"a")) == b"data"
+        assert private_key.decrypt(ct_none, oaep(None)) == b"data"
+        assert private_key.decrypt(ct_b, oaep(b"b")) == b"data"
+        with pytest.raises(ValueError):
+            private_key.decrypt(ct_a, oaep(b"b"))
+        with pytest.raises(ValueError):
+            private_key.decrypt(ct_b, oaep(None))
+
     @pytest.mark.supported(
         only_if=lambda backend: backend.rsa_padding_supported(
             padding.OAEP(
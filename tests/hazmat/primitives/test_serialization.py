@@ -23,6 +23,7 @@ from cryptography.hazmat.primitives.asymmetric import (
 from cryptography.hazmat.primitives.serialization import (
     BestAvailableEncryption,
     Encoding,
+    KeyCache,
     KeySerializationEncryption,
     NoEncryption,
     PrivateFormat,
@@ -2322,3 +2323,88 @@ class TestOpenSSHSerialization(object):
                 key.private_bytes(
                     Encoding.PEM, PrivateFormat.OpenSSH, NoEncryption()
                 )
+
+
+class TestKeyCache(object):
+    def test_invalid_maxsize(self):
+        with pytest.raises(ValueError):
+            KeyCache(0)
+        with pytest.raises(TypeError):
+            KeyCache("10")  # type: ignore[arg-type]
+
+    def test_load_pem_private_key(self, backend):
+        data = load_vectors_from_file(
+            os.path.join("asymmetric", "PKCS8", "enc-rsa-pkcs8.pem"),
+            lambda pemfile: pemfile.read(),
+            mode="rb",
+        )
+        cache = KeyCache()
+        key = cache.load_pem_private_key(data, b"foobar")
+        assert isinstance(key, rsa.RSAPrivateKey)
+        assert cache.load_pem_private_key(data, bytearray(b"foobar")) is key
+        assert (cache.hits, cache.misses, cache.currsize) == (1, 1, 1)
+
+        with pytest.raises(ValueError):
+            cache.load_pem_private_key(data, b"wrong")
+        with pytest.raises(TypeError):
+            cache.load_pem_private_key(data, "foobar")  # type: ignore
+        assert cache.currsize == 1
+
+        other = cache.load_pem_private_key(
+            data, b"foobar", unsafe_skip_rsa_key_validation=True
+        )
+        assert other is not key
+        assert other.private_numbers() == key.private_numbers()
+        assert cache.currsize == 2
+
+    def test_load_der_private_key(self, backend):
+        data = load_vectors_from_file(
+            os.path.join("asymmetric", "DER_Serialization", "testrsa.der"),
+            lambda derfile: derfile.read(),
+            mode="rb",
+        )
+        cache = KeyCache()
+        key = cache.load_der_private_key(data, None)
+        assert cache.load_der_private_key(data, None) is key
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_load_public_keys(self, backend):
+        pem = load_vectors_from_file(
+            os.path.join("asymmetric", "PKCS8", "unenc-rsa-pkcs8.pub.pem"),
+            lambda pemfile: pemfile.read(),
+            mode="rb",
+        )
+        cache = KeyCache()
+        key = cache.load_pem_public_key(pem)
+        assert cache.load_pem_public_key(pem) is key
+        der = key.public_bytes(Encoding.DER, PublicFormat.SubjectPublicKeyInfo)
+        der_key = cache.load_der_public_key(der)
+        assert der_key is not key
+        assert cache.load_der_public_key(der) is der_key
+        assert der_key.public_numbers() == key.public_numbers()
+        assert (cache.hits, cache.misses, cache.currsize) == (2, 2, 2)
+
+    def test_eviction(self, backend):
+        keys = [
+            ec.generate_private_key(ec.SECP256R1()).public_key()
+            for _ in range(3)
+        ]
+        pems = [
+            k.public_bytes(Encoding.PEM, PublicFormat.SubjectPublicKeyInfo)
+            for k in keys
+        ]
+        cache = KeyCache(maxsize=2)
+        first = cache.load_pem_public_key(pems[0])
+        cache.load_pem_public_key(pems[1])
+        # Touch the first key so the second is least recently used.
+        assert cache.load_pem_public_key(pems[0]) is first
+        cache.load_pem_public_key(pems[2])
+        assert cache.currsize == 2
+        assert cache.load_pem_public_key(pems[0]) is first
+        assert cache.misses == 3
+
+        cache.load_pem_public_key(pems[1])
+        assert cache.misses == 4
+
+        cache.clear()
+        assert (cache.hits, cache.misses, cache.currsize) == (0, 0, 0)
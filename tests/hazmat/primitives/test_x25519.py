@@ -5,6 +5,7 @@
 
 import binascii
 import os
+import weakref
 
 import pytest
 
@@ -173,6 +174,45 @@ class TestX25519Exchange(object):
         with pytest.raises(ValueError):
             X25519PublicKey.from_public_bytes(b"a" * 33)
 
+    def test_from_public_bytes_many(self, backend):
+        private_key = X25519PrivateKey.generate()
+        peers = [X25519PrivateKey.generate() for _ in range(3)]
+        raw = [
+            peer.public_key().public_bytes(
+                serialization.Encoding.Raw, serialization.PublicFormat.Raw
+            )
+            for peer in peers
+        ]
+        public_keys = X25519PublicKey.from_public_bytes_many(iter(raw))
+        assert len(public_keys) == len(peers)
+        for peer, public_key, data in zip(peers, public_keys, raw):
+            assert not hasattr(public_key, "__dict__")
+            assert weakref.ref(public_key)() is public_key
+            assert private_key.exchange(public_key) == peer.exchange(
+                private_key.public_key()
+            )
+            assert (
+                public_key.public_bytes(
+                    serialization.Encoding.Raw, serialization.PublicFormat.Raw
+                )
+                == data
+            )
+            assert public_key.public_bytes(
+                serialization.Encoding.DER,
+                serialization.PublicFormat.SubjectPublicKeyInfo,
+            ) == peer.public_key().public_bytes(
+                serialization.Encoding.DER,
+                serialization.PublicFormat.SubjectPublicKeyInfo,
+            )
+
+        assert X25519PublicKey.from_public_bytes_many([]) == []
+        with pytest.raises(ValueError):
+            X25519PublicKey.from_public_bytes_many([raw[0], b"a" * 31])
+        with pytest.raises(TypeError):
+            X25519PublicKey.from_public_bytes_many(
+                [bytearray(raw[0])]  # type: ignore[list-item]
+            )
+
     def test_invalid_length_from_private_bytes(self, backend):
         with pytest.raises(ValueError):
             X25519PrivateKey.from_private_bytes(b"a" * 31)
@@ -87,6 +87,43 @@ class TestHOTP(object):
         with pytest.raises(InvalidToken):
             hotp.verify(b"123456", counter)
 
+    def test_verify_window(self, backend):
+        secret = b"12345678901234567890"
+        hotp = HOTP(secret, 6, SHA1(), backend)
+
+        hotp.verify(b"359152", 0, window=2)
+        hotp.verify(b"359152", 2, window=0)
+        with pytest.raises(InvalidToken):
+            hotp.verify(b"359152", 0, window=1)
+        with pytest.raises(InvalidToken):
+            hotp.verify(b"359152", 3, window=5)
+
+    def test_verify_invalid_window(self, backend):
+        secret = b"12345678901234567890"
+        hotp = HOTP(secret, 6, SHA1(), backend)
+
+        with pytest.raises(ValueError):
+            hotp.verify(b"755224", 0, window=-1)
+        with pytest.raises(TypeError):
+            hotp.verify(b"755224", 0, window=1.5)  # type: ignore[arg-type]
+
+    def test_generate_range(self, backend):
+        secret = b"12345678901234567890"
+        hotp = HOTP(secret, 6, SHA1(), backend)
+
+        assert hotp.generate_range(0, 10) == [v["hotp"] for v in vectors]
+        assert hotp.generate_range(3, 2) == [b"969429", b"338314"]
+        assert hotp.generate_range(3, 0) == []
+
+    def test_generate_range_invalid_count(self, backend):
+        secret = b"12345678901234567890"
+        hotp = HOTP(secret, 6, SHA1(), backend)
+
+        with pytest.raises(ValueError):
+            hotp.generate_range(0, -1)
+        with pytest.raises(TypeError):
+            hotp.generate_range(0, "3")  # type: ignore[arg-type]
+
     def test_length_not_int(self, backend):
         secret = b"12345678901234567890"
 
@@ -8,7 +8,7 @@ import pytest
 from cryptography.exceptions import _Reasons
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.twofactor import InvalidToken
-from cryptography.hazmat.primitives.twofactor.totp import TOTP
+from cryptography.hazmat.primitives.twofactor.totp import TOTP, verify_many
 
 from ....utils import (
     load_nist_vectors,
@@ -119,6 +119,25 @@ class TestTOTP(object):
         with pytest.raises(InvalidToken):
             totp.verify(b"12345678", time)
 
+    def test_verify_window(self, backend):
+        secret = b"12345678901234567890"
+        totp = TOTP(secret, 8, hashes.SHA1(), 30, backend)
+
+        totp.verify(b"94287082", 59 + 30, window=1)
+        totp.verify(b"94287082", 59 - 30, window=1)
+        with pytest.raises(InvalidToken):
+            totp.verify(b"94287082", 59 + 60, window=1)
+        with pytest.raises(InvalidToken):
+            totp.verify(b"94287082", 59 + 30)
+
+    def test_verify_window_clamped_at_zero(self, backend):
+        secret = b"12345678901234567890"
+        totp = TOTP(secret, 8, hashes.SHA1(), 30, backend)
+
+        totp.verify(totp.generate(0), 0, window=3)
+        with pytest.raises(ValueError):
+            totp.verify(b"94287082", 59, window=-1)
+
     def test_floating_point_time_generate(self, backend):
         secret = b"12345678901234567890"
         time = 59.1
@@ -149,6 +168,77 @@ class TestTOTP(object):
         assert totp.generate(time) == b"53049576"
 
 
+class TestVerifyMany(object):
+    @pytest.mark.supported(
+        only_if=lambda backend: backend.hmac_supported(hashes.SHA256()),
+        skip_message="Does not support HMAC-SHA256.",
+    )
+    def test_vectors(self, backend):
+        tokens = [
+            (v["secret"], v["totp"], int(v["time"]))
+            for v in vectors
+            if v["mode"] == b"SHA256"
+        ]
+        assert verify_many(tokens, 8, hashes.SHA256(), 30, backend) == [
+            True
+        ] * len(tokens)
+
+    def test_mixed_results(self, backend):
+        secret = b"12345678901234567890"
+        other = b"09876543210987654321"
+        tokens = [
+            (secret, b"94287082", 59),
+            (other, b"94287082", 59),
+            (secret, b"12345678", 59),
+            (secret, b"94287082", 89),
+        ]
+        assert verify_many(tokens, 8, hashes.SHA1(), 30, backend) == [
+            True,
+            False,
+            False,
+            False,
+        ]
+        assert verify_many(
+            tokens, 8, hashes.SHA1(), 30, backend, window=1
+        ) == [True, False, False, True]
+
+    def test_empty(self, backend):
+        assert verify_many([], 8, hashes.SHA1(), 30, backend) == []
+
+    def test_invalid_parameters(self, backend):
+        secret = b"12345678901234567890"
+        tokens = [(secret, b"94287082", 59)]
+        with pytest.raises(ValueError):
+            verify_many(tokens, 4, hashes.SHA1(), 30, backend)
+        with pytest.raises(TypeError):
+            verify_many(
+                tokens, 8, hashes.MD5(), 30, backend  # type: ignore[arg-type]
+            )
+        with pytest.raises(ValueError):
+            verify_many(tokens, 8, hashes.SHA1(), 30, backend, window=-1)
+
+    def test_short_key(self, backend):
+        secret = b"12345678901234567890"
+        tokens = [
+            (secret, b"94287082", 59),
+            (b"short", b"94287082", 59),
+            (secret, b"94287082", 59),
+        ]
+        assert verify_many(tokens, 8, hashes.SHA1(), 30, backend) == [
+            True,
+            False,
+            True,
+        ]
+
+    def test_unenforced_key_length(self, backend):
+        secret = b"1234567890"
+        totp = TOTP(secret, 6, hashes.SHA1(), 30, backend, False)
+        tokens = [(secret, totp.generate(1000), 1000)]
+        assert verify_many(
+            tokens, 6, hashes.SHA1(), 30, backend, enforce_key_length=False
+        ) == [True]
+
+
 def test_invalid_backend():
     secret = b"12345678901234567890"
 
@@ -162,3 +252,12 @@ def test_invalid_backend():
             30,
             pretend_backend,  # type: ignore[arg-type]
         )
+
+    with raises_unsupported_algorithm(_Reasons.BACKEND_MISSING_INTERFACE):
+        verify_many(
+            [],
+            8,
+            hashes.SHA1(),
+            30,
+            pretend_backend,  # type: ignore[arg-type]
+        )
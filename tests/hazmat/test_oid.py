@@ -3,15 +3,53 @@
 # for complete details.
 
 
+import copy
+import pickle
+
 import pytest
 
+from cryptography.hazmat import _oid
 from cryptography.hazmat._oid import ObjectIdentifier
+from cryptography.x509.oid import ExtensionOID
 
 
 def test_basic_oid():
     assert ObjectIdentifier("1.2.3.4").dotted_string == "1.2.3.4"
 
 
+def test_interned():
+    oid = ExtensionOID.BASIC_CONSTRAINTS
+    assert ObjectIdentifier("2.5.29.19") is oid
+    assert pickle.loads(pickle.dumps(oid)) is oid
+    assert copy.deepcopy(oid) is oid
+
+
+def test_not_interned():
+    # Only well-known OIDs are interned, so unknown ones from untrusted
+    # input can't fill the table.
+    interned = len(_oid._INTERNED_OIDS)
+    oid = ObjectIdentifier("1.2.3.4.5.6.7.8.9")
+    other = ObjectIdentifier("1.2.3.4.5.6.7.8.9")
+    assert oid is not other
+    assert oid == other
+    assert hash(oid) == hash(other)
+    assert pickle.loads(pickle.dumps(oid)) == oid
+    assert len(_oid._INTERNED_OIDS) == interned
+
+
+def test_subclass():
+    class OID(ObjectIdentifier):
+        def __init__(self, dotted_string: str) -> None:
+            super().__init__(dotted_string)
+            self.extra = True
+
+    oid = OID("2.5.29.19")
+    assert type(oid) is OID
+    assert oid.extra
+    assert oid == ExtensionOID.BASIC_CONSTRAINTS
+    assert oid is not ExtensionOID.BASIC_CONSTRAINTS
+
+
 def test_oid_constraint():
     # Too short
     with pytest.raises(ValueError):
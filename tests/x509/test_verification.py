@@ -0,0 +1,232 @@
+# This file is dual licensed under the terms of the Apache License, Version
+# 2.0, and the BSD License. See the LICENSE file in the root of this repository
+# for complete details.
+
+
+import datetime
+import os
+
+import pytest
+
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.x509.name import _ASN1Type
+from cryptography.x509.oid import ExtendedKeyUsageOID, NameOID
+from cryptography.x509.verification import (
+    CertificateIndex,
+    Purpose,
+    Store,
+    VerificationError,
+)
+
+from .test_x509 import _load_cert
+
+
+def _load_pkits_cert(name):
+    return _load_cert(
+        os.path.join("x509", "PKITS_data", "certs", name),
+        x509.load_der_x509_certificate,
+    )
+
+
+def _build_cert(subject, issuer, issuer_key, extensions):
+    key = ec.generate_private_key(ec.SECP256R1())
+    builder = (
+        x509.CertificateBuilder()
+        .subject_name(
+            x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, subject)])
+        )
+        .issuer_name(
+            x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, issuer)])
+        )
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(datetime.datetime(2020, 1, 1))
+        .not_valid_after(datetime.datetime(2030, 1, 1))
+    )
+    for extension in extensions:
+        builder = builder.add_extension(extension, critical=False)
+
+    return builder.sign(issuer_key or key, hashes.SHA256()), key
+
+
+class TestStore(object):
+    def test_verify(self, backend):
+        root = _load_pkits_cert("TrustAnchorRootCertificate.crt")
+        ca = _load_pkits_cert("GoodCACert.crt")
+        leaf = _load_pkits_cert("ValidCertificatePathTest1EE.crt")
+        store = Store([root])
+        time = datetime.datetime(2020, 1, 1)
+
+        for _ in range(2):
+            chain = store.verify(leaf, [ca], time)
+            assert chain == [leaf, ca, root]
+            assert chain[1] is ca
+            assert chain[2] is root
+
+        with pytest.raises(VerificationError):
+            store.verify(leaf, [], time)
+        with pytest.raises(VerificationError):
+            store.verify(leaf, [ca], datetime.datetime(2000, 1, 1))
+
+    def test_verify_invalid_signature(self, backend):
+        store = Store([_load_pkits_cert("TrustAnchorRootCertificate.crt")])
+        with pytest.raises(VerificationError):
+            store.verify(
+                _load_pkits_cert("InvalidEESignatureTest3EE.crt"),
+                [_load_pkits_cert("GoodCACert.crt")],
+                datetime.datetime(2020, 1, 1),
+            )
+
+    def test_verify_purpose(self, backend):
+        root, root_key = _build_cert(
+            "Root",
+            "Root",
+            None,
+            [x509.BasicConstraints(ca=True, path_length=None)],
+        )
+        leaf, _ = _build_cert(
+            "Client",
+            "Root",
+            root_key,
+            [x509.ExtendedKeyUsage([ExtendedKeyUsageOID.CLIENT_AUTH])],
+        )
+        store = Store([root])
+        time = datetime.datetime(2021, 1, 1)
+        assert store.verify(leaf, time=time) == [leaf, root]
+        assert store.verify(leaf, time=time, purpose=Purpose.CLIENT_AUTH) == [
+            leaf,
+            root,
+        ]
+        with pytest.raises(VerificationError):
+            store.verify(leaf, time=time, purpose=Purpose.SERVER_AUTH)
+
+    def test_invalid_arguments(self, backend):
+        root = _load_pkits_cert("TrustAnchorRootCertificate.crt")
+        with pytest.raises(ValueError):
+            Store([])
+        with pytest.raises(TypeError):
+            Store([b"notacert"])  # type: ignore[list-item]
+
+        store = Store([root])
+        with pytest.raises(TypeError):
+            store.verify(b"notacert")  # type: ignore[arg-type]
+        with pytest.raises(TypeError):
+            store.verify(root, [b"notacert"])  # type: ignore[list-item]
+        with pytest.raises(TypeError):
+            store.verify(root, time="now")  # type: ignore[arg-type]
+        with pytest.raises(TypeError):
+            store.verify(root, purpose="serverAuth")  # type: ignore[arg-type]
+
+
+class TestCertificateIndex(object):
+    def test_lookups(self, backend):
+        root = _load_pkits_cert("TrustAnchorRootCertificate.crt")
+        ca = _load_pkits_cert("GoodCACert.crt")
+        leaf = _load_pkits_cert("ValidCertificatePathTest1EE.crt")
+        index = CertificateIndex([root, ca])
+        index.add(leaf)
+        index.extend([root, leaf])
+        assert len(index) == 3
+        assert list(index) == [root, ca, leaf]
+        assert leaf in index
+
+        assert index.get_by_subject(ca.subject) == [ca]
+        assert index.get_by_issuer(root.subject) == [root, ca]
+        assert index.get_by_issuer_and_serial_number(
+            leaf.issuer, leaf.serial_number
+        ) == [leaf]
+        assert index.get_by_issuer_and_serial_number(leaf.issuer, 12345) == []
+        ca_ski = ca.extensions.get_extension_for_class(
+            x509.SubjectKeyIdentifier
+        ).value.digest
+        assert index.get_by_subject_key_identifier(ca_ski) == [ca]
+        assert index.get_by_authority_key_identifier(ca_ski) == [leaf]
+        assert index.get_by_subject_key_identifier(b"\x00" * 20) == []
+
+        assert index.find_issuers(leaf) == [ca]
+        assert index.find_issuers(ca) == [root]
+        assert index.find_issuers(_load_pkits_cert("GoodsubCACert.crt")) == [
+            ca
+        ]
+
+    def test_non_canonical_names(self, backend):
+        # This BMPString is parsed as UTF-8, so the subject is encoded
+        # differently by Name.public_bytes() than in the certificate.
+        name = x509.Name(
+            [x509.NameAttribute(NameOID.COMMON_NAME, "a", _ASN1Type.BMPString)]
+        )
+        key = ec.generate_private_key(ec.SECP256R1())
+        cert = (
+            x509.CertificateBuilder()
+            .subject_name(name)
+            .issuer_name(name)
+            .public_key(key.public_key())
+            .serial_number(1)
+            .not_valid_before(datetime.datetime(2020, 1, 1))
+            .not_valid_after(datetime.datetime(2030, 1, 1))
+            .sign(key, hashes.SHA256())
+        )
+        assert cert.subject.public_bytes() != name.public_bytes()
+
+        index = CertificateIndex([cert])
+        assert index.find_issuers(cert) == [cert]
+        assert index.get_by_subject(cert.subject) == [cert]
+        assert index.get_by_issuer(cert.issuer) == [cert]
+        assert index.get_by_issuer_and_serial_number(cert.issuer, 1) == [cert]
+        other, _ = _build_cert("other", "a", None, [])
+        index.add(other)
+        assert index.get_by_issuer(other.issuer) == [other]
+
+    def test_names_encoded_differently(self, backend):
+        # The CA's subject is a UTF8String and the leaf's issuer is a
+        # PrintableString, which are equal as Names.
+        ca, ca_key = _build_cert(
+            "CA",
+            "CA",
+            None,
+            [x509.BasicConstraints(ca=True, path_length=None)],
+        )
+        key = ec.generate_private_key(ec.SECP256R1())
+        issuer = x509.Name(
+            [
+                x509.NameAttribute(
+                    NameOID.COMMON_NAME, "CA", _ASN1Type.PrintableString
+                )
+            ]
+        )
+        leaf = (
+            x509.CertificateBuilder()
+            .subject_name(
+                x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "leaf")])
+            )
+            .issuer_name(issuer)
+            .public_key(key.public_key())
+            .serial_number(1)
+            .not_valid_before(datetime.datetime(2020, 1, 1))
+            .not_valid_after(datetime.datetime(2030, 1, 1))
+            .sign(ca_key, hashes.SHA256())
+        )
+        assert leaf.issuer == ca.subject
+        assert leaf.issuer.public_bytes() != ca.subject.public_bytes()
+
+        index = CertificateIndex([ca, leaf])
+        assert index.find_issuers(leaf) == [ca]
+        assert index.get_by_subject(leaf.issuer) == [ca]
+        assert index.get_by_issuer(ca.subject) == [ca, leaf]
+        assert index.get_by_issuer_and_serial_number(ca.subject, 1) == [leaf]
+
+    def test_invalid_arguments(self, backend):
+        index = CertificateIndex()
+        assert len(index) == 0
+        with pytest.raises(TypeError):
+            index.add(b"notacert")  # type: ignore[arg-type]
+        with pytest.raises(TypeError):
+            index.get_by_subject(b"notaname")  # type: ignore[arg-type]
+        with pytest.raises(TypeError):
+            index.get_by_subject_key_identifier(
+                "notbytes"  # type: ignore[arg-type]
+            )
+        with pytest.raises(TypeError):
+            index.find_issuers(b"notacert")  # type: ignore[arg-type]
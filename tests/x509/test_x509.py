@@ -5,6 +5,7 @@
 
 
 import binascii
+import concurrent.futures
 import copy
 import datetime
 import ipaddress
@@ -107,14 +108,12 @@ class TestCertificateRevocationList(object):
             x509.load_der_x509_crl(b"notacrl", backend)
 
     def test_invalid_time(self, backend):
-        crl = _load_cert(
-            os.path.join("x509", "custom", "crl_invalid_time.der"),
-            x509.load_der_x509_crl,
-            backend,
-        )
-
-        with pytest.raises(ValueError, match="18102813516Z"):
-            crl.last_update
+        with pytest.raises(ValueError, match="TbsCertList::this_update"):
+            _load_cert(
+                os.path.join("x509", "custom", "crl_invalid_time.der"),
+                x509.load_der_x509_crl,
+                backend,
+            )
 
     def test_unknown_signature_algorithm(self, backend):
         crl = _load_cert(
@@ -222,6 +221,100 @@ class TestCertificateRevocationList(object):
         assert revoked.serial_number == serial_number
         assert crl.get_revoked_certificate_by_serial_number(500) is None
 
+    def test_is_revoked(self, backend):
+        crl = _load_cert(
+            os.path.join("x509", "custom", "crl_all_reasons.pem"),
+            x509.load_pem_x509_crl,
+            backend,
+        )
+        serial_numbers = [r.serial_number for r in crl]
+        for serial_number in serial_numbers:
+            assert crl.is_revoked(serial_number)
+            revoked = crl.get_revoked_certificate_by_serial_number(
+                serial_number
+            )
+            assert revoked.serial_number == serial_number
+
+        assert serial_numbers == list(range(12))
+        assert not crl.is_revoked(12)
+        assert not crl.is_revoked(-1)
+        assert not crl.is_revoked(2 ** 200)
+        assert crl.bulk_is_revoked([0, 12, 11]) == [True, False, True]
+        assert crl.bulk_is_revoked([]) == []
+
+    def test_is_revoked_default(self, backend):
+        crl = _load_cert(
+            os.path.join("x509", "custom", "crl_all_reasons.pem"),
+            x509.load_pem_x509_crl,
+            backend,
+        )
+
+        def delegate(name):
+            return lambda self, *args: getattr(crl, name)(*args)
+
+        # A CRL implemented outside this package only has to provide the
+        # abstract methods.
+        wrapped_crl_class = type(
+            "WrappedCRL",
+            (x509.CertificateRevocationList,),
+            {
+                name: delegate(name)
+                for name in x509.CertificateRevocationList.__abstractmethods__
+            },
+        )
+        wrapped = wrapped_crl_class()
+        assert wrapped.is_revoked(0)
+        assert not wrapped.is_revoked(12)
+        assert wrapped.bulk_is_revoked([0, 12, 11]) == [True, False, True]
+        assert wrapped.bulk_is_revoked([]) == []
+
+    def test_is_revoked_empty_crl(self, backend):
+        crl = _load_cert(
+            os.path.join("x509", "custom", "crl_empty.pem"),
+            x509.load_pem_x509_crl,
+            backend,
+        )
+        assert not crl.is_revoked(1)
+        assert crl.get_revoked_certificate_by_serial_number(1) is None
+        assert crl.bulk_is_revoked([0, 1]) == [False, False]
+
+    def test_is_revoked_negative_serial_number(self, backend):
+        private_key = ec.generate_private_key(ec.SECP256R1())
+        revoked = (
+            x509.RevokedCertificateBuilder()
+            .serial_number(0x5A5A5A5A)
+            .revocation_date(datetime.datetime(2020, 1, 1))
+            .build()
+        )
+        der = (
+            x509.CertificateRevocationListBuilder()
+            .issuer_name(
+                x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "CA")])
+            )
+            .last_update(datetime.datetime(2020, 1, 1))
+            .next_update(datetime.datetime(2030, 1, 1))
+            .add_revoked_certificate(revoked)
+            .sign(private_key, hashes.SHA256())
+            .public_bytes(serialization.Encoding.DER)
+        )
+        # Make the entry's serial number negative. The signature no longer
+        # matches, but it isn't checked by loading.
+        assert der.count(b"\x02\x04\x5a\x5a\x5a\x5a") == 1
+        crl = x509.load_der_x509_crl(
+            der.replace(
+                b"\x02\x04\x5a\x5a\x5a\x5a", b"\x02\x04\xa5\xa5\xa5\xa5"
+            ),
+            backend,
+        )
+        (entry,) = crl
+        # Negative serial numbers are not allowed by RFC 5280, so they are
+        # rejected when the entry is read or the CRL is searched.
+        with pytest.raises(ValueError):
+            entry.serial_number
+        with pytest.raises(ValueError):
+            crl.is_revoked(1)
+        assert not crl.is_revoked(-0x5A5A5A5B)
+
     def test_revoked_cert_retrieval_retain_only_revoked(self, backend):
         """
         This test attempts to trigger the crash condition described in
@@ -561,7 +654,7 @@ class TestRevokedCertificate(object):
         )
 
         with pytest.raises(ValueError):
-            crl[0].extensions
+            crl[0].extensions.get_extension_for_class(x509.CRLReason)
 
     def test_invalid_cert_issuer_ext(self, backend):
         crl = _load_cert(
@@ -573,7 +666,7 @@ class TestRevokedCertificate(object):
         )
 
         with pytest.raises(ValueError):
-            crl[0].extensions
+            crl[0].extensions.get_extension_for_class(x509.CertificateIssuer)
 
     def test_indexing(self, backend):
         crl = _load_cert(
@@ -644,6 +737,135 @@ class TestRSACertificate(object):
             cert.signature_algorithm_oid == SignatureAlgorithmOID.RSA_WITH_SHA1
         )
 
+    def test_fingerprint_repeated(self, backend):
+        der = load_vectors_from_file(
+            os.path.join("x509", "PKITS_data", "certs", "GoodCACert.crt"),
+            lambda derfile: derfile.read(),
+            mode="rb",
+        )
+        cert = x509.load_der_x509_certificate(der, backend)
+        assert cert.public_bytes(serialization.Encoding.DER) == der
+        for algorithm in [hashes.SHA1(), hashes.SHA256(), hashes.SHA1()]:
+            h = hashes.Hash(algorithm, backend)
+            h.update(der)
+            assert cert.fingerprint(algorithm) == h.finalize()
+
+        with pytest.raises(TypeError):
+            cert.fingerprint("sha1")  # type: ignore[arg-type]
+
+    def test_fingerprint_concurrent(self, backend):
+        der = load_vectors_from_file(
+            os.path.join("x509", "PKITS_data", "certs", "GoodCACert.crt"),
+            lambda derfile: derfile.read(),
+            mode="rb",
+        )
+        cert = x509.load_der_x509_certificate(der, backend)
+        algorithms = [hashes.SHA1(), hashes.SHA256()] * 8
+        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as pool:
+            fingerprints = list(pool.map(cert.fingerprint, algorithms))
+
+        for algorithm, fingerprint in zip(algorithms, fingerprints):
+            h = hashes.Hash(algorithm, backend)
+            h.update(der)
+            assert fingerprint == h.finalize()
+
+    def test_public_key_cached(self, backend):
+        cert = _load_cert(
+            os.path.join("x509", "PKITS_data", "certs", "GoodCACert.crt"),
+            x509.load_der_x509_certificate,
+            backend,
+        )
+        public_key = cert.public_key()
+        assert isinstance(public_key, rsa.RSAPublicKey)
+        assert cert.public_key() is public_key
+
+    def test_public_key_concurrent(self, backend):
+        cert = _load_cert(
+            os.path.join("x509", "PKITS_data", "certs", "GoodCACert.crt"),
+            x509.load_der_x509_certificate,
+            backend,
+        )
+        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as pool:
+            keys = list(pool.map(lambda _: cert.public_key(), range(16)))
+
+        assert all(key is keys[0] for key in keys)
+
+    def test_load_pem_certs(self, backend):
+        pems = [
+            load_vectors_from_file(
+                os.path.join("x509", path),
+                lambda pemfile: pemfile.read(),
+                mode="rb",
+            )
+            for path in [
+                os.path.join("custom", "post2000utctime.pem"),
+                "cryptography.io.pem",
+                "rapidssl_sha256_ca_g3.pem",
+            ]
+        ]
+        certs = x509.load_pem_x509_certificates(b"\n".join(pems))
+        assert certs == [x509.load_pem_x509_certificate(pem) for pem in pems]
+
+    @pytest.mark.parametrize(
+        ("old", "new"),
+        [
+            # Invalid base64 in the body.
+            (b"\nMII", b"\nM!I"),
+            # Mismatched BEGIN and END labels.
+            (b"-----END CERTIFICATE-----", b"-----END CERT-----"),
+            # No END line at all.
+            (b"-----END CERTIFICATE-----", b""),
+        ],
+    )
+    def test_load_pem_certs_malformed_block(self, backend, old, new):
+        pems = [
+            load_vectors_from_file(
+                os.path.join("x509", path),
+                lambda pemfile: pemfile.read(),
+                mode="rb",
+            )
+            for path in [
+                os.path.join("custom", "post2000utctime.pem"),
+                "cryptography.io.pem",
+                "rapidssl_sha256_ca_g3.pem",
+            ]
+        ]
+        assert old in pems[1]
+        pems[1] = pems[1].replace(old, new)
+        with pytest.raises(ValueError, match="PEM block 2 "):
+            x509.load_pem_x509_certificates(b"\n".join(pems))
+
+    def test_load_pem_certs_non_certificate(self, backend):
+        cert = load_vectors_from_file(
+            os.path.join("x509", "cryptography.io.pem"),
+            lambda pemfile: pemfile.read(),
+            mode="rb",
+        )
+        key = load_vectors_from_file(
+            os.path.join("asymmetric", "PKCS8", "ec_private_key.pem"),
+            lambda pemfile: pemfile.read(),
+            mode="rb",
+        )
+        with pytest.raises(ValueError):
+            x509.load_pem_x509_certificates(cert + key)
+
+        certs = x509.load_pem_x509_certificates(
+            key + cert + key, skip_non_certificates=True
+        )
+        assert certs == [x509.load_pem_x509_certificate(cert)]
+
+    def test_load_pem_certs_empty(self, backend):
+        with pytest.raises(ValueError):
+            x509.load_pem_x509_certificates(b"")
+
+        key = load_vectors_from_file(
+            os.path.join("asymmetric", "PKCS8", "ec_private_key.pem"),
+            lambda pemfile: pemfile.read(),
+            mode="rb",
+        )
+        with pytest.raises(ValueError):
+            x509.load_pem_x509_certificates(key, skip_non_certificates=True)
+
     def test_negative_serial_number(self, backend):
         with pytest.raises(ValueError, match="TbsCertificate::serial"):
             _load_cert(
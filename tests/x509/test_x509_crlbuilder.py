@@ -4,12 +4,14 @@
 
 
 import datetime
+import io
 
 import pytest
 
 import pytz
 
 from cryptography import x509
+from cryptography.exceptions import _Reasons
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.asymmetric import ec, ed25519, ed448
 from cryptography.x509.oid import (
@@ -22,6 +24,7 @@ from ..hazmat.primitives.fixtures_dsa import DSA_KEY_2048
 from ..hazmat.primitives.fixtures_ec import EC_KEY_SECP256R1
 from ..hazmat.primitives.fixtures_rsa import RSA_KEY_2048, RSA_KEY_512
 from ..hazmat.primitives.test_ec import _skip_curve_unsupported
+from ..utils import raises_unsupported_algorithm
 
 
 class TestCertificateRevocationListBuilder(object):
@@ -780,3 +783,338 @@ class TestCertificateRevocationListBuilder(object):
         ext = crl[1].extensions.get_extension_for_class(x509.InvalidityDate)
         assert ext.critical is False
         assert ext.value == invalidity_date
+
+    @pytest.mark.parametrize(
+        ("private_key", "algorithm"),
+        [
+            (RSA_KEY_2048, hashes.SHA256()),
+            (EC_KEY_SECP256R1, hashes.SHA256()),
+            (DSA_KEY_2048, hashes.SHA256()),
+        ],
+    )
+    def test_sign_to_file(self, private_key, algorithm, backend):
+        private_key = private_key.private_key(backend)
+        last_update = datetime.datetime(2002, 1, 1, 12, 1)
+        next_update = datetime.datetime(2030, 1, 1, 12, 1)
+        crl_number = x509.CRLNumber(7)
+        revoked_cert0 = (
+            x509.RevokedCertificateBuilder()
+            .serial_number(38)
+            .revocation_date(datetime.datetime(2011, 1, 1, 1, 1))
+            .build(backend)
+        )
+        builder = (
+            x509.CertificateRevocationListBuilder()
+            .issuer_name(
+                x509.Name(
+                    [
+                        x509.NameAttribute(
+                            NameOID.COMMON_NAME, "cryptography.io CA"
+                        )
+                    ]
+                )
+            )
+            .last_update(last_update)
+            .next_update(next_update)
+            .add_extension(crl_number, False)
+            .add_revoked_certificate(revoked_cert0)
+        )
+        revoked = (
+            (
+                serial_number,
+                datetime.datetime(2012, 1, 1, 1, 1),
+                x509.ReasonFlags.key_compromise if serial_number % 2 else None,
+            )
+            for serial_number in range(1, 1001)
+        )
+
+        f = io.BytesIO()
+        builder.sign_to_file(f, private_key, algorithm, revoked)
+        crl = x509.load_der_x509_crl(f.getvalue())
+        assert crl.is_signature_valid(private_key.public_key())
+        assert isinstance(crl.signature_hash_algorithm, hashes.SHA256)
+        assert crl.last_update == last_update
+        assert crl.next_update == next_update
+        assert (
+            crl.extensions.get_extension_for_class(x509.CRLNumber).value
+            == crl_number
+        )
+        assert len(crl) == 1001
+        assert crl[0].serial_number == 38
+        assert crl[1].serial_number == 1
+        assert crl[1].revocation_date == datetime.datetime(2012, 1, 1, 1, 1)
+        assert crl[1].extensions.get_extension_for_class(
+            x509.CRLReason
+        ).value == x509.CRLReason(x509.ReasonFlags.key_compromise)
+        assert len(crl[2].extensions) == 0
+        assert crl[-1].serial_number == 1000
+
+    @pytest.mark.supported(
+        only_if=lambda backend: backend.ed25519_supported(),
+        skip_message="Requires OpenSSL with Ed25519 support",
+    )
+    def test_sign_to_file_ed25519(self, backend):
+        private_key = ed25519.Ed25519PrivateKey.generate()
+        builder = (
+            x509.CertificateRevocationListBuilder()
+            .issuer_name(
+                x509.Name(
+                    [
+                        x509.NameAttribute(
+                            NameOID.COMMON_NAME, "cryptography.io CA"
+                        )
+                    ]
+                )
+            )
+            .last_update(datetime.datetime(2002, 1, 1, 12, 1))
+            .next_update(datetime.datetime(2030, 1, 1, 12, 1))
+        )
+
+        # EdDSA can't sign a digest, so these keys are rejected rather than
+        # reading the whole TBSCertList into memory.
+        f = io.BytesIO()
+        with pytest.raises(TypeError):
+            builder.sign_to_file(f, private_key, None, [])
+        assert f.getvalue() == b""
+
+        base_crl = builder.sign(private_key, None)
+        with pytest.raises(TypeError):
+            builder.sign_incremental(base_crl, private_key, None)
+
+    def test_sign_to_file_unsupported_hash(self, backend):
+        private_key = EC_KEY_SECP256R1.private_key(backend)
+        builder = (
+            x509.CertificateRevocationListBuilder()
+            .issuer_name(
+                x509.Name(
+                    [
+                        x509.NameAttribute(
+                            NameOID.COMMON_NAME, "cryptography.io CA"
+                        )
+                    ]
+                )
+            )
+            .last_update(datetime.datetime(2002, 1, 1, 12, 1))
+            .next_update(datetime.datetime(2030, 1, 1, 12, 1))
+        )
+
+        with raises_unsupported_algorithm(_Reasons.UNSUPPORTED_HASH):
+            builder.sign_to_file(
+                io.BytesIO(), private_key, hashes.SHA3_256(), []
+            )
+
+    @pytest.mark.parametrize(
+        ("entry", "exception"),
+        [
+            (("5", datetime.datetime(2012, 1, 1), None), TypeError),
+            ((0, datetime.datetime(2012, 1, 1), None), ValueError),
+            ((2 ** 159, datetime.datetime(2012, 1, 1), None), ValueError),
+            ((5, "2012", None), TypeError),
+            ((5, datetime.datetime(1949, 1, 1), None), ValueError),
+            ((5, datetime.datetime(2012, 1, 1), "unspecified"), TypeError),
+        ],
+    )
+    def test_sign_to_file_invalid_entry(self, entry, exception, backend):
+        private_key = EC_KEY_SECP256R1.private_key(backend)
+        builder = (
+            x509.CertificateRevocationListBuilder()
+            .issuer_name(
+                x509.Name(
+                    [
+                        x509.NameAttribute(
+                            NameOID.COMMON_NAME, "cryptography.io CA"
+                        )
+                    ]
+                )
+            )
+            .last_update(datetime.datetime(2002, 1, 1, 12, 1))
+            .next_update(datetime.datetime(2030, 1, 1, 12, 1))
+        )
+
+        with pytest.raises(exception):
+            builder.sign_to_file(
+                io.BytesIO(), private_key, hashes.SHA256(), [entry]
+            )
+
+    def test_sign_to_file_no_issuer(self, backend):
+        private_key = EC_KEY_SECP256R1.private_key(backend)
+        builder = (
+            x509.CertificateRevocationListBuilder()
+            .last_update(datetime.datetime(2002, 1, 1, 12, 1))
+            .next_update(datetime.datetime(2030, 1, 1, 12, 1))
+        )
+
+        with pytest.raises(ValueError):
+            builder.sign_to_file(
+                io.BytesIO(), private_key, hashes.SHA256(), []
+            )
+
+    def _build_base_crl(self, private_key, revoked, crl_number=5):
+        builder = (
+            x509.CertificateRevocationListBuilder()
+            .issuer_name(
+                x509.Name(
+                    [
+                        x509.NameAttribute(
+                            NameOID.COMMON_NAME, "cryptography.io CA"
+                        )
+                    ]
+                )
+            )
+            .last_update(datetime.datetime(2002, 1, 1, 12, 1))
+            .next_update(datetime.datetime(2030, 1, 1, 12, 1))
+        )
+        if crl_number is not None:
+            builder = builder.add_extension(
+                x509.CRLNumber(crl_number), critical=False
+            )
+        for serial_number, reason in revoked:
+            revoked_builder = x509.RevokedCertificateBuilder(
+                serial_number, datetime.datetime(2012, 1, 1, 1, 1)
+            )
+            if reason is not None:
+                revoked_builder = revoked_builder.add_extension(
+                    x509.CRLReason(reason), critical=False
+                )
+            builder = builder.add_revoked_certificate(revoked_builder.build())
+
+        return builder.sign(private_key, hashes.SHA256())
+
+    def test_delta_crl(self, backend):
+        private_key = EC_KEY_SECP256R1.private_key(backend)
+        base_crl = self._build_base_crl(
+            private_key,
+            [
+                (1, x509.ReasonFlags.key_compromise),
+                (2, x509.ReasonFlags.certificate_hold),
+                (3, None),
+            ],
+        )
+        revoked_cert = x509.RevokedCertificateBuilder(
+            10, datetime.datetime(2020, 1, 1)
+        ).build()
+        crl = (
+            x509.CertificateRevocationListBuilder()
+            .delta_crl(base_crl, [2])
+            .last_update(datetime.datetime(2020, 1, 1))
+            .next_update(datetime.datetime(2020, 1, 2))
+            .add_extension(x509.CRLNumber(6), critical=False)
+            .add_revoked_certificate(revoked_cert)
+            .sign(private_key, hashes.SHA256())
+        )
+
+        assert crl.issuer == base_crl.issuer
+        ext = crl.extensions.get_extension_for_class(x509.DeltaCRLIndicator)
+        assert ext.critical is True
+        assert ext.value == x509.DeltaCRLIndicator(5)
+        assert [revoked.serial_number for revoked in crl] == [2, 10]
+        assert crl[0].revocation_date == datetime.datetime(2012, 1, 1, 1, 1)
+        assert crl[0].extensions.get_extension_for_class(
+            x509.CRLReason
+        ).value == x509.CRLReason(x509.ReasonFlags.remove_from_crl)
+
+    def test_delta_crl_invalid(self, backend):
+        private_key = EC_KEY_SECP256R1.private_key(backend)
+        base_crl = self._build_base_crl(private_key, [(1, None)])
+        builder = x509.CertificateRevocationListBuilder()
+
+        with pytest.raises(TypeError):
+            builder.delta_crl(object())  # type: ignore[arg-type]
+        with pytest.raises(ValueError):
+            builder.delta_crl(
+                self._build_base_crl(private_key, [], crl_number=None)
+            )
+        with pytest.raises(ValueError):
+            builder.delta_crl(base_crl, [2])
+        with pytest.raises(ValueError):
+            builder.issuer_name(
+                x509.Name([x509.NameAttribute(NameOID.COUNTRY_NAME, "US")])
+            ).delta_crl(base_crl)
+        with pytest.raises(ValueError):
+            builder.add_extension(
+                x509.DeltaCRLIndicator(1), critical=True
+            ).delta_crl(base_crl)
+
+    @pytest.mark.parametrize(
+        ("revoked", "algorithm"),
+        [
+            ([], hashes.SHA256()),
+            (
+                [
+                    (1, x509.ReasonFlags.key_compromise),
+                    (2, None),
+                    (3, x509.ReasonFlags.certificate_hold),
+                ],
+                hashes.SHA256(),
+            ),
+            ([(1, None)], hashes.SHA512()),
+        ],
+    )
+    def test_sign_incremental(self, revoked, algorithm, backend):
+        private_key = EC_KEY_SECP256R1.private_key(backend)
+        base_crl = self._build_base_crl(private_key, revoked)
+        revoked_cert = (
+            x509.RevokedCertificateBuilder(10, datetime.datetime(2020, 1, 1))
+            .add_extension(
+                x509.CRLReason(x509.ReasonFlags.superseded), critical=False
+            )
+            .build()
+        )
+        crl = (
+            x509.CertificateRevocationListBuilder()
+            .last_update(datetime.datetime(2020, 1, 1))
+            .next_update(datetime.datetime(2020, 1, 2))
+            .add_extension(x509.CRLNumber(6), critical=False)
+            .add_revoked_certificate(revoked_cert)
+            .sign_incremental(base_crl, private_key, algorithm)
+        )
+
+        assert crl.is_signature_valid(private_key.public_key())
+        assert crl.issuer == base_crl.issuer
+        assert crl.last_update == datetime.datetime(2020, 1, 1)
+        assert crl.next_update == datetime.datetime(2020, 1, 2)
+        assert crl.extensions.get_extension_for_class(
+            x509.CRLNumber
+        ).value == x509.CRLNumber(6)
+        assert len(crl) == len(revoked) + 1
+        for base_revoked, revoked_cert in zip(base_crl, crl):
+            assert revoked_cert.serial_number == base_revoked.serial_number
+            assert list(revoked_cert.extensions) == list(
+                base_revoked.extensions
+            )
+        assert crl[-1].serial_number == 10
+        assert crl[-1].extensions.get_extension_for_class(
+            x509.CRLReason
+        ).value == x509.CRLReason(x509.ReasonFlags.superseded)
+
+    def test_sign_incremental_invalid(self, backend):
+        private_key = EC_KEY_SECP256R1.private_key(backend)
+        base_crl = self._build_base_crl(private_key, [(1, None)])
+        builder = x509.CertificateRevocationListBuilder().last_update(
+            datetime.datetime(2020, 1, 1)
+        )
+
+        with pytest.raises(TypeError):
+            builder.next_update(
+                datetime.datetime(2020, 1, 2)
+            ).sign_incremental(
+                object(),  # type: ignore[arg-type]
+                private_key,
+                hashes.SHA256(),
+            )
+        with pytest.raises(ValueError):
+            builder.sign_incremental(base_crl, private_key, hashes.SHA256())
+        with pytest.raises(ValueError):
+            builder.next_update(datetime.datetime(2020, 1, 2)).issuer_name(
+                x509.Name([x509.NameAttribute(NameOID.COUNTRY_NAME, "US")])
+            ).sign_incremental(base_crl, private_key, hashes.SHA256())
+        with pytest.raises(ValueError):
+            builder.next_update(
+                datetime.datetime(2020, 1, 2)
+            ).add_revoked_certificate(
+                x509.RevokedCertificateBuilder(
+                    1, datetime.datetime(2020, 1, 1)
+                ).build()
+            ).sign_incremental(
+                base_crl, private_key, hashes.SHA256()
+            )
@@ -1361,6 +1361,41 @@ class TestExtensions(object):
         with pytest.raises(TypeError):
             exts.get_extension_for_class(x509.UnrecognizedExtension)
 
+    def test_decoded_on_access(self, backend):
+        cert = _load_cert(
+            os.path.join("x509", "custom", "cp_invalid.pem"),
+            x509.load_pem_x509_certificate,
+            backend,
+        )
+        exts = cert.extensions
+        assert len(exts) == 1
+        with pytest.raises(x509.ExtensionNotFound):
+            exts.get_extension_for_class(x509.BasicConstraints)
+        with pytest.raises(ValueError):
+            exts[0]
+
+    def test_lookups(self):
+        bc = x509.Extension(
+            ExtensionOID.BASIC_CONSTRAINTS,
+            False,
+            x509.BasicConstraints(ca=False, path_length=None),
+        )
+        unrecognized = x509.Extension(
+            ExtensionOID.KEY_USAGE,
+            False,
+            x509.UnrecognizedExtension(ExtensionOID.KEY_USAGE, b"\x00"),
+        )
+        exts = x509.Extensions([bc, unrecognized, bc])
+        assert exts.get_extension_for_oid(ExtensionOID.BASIC_CONSTRAINTS) is bc
+        assert exts.get_extension_for_class(x509.BasicConstraints) is bc
+        assert (
+            exts.get_extension_for_oid(ExtensionOID.KEY_USAGE) is unrecognized
+        )
+        with pytest.raises(x509.ExtensionNotFound):
+            exts.get_extension_for_class(x509.KeyUsage)
+        with pytest.raises(x509.ExtensionNotFound):
+            exts.get_extension_for_oid("2.5.29.19")  # type: ignore[arg-type]
+
     def test_indexing(self, backend):
         cert = _load_cert(
             os.path.join("x509", "cryptography.io.pem"),
@@ -2297,7 +2332,9 @@ class TestRSASubjectAlternativeNameExtension(object):
             backend,
         )
         with pytest.raises(x509.UnsupportedGeneralNameType):
-            cert.extensions
+            cert.extensions.get_extension_for_class(
+                x509.SubjectAlternativeName
+            )
 
     def test_registered_id(self, backend):
         cert = _load_cert(
@@ -5580,7 +5617,9 @@ class TestPrecertificateSignedCertificateTimestampsExtension(object):
             backend,
         )
         with pytest.raises(ValueError):
-            cert.extensions
+            cert.extensions.get_extension_for_class(
+                x509.PrecertificateSignedCertificateTimestamps
+            )
 
     def test_invalid_length(self, backend):
         cert = _load_cert(
@@ -5589,7 +5628,9 @@ class TestPrecertificateSignedCertificateTimestampsExtension(object):
             backend,
         )
         with pytest.raises(ValueError):
-            cert.extensions
+            cert.extensions.get_extension_for_class(
+                x509.PrecertificateSignedCertificateTimestamps
+            )
 
 
 class TestInvalidExtension(object):
@@ -5601,7 +5642,7 @@ class TestInvalidExtension(object):
             backend,
         )
         with pytest.raises(ValueError):
-            cert.extensions
+            cert.extensions.get_extension_for_class(x509.CertificatePolicies)
 
         # CPSURI OID but UserNotice structure
         cert = _load_cert(
@@ -5610,7 +5651,7 @@ class TestInvalidExtension(object):
             backend,
         )
         with pytest.raises(ValueError):
-            cert.extensions
+            cert.extensions.get_extension_for_class(x509.CertificatePolicies)
 
 
 class TestOCSPNonce(object):